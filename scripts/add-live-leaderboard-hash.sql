@@ -0,0 +1,12 @@
+-- Live Leaderboard change detection.
+-- Run this in the Supabase SQL Editor. Idempotent. Safe to run after
+-- create-live-leaderboard.sql.
+--
+-- scripts/update_leaderboard.py stores a stable hash of the parsed snapshot
+-- (players, cut line, statuses) alongside it, and skips the upsert when a new
+-- fetch hashes the same. An unchanged end-of-round run then costs no JSONB
+-- rewrite and no realtime fan-out to every connected browser. Until this
+-- column exists the updater simply writes every run, as before.
+ALTER TABLE live_leaderboard ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+NOTIFY pgrst, 'reload schema';
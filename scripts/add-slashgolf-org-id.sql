@@ -0,0 +1,12 @@
+-- Slash Golf multi-tour support: which tour (orgId) a tournament belongs to.
+--
+-- Run in the Supabase SQL editor. Idempotent.
+--
+-- scripts/sync_schedule.py matches DB tournaments against every tour in
+-- ORG_IDS (1 = PGA Tour, 2 = Korn Ferry, ...) and records the tour of the
+-- matching event here next to slashgolf_tourn_id, so the field, live and
+-- results jobs fetch each event from the right tour. NULL means the default
+-- tour (ORG_ID, normally the PGA Tour), so existing rows need no backfill.
+ALTER TABLE tournaments ADD COLUMN IF NOT EXISTS slashgolf_org_id TEXT;
+
+NOTIFY pgrst, 'reload schema';
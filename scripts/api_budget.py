@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Cross-job Slash Golf API budget ledger.
+
+The RapidAPI quota is shared by four independent cron jobs (schedule sync,
+field sync, live leaderboard, Monday scorer), and a 429 only tells us after
+the fact that it's gone. This ledger records every real network call in the
+``api_usage`` table (create-api-usage.sql) and meters new calls against it
+before they go out, like a token bucket that refills once per quota window:
+
+  * ``scoring``  (update_results) may spend the bucket down to zero.
+  * ``live``     (update_leaderboard) must leave SCORING_RESERVE tokens.
+  * ``low``      (sync_field, sync_schedule) must also leave LOW_PRIORITY_MARGIN
+                 on top, so it yields to extra live refreshes as well.
+
+A refused call raises ``slashgolf.BudgetDeferred``; the low/live jobs treat
+that as "try on the next cron". Each job installs a Budget from its CLI entry
+point (``slashgolf.set_budget``), so importing the job modules in tests stays
+unmetered.
+
+The ledger is advisory and fails open: if the table is missing (migration not
+run) calls go through unmetered, exactly as before, and the 429 is still the
+hard stop.
+
+Usage:
+    python api_budget.py     # current spend, remaining, and a forecast
+"""
+
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+
+import slashgolf
+
+QUOTA = int(os.getenv("SLASHGOLF_QUOTA", "20"))
+# "day" or "month" — the RapidAPI plan's reset period. Windows start at UTC
+# midnight / the 1st.
+QUOTA_WINDOW = os.getenv("SLASHGOLF_QUOTA_WINDOW", "day")
+# Calls a Monday scoring run can need: /leaderboard + /earnings, plus a
+# /schedule fallback when the tournament has no stored slashgolf_tourn_id.
+SCORING_RESERVE = int(os.getenv("SLASHGOLF_SCORING_RESERVE", "3"))
+LOW_PRIORITY_MARGIN = int(os.getenv("SLASHGOLF_LOW_PRIORITY_MARGIN", "2"))
+# How much history the forecast averages over.
+FORECAST_LOOKBACK_DAYS = 28
+
+PRIORITIES = ("scoring", "live", "low")
+
+
+def window_start(now, window=QUOTA_WINDOW):
+    """Start of the quota window containing ``now`` (aware UTC)."""
+    start = now.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    if window == "month":
+        start = start.replace(day=1)
+    return start
+
+
+def _window_end(start, window=QUOTA_WINDOW):
+    if window == "month":
+        return (start + timedelta(days=32)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+class Budget:
+    """Token-bucket view of the shared quota for one job run.
+
+    Spend in the current window is read from the ledger once, on the first
+    metered call, and tracked locally after that (a run makes a handful of
+    calls; re-querying for each would cost more than it protects).
+
+    Calls may arrive from several fetch threads at once, so acquire() doesn't
+    just check the bucket: under the lock it also takes the tokens, and
+    record() later settles that reservation against the attempts the call
+    really made (more for retries, none for a call that never went out).
+    Two threads can therefore never both take the last token.
+    """
+
+    def __init__(self, job, priority, client=None, quota=QUOTA,
+                 reserve=SCORING_RESERVE, window=QUOTA_WINDOW):
+        if priority not in PRIORITIES:
+            raise ValueError(f"priority must be one of {PRIORITIES}, not {priority!r}")
+        self.job = job
+        self.priority = priority
+        self.quota = quota
+        self.reserve = reserve
+        self.window = window
+        self._client = client
+        self._spent = None
+        self._held = {}  # path -> costs reserved by acquire(), not yet recorded
+        self._available = True
+        self._lock = threading.RLock()
+
+    def _supabase(self):
+        if self._client is None:
+            from golf_common import get_supabase_client
+            self._client = get_supabase_client()
+        return self._client
+
+    def floor(self):
+        """Tokens this job must leave in the bucket."""
+        if self.priority == "scoring":
+            return 0
+        if self.priority == "live":
+            return self.reserve
+        return self.reserve + LOW_PRIORITY_MARGIN
+
+    def spent(self, now=None):
+        """Calls recorded in the current window (all jobs)."""
+        with self._lock:
+            return self._load_spent(now)
+
+    def _load_spent(self, now):
+        if self._spent is None:
+            start = window_start(now or datetime.now(timezone.utc), self.window)
+            try:
+                from golf_common import paginate
+                client = self._supabase()
+                rows = paginate(
+                    lambda: client.table("api_usage").select("calls").gte("called_at", start.isoformat())
+                )
+                self._spent = sum(int(r.get("calls") or 0) for r in rows)
+            except Exception as exc:
+                print(f"  (API budget ledger unavailable, calls unmetered: {exc})")
+                self._available = False
+                self._spent = 0
+        return self._spent
+
+    def remaining(self):
+        return self.quota - self.spent()
+
+    def acquire(self, path, cost=1):
+        """Reserve ``cost`` calls for ``path``, or raise BudgetDeferred unless
+        they fit above this job's floor."""
+        with self._lock:
+            remaining = self.remaining()
+            if self._available and remaining - cost < self.floor():
+                raise slashgolf.BudgetDeferred(
+                    f"{self.job} ({self.priority}) deferred GET {path}: {remaining}/{self.quota} "
+                    f"calls left this {self.window}, {self.floor()} held back for higher-priority jobs."
+                )
+            self._spent += cost
+            self._held.setdefault(path, []).append(cost)
+
+    def record(self, path, calls):
+        """Settle one reservation for ``path`` against the ``calls`` real HTTP
+        attempts it made (0 refunds it) and debit them to the ledger."""
+        with self._lock:
+            self.spent()
+            held = self._held.get(path)
+            self._spent += calls - (held.pop() if held else 0)
+            if not self._available or not calls:
+                return
+        try:
+            self._supabase().table("api_usage").insert(
+                {"job": self.job, "endpoint": path, "calls": calls}
+            ).execute()
+        except Exception as exc:
+            print(f"  (API budget ledger write skipped: {exc})")
+
+
+def forecast(client, now=None, quota=QUOTA, reserve=SCORING_RESERVE, window=QUOTA_WINDOW):
+    """Spend so far this window plus a projection from recent history.
+
+    For a daily window the projection is the average total for this weekday
+    over the lookback (Mondays carry the scoring run and two live refreshes;
+    Wednesdays the schedule and field syncs). For a monthly window it is the
+    spend so far plus the recent daily average for each remaining day.
+    ``headroom`` is what's left for extra live refreshes once the projection
+    and the scoring reserve are covered.
+    """
+    now = now or datetime.now(timezone.utc)
+    start = window_start(now, window)
+    since = min(start, window_start(now, "day") - timedelta(days=FORECAST_LOOKBACK_DAYS))
+    from golf_common import paginate
+    rows = paginate(
+        lambda: client.table("api_usage").select("called_at, job, calls").gte("called_at", since.isoformat())
+    )
+
+    spent = 0
+    by_job = {}
+    history_by_day = {}
+    for r in rows:
+        at = datetime.fromisoformat(str(r["called_at"]).replace("Z", "+00:00"))
+        calls = int(r.get("calls") or 0)
+        if at >= start:
+            spent += calls
+            by_job[r.get("job")] = by_job.get(r.get("job"), 0) + calls
+        day = at.astimezone(timezone.utc).date()
+        if day < now.date():
+            history_by_day[day] = history_by_day.get(day, 0) + calls
+
+    past_days = [now.date() - timedelta(days=n) for n in range(1, FORECAST_LOOKBACK_DAYS + 1)]
+    if window == "month":
+        daily_avg = sum(history_by_day.get(d, 0) for d in past_days) / len(past_days)
+        days_left = (_window_end(start, window).date() - now.date()).days
+        projected = spent + daily_avg * max(days_left - 1, 0)
+    else:
+        same_weekday = [history_by_day.get(d, 0) for d in past_days if d.weekday() == now.weekday()]
+        projected = max(spent, sum(same_weekday) / len(same_weekday)) if same_weekday else spent
+
+    return {
+        "window": window,
+        "window_start": start.isoformat(),
+        "quota": quota,
+        "spent": spent,
+        "remaining": quota - spent,
+        "by_job": by_job,
+        "projected": projected,
+        "scoring_reserve": reserve,
+        "headroom": quota - reserve - projected,
+    }
+
+
+if __name__ == "__main__":
+    from golf_common import get_supabase_client
+
+    f = forecast(get_supabase_client())
+    print("=" * 50)
+    print(f"Slash Golf API budget ({f['window']}ly quota, window from {f['window_start']})")
+    print("=" * 50)
+    print(f"  Spent:      {f['spent']}/{f['quota']}  ({f['remaining']} remaining)")
+    for job, calls in sorted(f["by_job"].items()):
+        print(f"      {job:<20} {calls}")
+    print(f"  Projected:  {f['projected']:.1f} by end of {f['window']}")
+    print(f"  Reserve:    {f['scoring_reserve']} held for update_results")
+    print(f"  Headroom:   {f['headroom']:.1f} extra call(s) available for live refreshes")
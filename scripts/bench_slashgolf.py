@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the Slash Golf payload hot paths.
+
+Not part of any job — a quick way to check that a change to the decode/parse
+path is actually faster before shipping it. Uses recorded /leaderboard
+responses from the cassette directory when there are any (record some with
+SLASHGOLF_CASSETTE=record), else a synthesized full-field payload.
+
+Usage:
+    python bench_slashgolf.py            # default repetition count
+    python bench_slashgolf.py -n 500     # more repetitions
+"""
+
+import glob
+import gzip
+import json
+import os
+import re
+import sys
+import timeit
+import tracemalloc
+import unicodedata
+
+import leaderboard_stream
+import slashgolf
+
+
+# ---------------------------------------------------------------------------
+# Payloads
+# ---------------------------------------------------------------------------
+def _synthetic_leaderboard(rows=156):
+    """A full-field, wrapper-heavy /leaderboard body shaped like the real one."""
+    lb_rows = []
+    for i in range(rows):
+        made_cut = i < 70
+        lb_rows.append({
+            "firstName": f"Player{i}",
+            "lastName": f"Golfer-Ståhl{i}",
+            "playerId": str(30000 + i),
+            "position": str(i + 1) if made_cut else "CUT",
+            "total": f"{i // 10 - 12:+d}" if i // 10 != 12 else "E",
+            "status": "complete" if made_cut else "cut",
+            "thru": "F",
+            "currentRound": {"$numberInt": "4" if made_cut else "2"},
+            "rounds": [
+                {"roundId": {"$numberInt": str(r)}, "strokes": {"$numberInt": str(68 + (i + r) % 6)},
+                 "scoreToPar": f"{(i + r) % 6 - 3:+d}", "courseId": "500"}
+                for r in range(1, 5 if made_cut else 3)
+            ],
+            "teeTime": "11:40am",
+            "startingHole": {"$numberInt": "1"},
+            "isAmateur": False,
+        })
+    payload = {
+        "orgId": "1", "year": "2026", "tournId": "014",
+        "status": "Official", "roundStatus": "Official",
+        "roundId": {"$numberInt": "4"},
+        "lastUpdated": {"$date": {"$numberLong": "1768694400000"}},
+        "cutLines": [{"cutCount": {"$numberInt": "70"}, "cutScore": "-2"}],
+        "leaderboardRows": lb_rows,
+    }
+    return json.dumps(payload).encode("utf-8")
+
+
+def load_payloads():
+    """``[(label, body_bytes)]`` — recorded leaderboards, else one synthetic."""
+    found = []
+    for path in sorted(glob.glob(os.path.join(slashgolf.CASSETTE_DIR, "leaderboard__*.json.gz"))):
+        with gzip.open(path, "rb") as fh:
+            found.append((os.path.basename(path), fh.read()))
+    return found or [("synthetic (156 rows)", _synthetic_leaderboard())]
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+def _report(label, seconds, number, baseline=None):
+    per_call_us = seconds / number * 1e6
+    speedup = f"  x{baseline / seconds:.2f}" if baseline else ""
+    print(f"    {label:<38} {per_call_us:>10.1f} us/call{speedup}")
+
+
+def bench_decode(body, number):
+    """stdlib json.loads vs orjson, decode alone and decode + parse."""
+    backends = [("stdlib", False)]
+    if slashgolf.orjson is not None:
+        backends.append(("orjson", True))
+    else:
+        print("    (orjson not installed; fast backend skipped)")
+
+    base = None
+    for name, fast in backends:
+        t = timeit.timeit(lambda: slashgolf.decode_payload(body, fast=fast), number=number)
+        base = base or t
+        _report(f"decode ({name})", t, number, base)
+    base = None
+    for name, fast in backends:
+        t = timeit.timeit(
+            lambda: slashgolf.parse_leaderboard(slashgolf.decode_payload(body, fast=fast)), number=number
+        )
+        base = base or t
+        _report(f"decode ({name}) + parse_leaderboard", t, number, base)
+
+
+def bench_ingest(body, number):
+    """An Official-event ingest needs both the live and the scoring view:
+    two independent parses vs one Leaderboard sharing decoded rows."""
+    payload = slashgolf.decode_payload(body)
+
+    def separate():
+        slashgolf.parse_live_leaderboard(payload)
+        slashgolf.parse_leaderboard(payload, {})
+
+    def unified():
+        board = slashgolf.Leaderboard(payload, {})
+        board.live()
+        board.results()
+
+    base = timeit.timeit(separate, number=number)
+    _report("live + results, two parses", base, number)
+    _report("live + results, one Leaderboard", timeit.timeit(unified, number=number), number, base)
+
+
+def _legacy_normalize_name(name):
+    """normalize_name before the translate table / LRU cache (for comparison)."""
+    if not name:
+        return ""
+    decomposed = unicodedata.normalize("NFD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    despaced = re.sub(r"[\.\,\'\"\`‘’“”\-–—]", " ", stripped.lower())
+    tokens = despaced.split()
+    while tokens and tokens[-1] in slashgolf._NAME_SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+def bench_normalize(payload, number):
+    """A scoring run's name joins: every field name normalized a few times
+    (index_players, field_ids_by_norm, backfill), cold cache then warm."""
+    rows = payload.get("leaderboardRows") or []
+    names = [slashgolf._full_name(r) for r in rows] * 3
+
+    def run(fn):
+        for n in names:
+            fn(n)
+
+    def cold():
+        slashgolf._normalize_name.cache_clear()
+        run(slashgolf.normalize_name)
+
+    base = timeit.timeit(lambda: run(_legacy_normalize_name), number=number)
+    print(f"  normalize_name over {len(names)} names:")
+    _report("legacy regex", base, number)
+    _report("translate table, cold cache", timeit.timeit(cold, number=number), number, base)
+    run(slashgolf.normalize_name)
+    _report("translate table, warm cache", timeit.timeit(lambda: run(slashgolf.normalize_name), number=number),
+            number, base)
+
+
+def bench_positions(payload, number):
+    """Decoding every row's position and score: table lookup vs parsing each
+    string (what the app's positionRank did per render)."""
+    rows = payload.get("leaderboardRows") or []
+    pairs = [(str(r.get("position") or ""), str(r.get("total") or "")) for r in rows]
+
+    def parsed():
+        for pos, score in pairs:
+            slashgolf._parse_position(pos)
+            slashgolf._parse_to_par(score)
+
+    def table():
+        for pos, score in pairs:
+            slashgolf.decode_position(pos)
+            slashgolf.decode_to_par(score)
+
+    base = timeit.timeit(parsed, number=number)
+    print(f"  position/score decode over {len(pairs)} rows:")
+    _report("string parsing", base, number)
+    _report("table lookup", timeit.timeit(table, number=number), number, base)
+
+
+def bench_stream(body):
+    """Peak memory of a field read: whole-body decode + parse vs the streaming
+    row reader (which keeps only the LivePlayer records)."""
+    def peak(fn):
+        tracemalloc.start()
+        try:
+            fn()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    size = leaderboard_stream.STREAM_CHUNK_BYTES
+    chunks = [body[i:i + size] for i in range(0, len(body), size)]
+    whole = peak(lambda: slashgolf.Leaderboard(slashgolf.decode_payload(body, fast=False)).live_players)
+    streamed = peak(lambda: list(leaderboard_stream.LeaderboardStream(chunks).live_players()))
+    counted = peak(lambda: sum(1 for _ in leaderboard_stream.LeaderboardStream(chunks).live_players()))
+    print(f"  peak memory, field read: whole {whole / 1024:,.0f} KiB, "
+          f"streamed {streamed / 1024:,.0f} KiB, streamed+discarded {counted / 1024:,.0f} KiB")
+
+
+def main(argv):
+    number = 200
+    if "-n" in argv:
+        number = int(argv[argv.index("-n") + 1])
+    for label, body in load_payloads():
+        print(f"{label}: {len(body):,} bytes, {number} reps")
+        bench_decode(body, number)
+        bench_ingest(body, number)
+        bench_normalize(slashgolf.decode_payload(body), number)
+        bench_positions(slashgolf.decode_payload(body), number)
+        bench_stream(body)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,24 @@
+-- Slash Golf API budget ledger: one row per metered call batch.
+-- Run this in the Supabase SQL Editor. Idempotent.
+--
+-- scripts/api_budget.py (service role) inserts a row for every real RapidAPI
+-- request the backend jobs make (cache hits are free and not recorded), and
+-- sums the current quota window before each new call so low-priority jobs
+-- (field/schedule sync, extra live refreshes) defer instead of starving the
+-- Monday scorer. `calls` counts HTTP attempts, so retries are included.
+-- Backend-only: RLS on with no policies, so only the service role can read or
+-- write it.
+
+CREATE TABLE IF NOT EXISTS api_usage (
+  id BIGSERIAL PRIMARY KEY,
+  called_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  job TEXT NOT NULL,
+  endpoint TEXT NOT NULL,
+  calls INTEGER NOT NULL DEFAULT 1
+);
+
+CREATE INDEX IF NOT EXISTS idx_api_usage_called_at ON api_usage(called_at);
+
+ALTER TABLE api_usage ENABLE ROW LEVEL SECURITY;
+
+NOTIFY pgrst, 'reload schema';
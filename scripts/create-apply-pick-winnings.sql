@@ -0,0 +1,42 @@
+-- Bulk pick-winnings write for the Monday scorer.
+-- Run this in the Supabase SQL Editor. Idempotent.
+--
+-- scripts/update_results.py used to write each scored pick with its own
+-- PATCH (one PostgREST round trip per pick, per league). It now sends the
+-- whole change list through this function in chunks: one call per chunk of
+-- up to a few hundred picks. Semantics match the per-pick write exactly:
+-- winnings is always set; penalty_amount/penalty_reason are only written
+-- when the penalty is > 0, so an existing penalty is never cleared.
+--
+-- Until this function exists the scorer falls back to the per-pick writes.
+-- Backend-only: EXECUTE is revoked from the client roles, so only the service
+-- role can call it.
+--
+-- Argument: a JSON array of
+--   {"pick_id": uuid, "winnings": int, "penalty_amount": int, "penalty_reason": text|null}
+-- Returns the number of picks updated.
+
+CREATE OR REPLACE FUNCTION apply_pick_winnings(updates JSONB)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+  WITH u AS (
+    SELECT *
+    FROM jsonb_to_recordset(updates)
+      AS x(pick_id UUID, winnings INTEGER, penalty_amount INTEGER, penalty_reason TEXT)
+  ), written AS (
+    UPDATE picks p SET
+      winnings = COALESCE(u.winnings, 0),
+      penalty_amount = CASE WHEN u.penalty_amount > 0 THEN u.penalty_amount ELSE p.penalty_amount END,
+      penalty_reason = CASE WHEN u.penalty_amount > 0 THEN u.penalty_reason ELSE p.penalty_reason END
+    FROM u
+    WHERE p.id = u.pick_id
+    RETURNING 1
+  )
+  SELECT COUNT(*)::INTEGER FROM written;
+$$;
+
+REVOKE EXECUTE ON FUNCTION apply_pick_winnings(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION apply_pick_winnings(JSONB) TO service_role;
+
+NOTIFY pgrst, 'reload schema';
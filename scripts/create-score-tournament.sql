@@ -0,0 +1,239 @@
+-- Server-side scoring: score every league's picks for a tournament in one
+-- transaction.
+-- Run this in the Supabase SQL Editor. Idempotent. Safe to run after
+-- harden-rls.sql and create-apply-pick-winnings.sql.
+--
+-- scripts/update_results.py normally pulls every pick, league member, profile
+-- and league_settings row to the runner, joins them in Python and writes each
+-- pick back, so scoring time grows with the number of leagues. With --server
+-- it instead keeps its safety gates (event Official, schema, $0 field) on the
+-- runner and hands the parsed field to score_tournament(), which does the
+-- rest here:
+--   * inserts a 'No Pick' row for every league member without a pick (with
+--     p_owed_only, as a backfill passes, only for members who joined before
+--     the tournament started);
+--   * joins picks to the field by golfer_id, then by normalized name;
+--   * applies each league's penalties (missed cut / WD / DQ / no pick),
+--     keeping any penalty already on a pick (amount > 0 and a non-empty
+--     reason, the same test the Python scorer applies);
+--   * writes winnings (penalties only when > 0), as apply_pick_winnings does,
+--     but only to picks whose stored values would actually change, and
+--     returns those changes (old and new) as the run's change set.
+-- If real picks exist but none matched (wrong event or mapping) and
+-- p_require_match is set, it raises and the whole transaction — No Pick
+-- inserts included — rolls back. With p_apply = FALSE nothing is written;
+-- the summary is what an apply would do.
+--
+-- Name matching: both the pick's golfer_name and the field's names go through
+-- golf_normalize_name() here, so the two sides always agree. It mirrors
+-- slashgolf.normalize_name (lowercase, accents stripped, punctuation ->
+-- space, trailing jr/sr/ii/iii/iv/v dropped), except that unaccent also
+-- folds a few letters Python keeps (ø, æ, ß, ...), so it can only match more.
+--
+-- Backend-only: EXECUTE is revoked from the client roles.
+
+CREATE EXTENSION IF NOT EXISTS unaccent;
+
+CREATE OR REPLACE FUNCTION golf_normalize_name(name TEXT)
+RETURNS TEXT
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+  tokens TEXT[];
+BEGIN
+  tokens := regexp_split_to_array(
+    btrim(translate(lower(unaccent(COALESCE(name, ''))),
+                    '.,''"`‘’“”-–—', '            ')),
+    '\s+');
+  WHILE array_length(tokens, 1) > 0
+        AND tokens[array_length(tokens, 1)] IN ('jr', 'sr', 'ii', 'iii', 'iv', 'v') LOOP
+    tokens := tokens[1:array_length(tokens, 1) - 1];
+  END LOOP;
+  RETURN COALESCE(array_to_string(tokens, ' '), '');
+END;
+$$;
+
+-- p_field: JSON array of {"player_id", "name", "position", "status", "winnings"},
+-- in leaderboard order (the first of two same-named golfers wins, as in Python).
+-- p_owed_only: skip the No Pick for members who joined after the tournament
+-- started (league_members.joined_at >= tournaments.tournament_date).
+-- Returns {"picks", "matched", "no_pick", "unmatched": [golfer names],
+--          "no_pick_inserted", "written",
+--          "changes": [{"pick_id", "golfer_name", "winnings": [old, new],
+--                       "penalty_amount": [old, new], "penalty_reason": [old, new]}]}.
+-- "picks" counts the scored picks (matched + no pick), as the Python scorer's
+-- stats["picks"] does; unmatched picks are reported but not scored.
+-- Earlier installs had other signatures (a parameter can't be renamed in
+-- place), so drop those first.
+DROP FUNCTION IF EXISTS score_tournament(UUID, JSONB, BOOLEAN, BOOLEAN);
+DROP FUNCTION IF EXISTS score_tournament(UUID, JSONB, BOOLEAN, BOOLEAN, BOOLEAN);
+
+CREATE OR REPLACE FUNCTION score_tournament(
+  p_tournament_id UUID,
+  p_field JSONB,
+  p_apply BOOLEAN DEFAULT FALSE,
+  p_require_match BOOLEAN DEFAULT TRUE,
+  p_owed_only BOOLEAN DEFAULT FALSE
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  v_inserted INTEGER := 0;
+  v_summary JSONB;
+  v_start TIMESTAMPTZ;
+BEGIN
+  IF p_owed_only THEN
+    SELECT t.tournament_date::TIMESTAMPTZ INTO v_start
+    FROM tournaments t WHERE t.id = p_tournament_id;
+  END IF;
+
+  IF p_apply THEN
+    INSERT INTO picks (user_id, league_id, tournament_id, golfer_name, winnings)
+    SELECT m.user_id, m.league_id, p_tournament_id, 'No Pick', 0
+    FROM league_members m
+    WHERE (m.joined_at IS NULL OR v_start IS NULL OR m.joined_at < v_start)
+      AND NOT EXISTS (
+        SELECT 1 FROM picks p
+        WHERE p.tournament_id = p_tournament_id
+          AND p.user_id = m.user_id AND p.league_id = m.league_id);
+    GET DIAGNOSTICS v_inserted = ROW_COUNT;
+  END IF;
+
+  WITH field AS (
+    SELECT COALESCE(f.player_id, '') AS player_id,
+           golf_normalize_name(f.name) AS name_norm,
+           COALESCE(f.position, '') AS position,
+           COALESCE(f.status, '') AS status,
+           ROUND(COALESCE(f.winnings, 0))::INTEGER AS winnings,
+           f.ord
+    FROM ROWS FROM (
+      jsonb_to_recordset(p_field)
+        AS (player_id TEXT, name TEXT, position TEXT, status TEXT, winnings NUMERIC)
+    ) WITH ORDINALITY AS f(player_id, name, position, status, winnings, ord)
+  ),
+  by_id AS (
+    SELECT DISTINCT ON (player_id) * FROM field WHERE player_id <> '' ORDER BY player_id, ord
+  ),
+  by_norm AS (
+    SELECT DISTINCT ON (name_norm) * FROM field WHERE name_norm <> '' ORDER BY name_norm, ord
+  ),
+  pending AS (
+    SELECT p.id, p.league_id, p.golfer_id::TEXT AS golfer_id, p.golfer_name,
+           COALESCE(p.penalty_amount, 0) AS penalty_amount, p.penalty_reason
+    FROM picks p
+    WHERE p.tournament_id = p_tournament_id
+    UNION ALL
+    -- A dry run scores the No Pick rows an apply would insert.
+    SELECT NULL, m.league_id, NULL, 'No Pick', 0, NULL
+    FROM league_members m
+    WHERE NOT p_apply
+      AND (m.joined_at IS NULL OR v_start IS NULL OR m.joined_at < v_start)
+      AND NOT EXISTS (
+        SELECT 1 FROM picks p
+        WHERE p.tournament_id = p_tournament_id
+          AND p.user_id = m.user_id AND p.league_id = m.league_id)
+  ),
+  scored AS (
+    SELECT pk.id, pk.golfer_name,
+           (pk.golfer_name IS NULL OR pk.golfer_name IN ('', 'No Pick')) AS no_pick,
+           hit.player_id IS NOT NULL AS matched,
+           COALESCE(hit.winnings, 0) AS winnings,
+           CASE
+             WHEN pk.penalty_amount > 0 AND NULLIF(pk.penalty_reason, '') IS NOT NULL
+               THEN pk.penalty_amount
+             WHEN pk.golfer_name IS NULL OR pk.golfer_name IN ('', 'No Pick')
+               THEN CASE WHEN ls.league_id IS NULL THEN 10 ELSE COALESCE(ls.no_pick_penalty, 500) END
+             WHEN hit.status = 'cut' OR hit.position = 'CUT'
+               THEN CASE WHEN ls.league_id IS NULL THEN 10 ELSE COALESCE(ls.missed_cut_penalty, 10) END
+             WHEN hit.status = 'withdrawn' OR hit.position = 'WD'
+               THEN CASE WHEN ls.league_id IS NULL THEN 10 ELSE COALESCE(ls.withdrawal_penalty, 10) END
+             WHEN hit.status = 'disqualified' OR hit.position = 'DQ'
+               THEN CASE WHEN ls.league_id IS NULL THEN 10 ELSE COALESCE(ls.dq_penalty, 10) END
+             ELSE 0
+           END AS penalty,
+           CASE
+             WHEN pk.penalty_amount > 0 AND NULLIF(pk.penalty_reason, '') IS NOT NULL THEN pk.penalty_reason
+             WHEN pk.golfer_name IS NULL OR pk.golfer_name IN ('', 'No Pick') THEN 'no_pick'
+             WHEN hit.status = 'cut' OR hit.position = 'CUT' THEN 'missed_cut'
+             WHEN hit.status = 'withdrawn' OR hit.position = 'WD' THEN 'withdrawal'
+             WHEN hit.status = 'disqualified' OR hit.position = 'DQ' THEN 'disqualification'
+           END AS penalty_reason
+    FROM pending pk
+    LEFT JOIN league_settings ls ON ls.league_id = pk.league_id
+    LEFT JOIN LATERAL (
+      SELECT j.player_id, j.position, j.status, j.winnings
+      FROM (
+        SELECT 1 AS rank, b.* FROM by_id b WHERE b.player_id = pk.golfer_id
+        UNION ALL
+        SELECT 2, n.* FROM by_norm n WHERE n.name_norm = golf_normalize_name(pk.golfer_name)
+      ) j
+      WHERE NOT (pk.golfer_name IS NULL OR pk.golfer_name IN ('', 'No Pick'))
+      ORDER BY j.rank
+      LIMIT 1
+    ) hit ON TRUE
+  ),
+  target AS (
+    SELECT s.id, s.golfer_name, s.winnings,
+           CASE WHEN s.penalty > 0 THEN s.penalty ELSE old.penalty_amount END AS penalty_amount,
+           CASE WHEN s.penalty > 0 THEN s.penalty_reason ELSE old.penalty_reason END AS penalty_reason,
+           old.winnings AS old_winnings,
+           old.penalty_amount AS old_penalty_amount,
+           old.penalty_reason AS old_penalty_reason
+    FROM scored s
+    JOIN picks old ON old.id = s.id
+    WHERE s.no_pick OR s.matched
+  ),
+  changed AS (
+    SELECT * FROM target t
+    WHERE t.old_winnings IS DISTINCT FROM t.winnings
+       OR t.old_penalty_amount IS DISTINCT FROM t.penalty_amount
+       OR t.old_penalty_reason IS DISTINCT FROM t.penalty_reason
+  ),
+  written AS (
+    UPDATE picks p SET
+      winnings = c.winnings,
+      penalty_amount = c.penalty_amount,
+      penalty_reason = c.penalty_reason
+    FROM changed c
+    WHERE p_apply AND p.id = c.id
+    RETURNING 1
+  )
+  SELECT jsonb_build_object(
+    'picks', COUNT(*) FILTER (WHERE no_pick OR matched),
+    'matched', COUNT(*) FILTER (WHERE NOT no_pick AND matched),
+    'no_pick', COUNT(*) FILTER (WHERE no_pick),
+    'unmatched', COALESCE(jsonb_agg(golfer_name) FILTER (WHERE NOT no_pick AND NOT matched), '[]'::JSONB),
+    'no_pick_inserted', v_inserted,
+    'written', (SELECT COUNT(*) FROM written),
+    'changes', (
+      SELECT COALESCE(jsonb_agg(jsonb_build_object(
+        'pick_id', c.id,
+        'golfer_name', c.golfer_name,
+        'winnings', jsonb_build_array(c.old_winnings, c.winnings),
+        'penalty_amount', jsonb_build_array(c.old_penalty_amount, c.penalty_amount),
+        'penalty_reason', jsonb_build_array(c.old_penalty_reason, c.penalty_reason)
+      )), '[]'::JSONB)
+      FROM changed c)
+  )
+  INTO v_summary
+  FROM scored;
+
+  IF p_require_match
+     AND (v_summary->>'matched')::INTEGER = 0
+     AND jsonb_array_length(v_summary->'unmatched') > 0 THEN
+    RAISE EXCEPTION 'ZERO real picks matched the leaderboard (% unmatched) — wrong event or mapping',
+      jsonb_array_length(v_summary->'unmatched');
+  END IF;
+
+  RETURN v_summary;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION golf_normalize_name(TEXT) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION score_tournament(UUID, JSONB, BOOLEAN, BOOLEAN, BOOLEAN) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION golf_normalize_name(TEXT) TO service_role;
+GRANT EXECUTE ON FUNCTION score_tournament(UUID, JSONB, BOOLEAN, BOOLEAN, BOOLEAN) TO service_role;
+
+NOTIFY pgrst, 'reload schema';
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Columnar view of a parsed leaderboard, for field-wide stats.
+
+slashgolf's parsers return one record per golfer, which suits the per-pick
+scoring loop but makes every whole-field question (total purse paid, how many
+made the cut, where the money went) another Python loop. A FieldFrame holds
+the same field as parallel NumPy arrays, one entry per golfer:
+
+  player_id   str      Slash Golf playerId ('' when the row has none)
+  rank        int32    sort rank from slashgolf.decode_position (position,
+                       then 8000 = no position, 9000+ = CUT/WD/DQ)
+  tied        bool     position carried a 'T' prefix
+  to_par      float64  total score to par ('E' = 0); NaN when not reported
+  status      int8     index into STATUS_CODES
+  winnings    float64  prize money
+
+update_results builds one per scoring run, reads its safety gates from it and
+joins every pick's golfer_id against it in one vectorized lookup.
+NumPy is only needed by code that builds a frame; import this module lazily.
+"""
+
+import numpy as np
+
+import slashgolf
+
+STATUS_CODES = ("active", "cut", "withdrawn", "disqualified")
+_STATUS_INDEX = {name: code for code, name in enumerate(STATUS_CODES)}
+
+
+class FieldFrame:
+    """One leaderboard as parallel arrays (see the module docstring)."""
+
+    def __init__(self, player_id, rank, tied, to_par, status, winnings):
+        self.player_id = player_id
+        self.rank = rank
+        self.tied = tied
+        self.to_par = to_par
+        self.status = status
+        self.winnings = winnings
+        self._order = None
+
+    @classmethod
+    def from_players(cls, players):
+        """Build from parse_leaderboard's players (records or row dicts)."""
+        n = len(players)
+        rank = np.zeros(n, dtype=np.int32)
+        tied = np.zeros(n, dtype=bool)
+        to_par = np.empty(n, dtype=np.float64)
+        status = np.zeros(n, dtype=np.int8)
+        winnings = np.zeros(n, dtype=np.float64)
+        ids = []
+        for i, p in enumerate(players):
+            ids.append(p.get("player_id") or "")
+            # Parser records carry the decoded values; plain row dicts (older
+            # snapshots, tests) are decoded here.
+            if p.get("rank") is None:
+                rank[i], tied[i] = slashgolf.decode_position(p.get("position"))
+                par = slashgolf.decode_to_par(p.get("score"))
+            else:
+                rank[i], tied[i], par = p.get("rank"), p.get("tied"), p.get("to_par")
+            to_par[i] = np.nan if par is None else par
+            status[i] = _STATUS_INDEX.get(p.get("status"), 0)
+            winnings[i] = p.get("winnings") or 0.0
+        return cls(np.array(ids, dtype=str), rank, tied, to_par, status, winnings)
+
+    def __len__(self):
+        return len(self.player_id)
+
+    # -- aggregates ---------------------------------------------------------
+    def total_winnings(self):
+        return float(self.winnings.sum())
+
+    def paid_count(self):
+        return int(np.count_nonzero(self.winnings > 0))
+
+    def status_counts(self):
+        """{status name: golfers} over STATUS_CODES, zeros included."""
+        counts = np.bincount(self.status, minlength=len(STATUS_CODES))
+        return {name: int(counts[code]) for code, name in enumerate(STATUS_CODES)}
+
+    # -- joins --------------------------------------------------------------
+    def index_of(self, player_ids):
+        """Row index for each of ``player_ids``; -1 where not in the field.
+        One sort of the field, then a binary search per id."""
+        if self._order is None:
+            self._order = np.argsort(self.player_id, kind="stable")
+        wanted = np.asarray(player_ids, dtype=str)
+        if not len(self) or not len(wanted):
+            return np.full(len(wanted), -1, dtype=np.intp)
+        sorted_ids = self.player_id[self._order]
+        pos = np.searchsorted(sorted_ids, wanted)
+        pos = np.minimum(pos, len(sorted_ids) - 1)
+        hit = (sorted_ids[pos] == wanted) & (wanted != "")
+        return np.where(hit, self._order[pos], -1)
@@ -2,10 +2,12 @@
 """
 Shared helpers for the Golf League backend scripts.
 
-Consolidates the three things that were copy-pasted across update_results.py,
+Consolidates the things that were copy-pasted across update_results.py,
 send_reminders.py and send_notification.py:
   * Supabase service-role client creation (with the SERVICE_ROLE/SERVICE_KEY
     env aliasing the GitHub Actions workflows use).
+  * Paginated table scans (``paginate``), so no select silently stops at
+    PostgREST's row cap.
   * VAPID / Web Push configuration.
   * The webpush send loop, including expired-subscription (404/410) cleanup.
 
@@ -17,6 +19,7 @@ any credentials present.
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from dotenv import load_dotenv
 
@@ -33,6 +36,11 @@ VAPID_PRIVATE_KEY = os.environ.get("VAPID_PRIVATE_KEY")
 VAPID_PUBLIC_KEY = os.environ.get("VAPID_PUBLIC_KEY")
 VAPID_SUBJECT = os.environ.get("VAPID_SUBJECT", "mailto:admin@example.com")
 
+# Rows per page for table scans. PostgREST caps every response at its
+# max-rows setting (1000 on Supabase unless changed), and a scan treats a
+# short page as the end, so this must not exceed that cap.
+PAGE_SIZE = int(os.environ.get("SUPABASE_PAGE_SIZE", "1000"))
+
 _client = None
 
 
@@ -54,6 +62,47 @@ def get_supabase_client():
     return _client
 
 
+def _fetch_page(build_query, order, page, page_size):
+    query = build_query()
+    for column in order:
+        query = query.order(column)
+    start = page * page_size
+    return query.range(start, start + page_size - 1).execute().data or []
+
+
+def paginate(build_query, page_size=PAGE_SIZE, order=("id",), workers=1):
+    """Yield every row of a select, one ``.range()`` page at a time.
+
+    ``build_query`` is a zero-argument callable returning a fresh, filtered
+    query (``lambda: supabase.table("picks").select("*").eq(...)``) — the
+    client's builders are mutable, so each page needs its own. ``order`` is
+    appended after any order the query already has, to make the pages a
+    stable partition; it must be unique (the primary key). With
+    ``workers > 1`` that many pages are fetched at once; rows still come out
+    in order. The scan ends at the first page shorter than ``page_size``.
+    """
+    if isinstance(order, str):
+        order = (order,)
+    if workers <= 1:
+        page = 0
+        while True:
+            rows = _fetch_page(build_query, order, page, page_size)
+            yield from rows
+            if len(rows) < page_size:
+                return
+            page += 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        page = 0
+        while True:
+            batch = pool.map(lambda n: _fetch_page(build_query, order, n, page_size),
+                             range(page, page + workers))
+            for rows in batch:
+                yield from rows
+                if len(rows) < page_size:
+                    return
+            page += workers
+
+
 def send_web_push(supabase, subscriptions, payload):
     """Send one Web Push ``payload`` (a dict) to every subscription, removing
     any that the push service reports as gone (404/410).
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Streaming leaderboard reads (bench/offline companion to slashgolf.py).
+
+slashgolf.fetch_leaderboard materializes the whole payload before anything is
+parsed. LeaderboardStream instead reads a /leaderboard body from byte chunks
+and yields one row at a time, so a caller that consumes rows as they arrive
+(e.g. a replay over archived payloads) holds one row plus a read buffer per
+event rather than the full object graph. Rows are decoded with the same
+slashgolf._decode_row the Leaderboard uses, so both produce identical
+records.
+
+The jobs themselves share one materialized fetch per event
+(slashgolf.ingest_leaderboard) and need the whole board anyway (winner, cut
+line, schema gates), so nothing in the pipeline reads through this module;
+bench_slashgolf.py measures it against the whole-body parse.
+"""
+
+import codecs
+import json
+import re
+
+from slashgolf import (
+    _cut_line,
+    _decode_row,
+    _live_player,
+    _scored_player,
+    earnings_by_player,
+    is_event_official,
+    leaderboard_row_schema,
+    to_epoch_ms,
+    unwrap,
+)
+
+STREAM_CHUNK_BYTES = 64 * 1024
+_JSON_WS = re.compile(r"[ \t\n\r]*")
+_NUMBER_CONTINUES = frozenset(".eE+-0123456789")
+
+
+class _IncrementalJSON:
+    """Just enough of a pull parser to walk down object keys to an array and
+    hand back its elements one at a time, over UTF-8 byte chunks.
+
+    Scalars, and any value the caller doesn't descend into, are decoded whole
+    with the stdlib decoder's raw_decode as soon as enough input is buffered;
+    consumed input is dropped from the buffer on each refill."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self):
+        """Append the next chunk; False once the input is exhausted."""
+        if self._eof:
+            return False
+        self._buf = self._buf[self._pos:]
+        self._pos = 0
+        for chunk in self._chunks:
+            text = self._utf8.decode(chunk)
+            if text:
+                self._buf += text
+                return True
+        self._buf += self._utf8.decode(b"", final=True)
+        self._eof = True
+        return False
+
+    def peek(self):
+        """The next non-whitespace character ('' at end of input)."""
+        while True:
+            self._pos = _JSON_WS.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"expected {char!r} in JSON stream, found {found!r}")
+        self._pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number cut by a chunk boundary decodes as its prefix ("1.5e"
+            # -> 1.5, stopping at the dangling "e"); refill whenever it ends
+            # at the buffer edge or runs into a character a number could
+            # continue with.
+            if (isinstance(value, (int, float)) and not isinstance(value, bool)
+                    and (end == len(self._buf) or self._buf[end] in _NUMBER_CONTINUES)
+                    and self._fill()):
+                continue
+            self._pos = end
+            return value
+
+    def close(self):
+        """Release the chunk source (e.g. an open response) early."""
+        close = getattr(self._chunks, "close", None)
+        if close is not None:
+            close()
+
+    def finish(self):
+        """Read to the end of input, which must hold only whitespace."""
+        if self.peek():
+            raise ValueError("trailing data after JSON document in stream")
+
+    def _after_member(self, closer):
+        """Consume the ',' between members; True if another follows."""
+        found = self.peek()
+        self._pos += 1
+        if found == ",":
+            return True
+        if found == closer:
+            return False
+        raise ValueError(f"expected ',' or {closer!r} in JSON stream, found {found!r}")
+
+    def keys(self):
+        """Yield an object's keys; the caller must consume each key's value
+        (value() or a nested walk) before asking for the next."""
+        self._expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            self._expect(":")
+            yield key
+            if not self._after_member("}"):
+                return
+
+    def items(self):
+        """Yield an array's elements, each decoded whole."""
+        self._expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if not self._after_member("]"):
+                return
+
+
+class LeaderboardStream:
+    """Row-at-a-time reader over a /leaderboard body arriving in chunks.
+
+    ``root`` is the key path from the document to the payload object (the
+    cache wraps it under "payload"). Top-level payload values other than the
+    rows (status, cutLines, lastUpdated, ...) are collected into ``meta`` as
+    they are passed; Slash Golf puts some of them after the rows, so ``meta``
+    and the status attributes are only complete once the rows are exhausted.
+    ``on_complete(meta)`` runs after a full read.
+    """
+
+    def __init__(self, chunks, root=(), on_complete=None):
+        self._reader = _IncrementalJSON(chunks)
+        self._root = tuple(root)
+        self._on_complete = on_complete
+        self.meta = {}
+        self.exhausted = False
+        self._row_keys = set()
+        self.schema = None
+
+    def raw_rows(self):
+        """Yield each leaderboardRows entry as a dict, one at a time."""
+        reader = self._reader
+        enclosing = []
+        for key in self._root:
+            keys = reader.keys()
+            for k in keys:
+                if k == key:
+                    break
+                reader.value()
+            else:
+                raise ValueError(f"no {key!r} object in leaderboard stream")
+            enclosing.append(keys)
+        row_keys = self._row_keys
+        for key in reader.keys():
+            if key == "leaderboardRows" and reader.peek() == "[":
+                for row in reader.items():
+                    if isinstance(row, dict):
+                        row_keys.update(row)
+                    yield row
+            else:
+                self.meta[key] = reader.value()
+        for keys in reversed(enclosing):
+            for _ in keys:
+                reader.value()
+        reader.finish()
+        self.exhausted = True
+        # Rows go by before the whole key set is known, so the stream decodes
+        # with the probing fallback and fingerprints at the end.
+        self.schema = leaderboard_row_schema([dict.fromkeys(row_keys)])[0]
+        if self._on_complete is not None:
+            self._on_complete(self.meta)
+
+    def close(self):
+        """Stop reading: releases the chunk source behind an unfinished
+        stream."""
+        self._reader.close()
+
+    def rows(self):
+        """Yield _decode_row tuples, skipping blank rows."""
+        for row in self.raw_rows():
+            decoded = _decode_row(row)
+            if decoded:
+                yield decoded
+
+    def live_players(self):
+        """Yield a LivePlayer per row (the live board / field projection)."""
+        return map(_live_player, self.rows())
+
+    def players(self, earnings_json=None):
+        """Yield a scored Player per row, with winnings joined from /earnings
+        (small, so read whole)."""
+        earnings = earnings_by_player(earnings_json) if earnings_json else {}
+        return (_scored_player(d, earnings) for d in self.rows())
+
+    @property
+    def cut_line(self):
+        return _cut_line(self.meta)
+
+    @property
+    def event_status(self):
+        return str(unwrap(self.meta.get("status")) or "").strip()
+
+    @property
+    def round_status(self):
+        return str(unwrap(self.meta.get("roundStatus")) or "").strip()
+
+    @property
+    def event_completed(self):
+        return is_event_official(self.meta)
+
+    @property
+    def updated_ms(self):
+        return to_epoch_ms(self.meta.get("lastUpdated"))
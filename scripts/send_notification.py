@@ -1,18 +1,22 @@
 #!/usr/bin/env python3
 """Send push notifications to all subscribed users."""
 
-from golf_common import get_supabase_client, send_web_push
+from golf_common import get_supabase_client, paginate, send_web_push
 
 
 def send_to_all(title, body, url="/", tag="golf-league-notification", notify_type="results"):
     """Send a push notification to subscribed users filtered by preference."""
     supabase = get_supabase_client()
-    query = supabase.table("push_subscriptions").select("*")
-    if notify_type == "results":
-        query = query.eq("notify_results", True)
-    elif notify_type == "reminders":
-        query = query.eq("notify_reminders", True)
-    subscriptions = query.execute().data or []
+
+    def subscriptions_query():
+        query = supabase.table("push_subscriptions").select("*")
+        if notify_type == "results":
+            query = query.eq("notify_results", True)
+        elif notify_type == "reminders":
+            query = query.eq("notify_reminders", True)
+        return query
+
+    subscriptions = list(paginate(subscriptions_query))
 
     payload = {
         "title": title,
@@ -3,7 +3,8 @@
 
 from datetime import datetime, timedelta, timezone
 
-from golf_common import get_supabase_client, send_web_push
+from golf_common import get_supabase_client, paginate, send_web_push
+from tournaments import tournament_record, tournament_records
 
 # Don't fire a reminder earlier than this many hours before a tournament's
 # pick deadline. The crons run the day before the Thursday lock, so a generous
@@ -14,16 +15,6 @@ from golf_common import get_supabase_client, send_web_push
 REMINDER_LOOKAHEAD_HOURS = 96
 
 
-def _parse_lock_time(raw):
-    """Parse a picks_lock_time value into an aware UTC datetime, or None."""
-    if not raw:
-        return None
-    dt = datetime.fromisoformat(str(raw).replace("Z", "+00:00"))
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    return dt
-
-
 def _pick_deadline(t):
     """The effective 'picks lock' instant for a tournament, or None.
 
@@ -33,10 +24,10 @@ def _pick_deadline(t):
     it's a safe deadline proxy. If neither is known we return None and the
     tournament is skipped: without a deadline we cannot tell whether a reminder
     would be on time or days late, and a late one is worse than none.
+
+    That fallback is the Tournament record's ``lock``.
     """
-    return _parse_lock_time(t.get("picks_lock_time")) or _parse_lock_time(
-        t.get("tournament_date")
-    )
+    return tournament_record(t).lock
 
 
 def select_reminder_tournament(tournaments, now=None):
@@ -65,37 +56,29 @@ def select_reminder_tournament(tournaments, now=None):
     now = now or datetime.now(timezone.utc)
     horizon = now + timedelta(hours=REMINDER_LOOKAHEAD_HOURS)
 
-    upcoming = []
-    for t in tournaments:
-        if t.get("completed"):
-            continue
-        deadline = _pick_deadline(t)
-        if deadline is None:
-            continue
-        # Still open (now < deadline) and imminent (deadline <= horizon).
-        if now < deadline <= horizon:
-            upcoming.append((deadline, t))
-
+    # Still open (now < deadline) and imminent (deadline <= horizon).
+    upcoming = [
+        t for t in tournament_records(tournaments)
+        if not t.get("completed") and t.open_for_picks(now, horizon)
+    ]
     if not upcoming:
         return None
-    upcoming.sort(key=lambda x: x[0])
-    return upcoming[0][1]
+    return min(upcoming, key=lambda t: t.lock).row
 
 
 def get_upcoming_tournament():
     """Find the tournament an upcoming-pick reminder should target."""
     supabase = get_supabase_client()
-    response = supabase.table("tournaments").select("*").execute()
-    return select_reminder_tournament(response.data or [])
+    return select_reminder_tournament(paginate(lambda: supabase.table("tournaments").select("*")))
 
 
 def get_users_without_picks(tournament_id):
     """Get user IDs of league members who haven't submitted picks for this tournament."""
     supabase = get_supabase_client()
-    picks = supabase.table("picks").select("user_id, league_id").eq("tournament_id", tournament_id).execute().data or []
+    picks = paginate(lambda: supabase.table("picks").select("user_id, league_id").eq("tournament_id", tournament_id))
     picked = set((p["user_id"], p["league_id"]) for p in picks)
 
-    members = supabase.table("league_members").select("user_id, league_id").execute().data or []
+    members = paginate(lambda: supabase.table("league_members").select("user_id, league_id"))
     missing = [m["user_id"] for m in members if (m["user_id"], m["league_id"]) not in picked]
     return list(set(missing))  # dedupe across leagues
 
@@ -115,15 +98,12 @@ def send_reminders(tournament):
 
     print(f"Found {len(missing_user_ids)} user(s) without picks")
 
-    subscriptions = (
-        supabase.table("push_subscriptions")
+    subscriptions = list(paginate(
+        lambda: supabase.table("push_subscriptions")
         .select("*")
         .in_("user_id", missing_user_ids)
         .eq("notify_reminders", True)
-        .execute()
-        .data
-        or []
-    )
+    ))
     if not subscriptions:
         print("No subscriptions with reminders enabled for missing users.")
         return
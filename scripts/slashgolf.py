@@ -20,19 +20,60 @@ both calls joined on playerId.
 Pure module: depends only on ``requests`` + the standard library, so it can be
 unit-tested against fixtures and imported without database or VAPID
 credentials. Network access only happens inside the ``fetch_*`` helpers.
+
+Offline runs: ``SLASHGOLF_CASSETTE=record`` saves every real response under
+scripts/.cassettes; ``SLASHGOLF_CASSETTE=replay`` serves them back with no
+network, so any job can be re-run or benchmarked against real payloads, e.g.
+``SLASHGOLF_CASSETTE=replay python update_results.py --no-cache``.
 """
 
+import asyncio
+import gzip
+import hashlib
+import json
 import os
+import random
 import re
+import sys
+import threading
+import time
 import unicodedata
+from concurrent.futures import Future, ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from functools import cached_property, lru_cache
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from tournaments import parse_timestamp
+
+# Optional fast JSON backend: used for response bodies when installed, with
+# the stdlib decoder as the always-available fallback.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
 
 RAPIDAPI_HOST = os.getenv("RAPIDAPI_HOST", "live-golf-data.p.rapidapi.com")
 RAPIDAPI_KEY = os.getenv("RAPIDAPI_KEY") or os.getenv("X_RAPIDAPI_KEY")
 # orgId 1 = PGA Tour. Centralized so a future Korn Ferry / DP World expansion
 # is a parameter change, not a code change.
 DEFAULT_ORG_ID = os.getenv("ORG_ID", "1")
+# Every tour the jobs ingest in one run (comma-separated, e.g. "1,2"). A
+# tournament row records its own tour in slashgolf_org_id; rows without one
+# belong to DEFAULT_ORG_ID.
+ORG_IDS = [o.strip() for o in os.getenv("ORG_IDS", DEFAULT_ORG_ID).split(",") if o.strip()]
+# Upper bound on simultaneous Slash Golf requests when several events or
+# tours are fetched at once. All of them still draw on one shared budget.
+MAX_CONCURRENCY = int(os.getenv("SLASHGOLF_MAX_CONCURRENCY", "4"))
+
+
+def org_ids_from_args(args):
+    """The ``--orgs 1,2`` CLI override, else ORG_IDS."""
+    if "--orgs" in args:
+        raw = args[args.index("--orgs") + 1]
+        return [o.strip() for o in raw.split(",") if o.strip()]
+    return list(ORG_IDS)
 
 
 # ---------------------------------------------------------------------------
@@ -54,6 +95,21 @@ def unwrap(value):
     return value
 
 
+def decode_payload(body, fast=None):
+    """Decode a Slash Golf response body (bytes).
+
+    Uses orjson when it's installed (``fast=None``) and the stdlib otherwise;
+    ``fast`` forces a backend for tests and bench_slashgolf.py. The two return
+    identical trees — extended-JSON wrappers are left in place for unwrap(),
+    since flattening them in Python costs more than orjson saves (measured
+    with bench_slashgolf.py on a full-field leaderboard)."""
+    if fast is None:
+        fast = orjson is not None
+    if fast:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
 def to_float(value, default=0.0):
     """Coerce an (optionally wrapped) value to float, ``default`` on failure."""
     raw = unwrap(value)
@@ -86,11 +142,8 @@ def to_epoch_ms(value):
         return int(raw)
     except (TypeError, ValueError):
         pass
-    try:
-        from datetime import datetime
-        return int(datetime.fromisoformat(str(raw).replace("Z", "+00:00")).timestamp() * 1000)
-    except ValueError:
-        return None
+    dt = parse_timestamp(raw)
+    return int(dt.timestamp() * 1000) if dt else None
 
 
 # ---------------------------------------------------------------------------
@@ -102,7 +155,41 @@ def to_epoch_ms(value):
 # is deterministic normalization only.
 # ---------------------------------------------------------------------------
 _NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
-_PUNCT_TO_SPACE = re.compile(r"[\.\,\'\"\`‘’“”\-–—]")
+_PUNCT_TO_SPACE = ".,'\"`‘’“”-–—"
+# Names repeat constantly within and across runs (every pick, field row and
+# available golfer goes through here, often several times), so results are
+# memoized. The bound is generous for a season's worth of golfers and events.
+NORMALIZE_CACHE_SIZE = 8192
+
+
+class _NameTable(dict):
+    """str.translate table that fills itself on first sight of a character:
+    punctuation -> space, combining marks -> deleted, anything else kept.
+    Lookups after the first are a plain dict hit."""
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        if char in _PUNCT_TO_SPACE:
+            value = " "
+        elif unicodedata.combining(char):
+            value = None
+        else:
+            value = codepoint
+        self[codepoint] = value
+        return value
+
+
+_NAME_TABLE = _NameTable()
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_name(name):
+    # NFD is the identity on ASCII, which is most names; skip it there.
+    decomposed = name if name.isascii() else unicodedata.normalize("NFD", name)
+    tokens = decomposed.translate(_NAME_TABLE).lower().split()
+    while tokens and tokens[-1] in _NAME_SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens)
 
 
 def normalize_name(name):
@@ -111,13 +198,7 @@ def normalize_name(name):
     drop trailing name suffixes (jr/sr/ii/...)."""
     if not name:
         return ""
-    decomposed = unicodedata.normalize("NFD", name)
-    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
-    despaced = _PUNCT_TO_SPACE.sub(" ", stripped.lower())
-    tokens = despaced.split()
-    while tokens and tokens[-1] in _NAME_SUFFIXES:
-        tokens.pop()
-    return " ".join(tokens)
+    return _normalize_name(name)
 
 
 _GENERIC_TOURNAMENT_WORDS = {
@@ -163,8 +244,14 @@ def tournament_names_match(name_a, name_b):
     Dotted initialisms are collapsed first ("U.S." -> "us") so "US Open" maps
     to "U.S. Open"; rules 1 and 2 then carry it.
     """
-    a = _collapse_initialisms(normalize_name(name_a))
-    b = _collapse_initialisms(normalize_name(name_b))
+    return _collapsed_names_match(
+        _collapse_initialisms(normalize_name(name_a)),
+        _collapse_initialisms(normalize_name(name_b)),
+    )
+
+
+def _collapsed_names_match(a, b):
+    """tournament_names_match on names already normalized + collapsed."""
     if not a or not b:
         return False
     if a == b or a in b or b in a:
@@ -209,12 +296,159 @@ def _player_status(raw_status, position):
     return "active"
 
 
+# Position/score decoding. Positions and scores stay in the records as the
+# display strings Slash Golf sends ('T4', 'CUT', '-7', 'E'); alongside them the
+# ingest stores a numeric sort rank, a tie flag and an integer to-par, so the
+# app and the scorer never re-parse strings per view. Both vocabularies are
+# small and closed (a field is ~156 deep, scores rarely leave +-40), so they
+# are decoded by table lookup, with a parsing fallback for anything unusual.
+#
+# Rank order matches the app's live board: finishers by position, then
+# players with no position yet, then CUT/MDF, WD, DQ.
+RANK_NO_POSITION = 8000
+_OUT_RANKS = {"CUT": 9000, "MDF": 9000, "WD": 9001, "DQ": 9002}
+_POSITION_TABLE_DEPTH = 300
+_TO_PAR_TABLE_RANGE = 60
+
+
+def _parse_position(position):
+    """(rank, tied) for a position string, the slow way (table fallback)."""
+    pos = str(position or "").strip().upper()
+    if pos in _OUT_RANKS:
+        return _OUT_RANKS[pos], False
+    tied = pos.startswith("T")
+    digits = "".join(c for c in pos if c.isdigit())
+    if digits:
+        return int(digits), tied
+    return RANK_NO_POSITION, False
+
+
+def _parse_to_par(score):
+    """Integer to-par for a score string ('E' = 0), None if not a score."""
+    s = str(score or "").strip().upper()
+    if s == "E":
+        return 0
+    try:
+        return int(s)
+    except ValueError:
+        return None
+
+
+def _build_position_table():
+    table = {"": (RANK_NO_POSITION, False)}
+    for label, rank in _OUT_RANKS.items():
+        table[label] = (rank, False)
+    for n in range(1, _POSITION_TABLE_DEPTH + 1):
+        table[str(n)] = (n, False)
+        table[f"T{n}"] = (n, True)
+    return table
+
+
+def _build_to_par_table():
+    table = {"E": 0, "e": 0, "0": 0, "": None, "-": None, "--": None}
+    for n in range(1, _TO_PAR_TABLE_RANGE + 1):
+        table[f"-{n}"] = -n
+        table[f"+{n}"] = n
+        table[str(n)] = n
+    return table
+
+
+_POSITION_TABLE = _build_position_table()
+_TO_PAR_TABLE = _build_to_par_table()
+
+
+def decode_position(position):
+    """``(rank, tied)`` for a position: 'T4' -> (4, True), '1' -> (1, False),
+    'CUT' -> (9000, False), '' -> (RANK_NO_POSITION, False)."""
+    decoded = _POSITION_TABLE.get(position)
+    if decoded is None:
+        decoded = _parse_position(position)
+    return decoded
+
+
+def decode_to_par(score):
+    """Integer to-par for a score string ('-7' -> -7, 'E' -> 0, '+3' -> 3),
+    None when the row has no score yet."""
+    try:
+        return _TO_PAR_TABLE[score]
+    except (KeyError, TypeError):
+        return _parse_to_par(score)
+
+
 def _full_name(row):
     first = str(row.get("firstName", "") or "").strip()
     last = str(row.get("lastName", "") or "").strip()
     return (first + " " + last).strip()
 
 
+# ---------------------------------------------------------------------------
+# Player records
+#
+# One record per golfer per parsed leaderboard. A season archive parses a few
+# hundred leaderboards of ~150 rows each, so these are __slots__ classes rather
+# than per-row dicts (no per-instance __dict__, no repeated key strings), and
+# the short, highly repetitive position/status strings are interned.
+#
+# Consumers still read them like the dicts they replaced (p["player_id"],
+# p.get("thru")); to_row() produces the plain dict for JSONB/DB writes.
+# ---------------------------------------------------------------------------
+class _PlayerRecord:
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs):
+        for field, value in zip(self.__slots__, args):
+            setattr(self, field, value)
+        for field in self.__slots__[len(args):]:
+            setattr(self, field, kwargs.pop(field, None))
+        if kwargs:
+            raise TypeError(f"{type(self).__name__} has no field(s) {sorted(kwargs)}")
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def to_row(self):
+        """The plain-dict form, for a JSONB column or a DB insert."""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __eq__(self, other):
+        if isinstance(other, _PlayerRecord):
+            return type(self) is type(other) and self.to_row() == other.to_row()
+        if isinstance(other, dict):
+            return self.to_row() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(f"{f}={getattr(self, f)!r}" for f in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class Player(_PlayerRecord):
+    """A scored leaderboard row (parse_leaderboard)."""
+    __slots__ = ("player_id", "player_name", "position", "score", "winnings", "status",
+                 "rank", "tied", "to_par")
+
+
+class LivePlayer(_PlayerRecord):
+    """A live-board / field row (parse_live_leaderboard)."""
+    __slots__ = ("player_id", "player_name", "position", "score", "status", "thru", "round",
+                 "rank", "tied", "to_par")
+
+
+def player_rows(players):
+    """Plain dicts for a list of records (dicts pass through unchanged)."""
+    return [p.to_row() if isinstance(p, _PlayerRecord) else p for p in players]
+
+
 def is_event_official(leaderboard_json):
     """A finished, final leaderboard reports top-level status 'Official'
     (roundStatus echoes it). Anything else — 'In Progress', 'Suspended',
@@ -246,60 +480,21 @@ def parse_leaderboard(leaderboard_json, earnings_json=None, tournament_name=None
         {
           "tournament_name": str | None,
           "players": [
-            {"player_id": str, "player_name": str, "position": str,
-             "score": str, "winnings": float,
-             "status": "active"|"cut"|"withdrawn"|"disqualified"},
+            Player(player_id: str, player_name: str, position: str,
+                   score: str, winnings: float,
+                   status: "active"|"cut"|"withdrawn"|"disqualified",
+                   rank: int, tied: bool, to_par: int | None),
             ...
           ],
           "event_completed": bool,     # status == "Official"
           "event_status": str,         # raw top-level status
           "winner_player_id": str | None,
           "winner_name": str | None,
+          "missing_keys": [str],       # required row keys absent (schema
+                                       # drift); [] for a board with no rows
         }
     """
-    rows = leaderboard_json.get("leaderboardRows") or []
-    earnings = earnings_by_player(earnings_json) if earnings_json else {}
-
-    players = []
-    winner_name = None
-    winner_player_id = None
-    for row in rows:
-        player_id = str(unwrap(row.get("playerId")) or "").strip()
-        name = _full_name(row)
-        if not player_id and not name:
-            continue
-        position = str(row.get("position", "") or "").strip()
-        score = str(row.get("total", "") or "").strip()
-        status = _player_status(row.get("status"), position)
-
-        # Inactive players earn nothing, regardless of a stray earnings value.
-        if position.upper() in _INACTIVE_POSITIONS or status in _INACTIVE_STATUSES:
-            winnings = 0.0
-        else:
-            winnings = earnings.get(player_id, 0.0)
-
-        # The outright leader (position "1", not "T1") is the tournament winner.
-        if position == "1" and status == "active" and winner_name is None:
-            winner_name = name
-            winner_player_id = player_id
-
-        players.append({
-            "player_id": player_id,
-            "player_name": name,
-            "position": position,
-            "score": score,
-            "winnings": winnings,
-            "status": status,
-        })
-
-    return {
-        "tournament_name": tournament_name,
-        "players": players,
-        "event_completed": is_event_official(leaderboard_json),
-        "event_status": str(unwrap(leaderboard_json.get("status")) or "").strip(),
-        "winner_player_id": winner_player_id,
-        "winner_name": winner_name,
-    }
+    return Leaderboard(leaderboard_json, earnings_json, tournament_name).results()
 
 
 # ---------------------------------------------------------------------------
@@ -326,6 +521,10 @@ def _row_thru(row):
     raw = unwrap(row.get("thru"))
     if raw is None:
         raw = unwrap(row.get("holesPlayed"))
+    return _normalize_thru(raw)
+
+
+def _normalize_thru(raw):
     if raw is None:
         return None
     value = str(raw).strip()
@@ -334,6 +533,281 @@ def _row_thru(row):
     return value or None
 
 
+# ---------------------------------------------------------------------------
+# Payload schemas
+#
+# Slash Golf's field names have drifted over time (thru/holesPlayed,
+# currentRound/round, schedule/tournaments, tournId/id), and the parsers used
+# to probe every alternative on every row. Instead, each payload's key set is
+# fingerprinted once: a known fingerprint selects a decoder that reads the
+# right keys directly, and anything unexpected is reported as drift —
+# unfamiliar keys as a heads-up, missing required keys loudly, since those are
+# what scoring reads. Unknown combinations fall back to the probing decoder,
+# so drift never stops a parse on its own; update_results gates on it.
+# ---------------------------------------------------------------------------
+class PayloadSchema:
+    """The key-set fingerprint of one payload's rows and what it implies."""
+
+    __slots__ = ("kind", "keys", "fingerprint", "unknown", "missing", "variant")
+
+    def __init__(self, kind, keys, known, required, variant):
+        self.kind = kind
+        self.keys = frozenset(keys)
+        self.fingerprint = hashlib.sha1(",".join(sorted(self.keys)).encode("utf-8")).hexdigest()[:12]
+        self.unknown = tuple(sorted(self.keys - known))
+        self.missing = tuple(sorted(required - self.keys))
+        self.variant = variant
+
+    @property
+    def drift(self):
+        return bool(self.unknown or self.missing)
+
+    def describe(self):
+        parts = []
+        if self.missing:
+            parts.append(f"missing {list(self.missing)}")
+        if self.unknown:
+            parts.append(f"new {list(self.unknown)}")
+        return f"{self.kind} schema {self.fingerprint} ({self.variant}): " + ("; ".join(parts) or "as expected")
+
+
+# Fingerprints already reported by this process; drift is printed once each.
+_REPORTED_SCHEMAS = set()
+_reported_lock = threading.Lock()
+
+
+def _report_drift(schema):
+    if not schema.drift:
+        return
+    with _reported_lock:
+        if schema.fingerprint in _REPORTED_SCHEMAS:
+            return
+        _REPORTED_SCHEMAS.add(schema.fingerprint)
+    print(f"  [slashgolf] SCHEMA DRIFT: {schema.describe()}")
+
+
+def _union_keys(dicts):
+    keys = set()
+    for d in dicts:
+        if isinstance(d, dict):
+            keys.update(d)
+    return keys
+
+
+# Leaderboard rows. Required = what scoring can't do without.
+_LEADERBOARD_ROW_REQUIRED = frozenset({"playerId", "firstName", "lastName", "position", "total", "status"})
+_LEADERBOARD_ROW_KNOWN = _LEADERBOARD_ROW_REQUIRED | {
+    "thru", "holesPlayed", "currentRound", "round", "rounds", "teeTime", "startingHole",
+    "isAmateur", "currentHole", "courseId", "currentRoundScore", "roundComplete",
+    "totalStrokesFromCompletedRounds", "middleName",
+}
+
+
+class _RowProgress:
+    """Reads a live row's thru/round from the keys its schema uses."""
+
+    __slots__ = ("thru_key", "round_key")
+
+    def __init__(self, thru_key, round_key):
+        self.thru_key = thru_key
+        self.round_key = round_key
+
+    def thru(self, row):
+        if self.thru_key is None:
+            return None
+        return _normalize_thru(unwrap(row.get(self.thru_key)))
+
+    def round(self, row):
+        return to_int(row.get(self.round_key)) if self.round_key else None
+
+
+class _ProbingRowProgress:
+    """The schema-agnostic fallback: try every known alias on every row."""
+
+    __slots__ = ()
+
+    def thru(self, row):
+        return _row_thru(row)
+
+    def round(self, row):
+        return to_int(row.get("currentRound") or row.get("round"))
+
+
+_PROBING_PROGRESS = _ProbingRowProgress()
+
+
+def _pick_alias(keys, aliases):
+    """The one alias present in ``keys``; None if none is; False if several
+    are (mixed rows — only per-row probing is safe then)."""
+    present = [a for a in aliases if a in keys]
+    if len(present) > 1:
+        return False
+    return present[0] if present else None
+
+
+def leaderboard_row_schema(rows):
+    """Fingerprint a leaderboard's rows: (PayloadSchema, progress reader).
+
+    No rows is normal before tee times are posted, so an empty board is
+    never drift: nothing is required of rows that don't exist yet."""
+    keys = _union_keys(rows)
+    thru_key = _pick_alias(keys, ("thru", "holesPlayed"))
+    round_key = _pick_alias(keys, ("currentRound", "round"))
+    if thru_key is False or round_key is False:
+        variant, progress = "mixed aliases, probing", _PROBING_PROGRESS
+    else:
+        variant = f"thru={thru_key or '-'}, round={round_key or '-'}"
+        progress = _RowProgress(thru_key, round_key)
+    required = _LEADERBOARD_ROW_REQUIRED if keys else frozenset()
+    schema = PayloadSchema("leaderboard row", keys, _LEADERBOARD_ROW_KNOWN, required, variant)
+    _report_drift(schema)
+    return schema, progress
+
+
+# ---------------------------------------------------------------------------
+# Unified leaderboard parsing
+#
+# The scorer, the live board and the field sync all read the same payload.
+# Leaderboard decodes each row's identity (playerId, name, position, score,
+# status) once, on first use, and derives each projection from that on demand:
+# a live refresh never computes winnings, a scoring run never computes thru.
+# ---------------------------------------------------------------------------
+def _decode_row(row):
+    """A payload row's identity as (player_id, name, position, score, status,
+    rank, tied, to_par, row), or None for a blank row. Shared by Leaderboard
+    and leaderboard_stream's reader so both decode a row exactly once, the
+    same way."""
+    player_id = str(unwrap(row.get("playerId")) or "").strip()
+    name = _full_name(row)
+    if not player_id and not name:
+        return None
+    position = sys.intern(str(row.get("position", "") or "").strip())
+    score = sys.intern(str(row.get("total", "") or "").strip())
+    rank, tied = decode_position(position)
+    return (player_id, name, position, score, _player_status(row.get("status"), position),
+            rank, tied, decode_to_par(score), row)
+
+
+def _scored_player(decoded, earnings):
+    player_id, name, position, score, status, rank, tied, to_par, _ = decoded
+    # Inactive players earn nothing, regardless of a stray earnings value.
+    if position.upper() in _INACTIVE_POSITIONS or status in _INACTIVE_STATUSES:
+        winnings = 0.0
+    else:
+        winnings = earnings.get(player_id, 0.0)
+    return Player(player_id, name, position, score, winnings, status, rank, tied, to_par)
+
+
+def _live_player(decoded, progress=_PROBING_PROGRESS):
+    player_id, name, position, score, status, rank, tied, to_par, row = decoded
+    return LivePlayer(
+        player_id, name, position, score, status,
+        progress.thru(row),
+        progress.round(row),
+        rank, tied, to_par,
+    )
+
+
+class Leaderboard:
+    """Lazy, single-pass view over a /leaderboard payload (plus /earnings).
+
+    Every attribute is computed on first access and kept:
+
+      rows            decoded (player_id, name, position, score, status, raw)
+      players         [Player] with winnings joined (the scoring shape)
+      live_players    [LivePlayer] (the live board); also ``field``
+      winner          (player_id, name) of the outright leader, or (None, None)
+      cut_line, event_status, round_status, event_completed, updated_ms
+
+    results() and live() assemble the dicts parse_leaderboard and
+    parse_live_leaderboard have always returned.
+    """
+
+    def __init__(self, leaderboard_json, earnings_json=None, tournament_name=None):
+        self.leaderboard_json = leaderboard_json
+        self.earnings_json = earnings_json
+        self.tournament_name = tournament_name
+
+    @cached_property
+    def _row_schema(self):
+        return leaderboard_row_schema(self.leaderboard_json.get("leaderboardRows") or [])
+
+    @property
+    def schema(self):
+        """The rows' PayloadSchema (drift is reported when first computed)."""
+        return self._row_schema[0]
+
+    @cached_property
+    def rows(self):
+        return [d for d in map(_decode_row, self.leaderboard_json.get("leaderboardRows") or []) if d]
+
+    @cached_property
+    def players(self):
+        earnings = earnings_by_player(self.earnings_json) if self.earnings_json else {}
+        return [_scored_player(d, earnings) for d in self.rows]
+
+    @cached_property
+    def live_players(self):
+        progress = self._row_schema[1]
+        return [_live_player(d, progress) for d in self.rows]
+
+    @property
+    def field(self):
+        """Entry list for sync_field: the live rows (empty = not posted yet)."""
+        return self.live_players
+
+    @cached_property
+    def winner(self):
+        # The outright leader (position "1", not "T1") is the tournament winner.
+        for player_id, name, _, _, status, rank, tied, _, _ in self.rows:
+            if rank == 1 and not tied and status == "active":
+                return player_id, name
+        return None, None
+
+    @cached_property
+    def cut_line(self):
+        return _cut_line(self.leaderboard_json)
+
+    @cached_property
+    def event_status(self):
+        return str(unwrap(self.leaderboard_json.get("status")) or "").strip()
+
+    @cached_property
+    def round_status(self):
+        return str(unwrap(self.leaderboard_json.get("roundStatus")) or "").strip()
+
+    @cached_property
+    def event_completed(self):
+        return is_event_official(self.leaderboard_json)
+
+    @cached_property
+    def updated_ms(self):
+        return to_epoch_ms(self.leaderboard_json.get("lastUpdated"))
+
+    def results(self):
+        winner_player_id, winner_name = self.winner
+        return {
+            "tournament_name": self.tournament_name,
+            "players": self.players,
+            "event_completed": self.event_completed,
+            "event_status": self.event_status,
+            "winner_player_id": winner_player_id,
+            "winner_name": winner_name,
+            "missing_keys": list(self.schema.missing),
+        }
+
+    def live(self):
+        return {
+            "tournament_name": self.tournament_name,
+            "players": self.live_players,
+            "cut_line": self.cut_line,
+            "event_status": self.event_status,
+            "round_status": self.round_status,
+            "event_completed": self.event_completed,
+            "updated_ms": self.updated_ms,
+        }
+
+
 def parse_live_leaderboard(leaderboard_json, tournament_name=None):
     """Parse an in-progress (or just-finished) leaderboard into the compact
     shape the app's live board reads.
@@ -342,8 +816,8 @@ def parse_live_leaderboard(leaderboard_json, tournament_name=None):
 
         {
           "tournament_name": str | None,
-          "players": [{"player_id", "player_name", "position", "score",
-                       "status", "thru", "round"}],
+          "players": [LivePlayer(player_id, player_name, position, score,
+                                 status, thru, round, rank, tied, to_par)],
           "cut_line": str | None,
           "event_status": str,      # raw top-level status ('In Progress'...)
           "round_status": str,
@@ -352,34 +826,10 @@ def parse_live_leaderboard(leaderboard_json, tournament_name=None):
         }
 
     Positions/scores are kept as the strings Slash Golf returns ('T4', '-7',
-    'E', 'CUT'); the app renders them verbatim. No earnings are joined here.
+    'E', 'CUT'); the app renders them verbatim, and sorts by the decoded
+    ``rank``/``to_par`` stored beside them. No earnings are joined here.
     """
-    players = []
-    for row in leaderboard_json.get("leaderboardRows") or []:
-        player_id = str(unwrap(row.get("playerId")) or "").strip()
-        name = _full_name(row)
-        if not player_id and not name:
-            continue
-        position = str(row.get("position", "") or "").strip()
-        players.append({
-            "player_id": player_id,
-            "player_name": name,
-            "position": position,
-            "score": str(row.get("total", "") or "").strip(),
-            "status": _player_status(row.get("status"), position),
-            "thru": _row_thru(row),
-            "round": to_int(row.get("currentRound") or row.get("round")),
-        })
-
-    return {
-        "tournament_name": tournament_name,
-        "players": players,
-        "cut_line": _cut_line(leaderboard_json),
-        "event_status": str(unwrap(leaderboard_json.get("status")) or "").strip(),
-        "round_status": str(unwrap(leaderboard_json.get("roundStatus")) or "").strip(),
-        "event_completed": is_event_official(leaderboard_json),
-        "updated_ms": to_epoch_ms(leaderboard_json.get("lastUpdated")),
-    }
+    return Leaderboard(leaderboard_json, tournament_name=tournament_name).live()
 
 
 # ---------------------------------------------------------------------------
@@ -397,23 +847,232 @@ def parse_schedule(schedule_json):
     carry course/location — those stay None (a /tournament detail call would be
     needed, which the sync deliberately avoids to conserve the rate budget).
     """
-    rows = schedule_json.get("schedule") or schedule_json.get("tournaments") or []
-    events = []
-    for ev in rows:
-        date = ev.get("date") or {}
-        events.append({
-            "tourn_id": str(unwrap(ev.get("tournId") or ev.get("id")) or "").strip(),
-            "name": str(ev.get("name", "") or "").strip(),
-            "week_number": to_int(date.get("weekNumber") or ev.get("weekNumber")),
-            "start_ms": to_epoch_ms(date.get("start") or ev.get("date")),
-            "end_ms": to_epoch_ms(date.get("end") or date.get("start") or ev.get("date")),
-            "purse": to_float(ev.get("purse")),
-            "winners_share": to_float(ev.get("winnersShare")),
-            "course": str(ev.get("courseName") or ev.get("course") or "").strip() or None,
-            "location": str(ev.get("location") or "").strip() or None,
-            "format": str(ev.get("format") or "").strip() or None,
-        })
-    return events
+    rows, schema = schedule_schema(schedule_json)
+    if schema.variant == _CURRENT_SCHEDULE_VARIANT:
+        return [_current_schedule_event(ev) for ev in rows]
+    return [_probed_schedule_event(ev) for ev in rows]
+
+
+# The /schedule shape in use since the 2024 season: events under "schedule",
+# "tournId" ids, and a nested date object. Only this combination takes the
+# direct decoder; anything else is read by probing every alias.
+_CURRENT_SCHEDULE_VARIANT = "schedule/tournId/nested date"
+_SCHEDULE_EVENT_REQUIRED = frozenset({"name", "date"})
+_SCHEDULE_EVENT_KNOWN = _SCHEDULE_EVENT_REQUIRED | {
+    "tournId", "id", "weekNumber", "purse", "winnersShare", "courseName", "course",
+    "location", "format", "fedexCupPoints", "orgId", "year",
+}
+# Older spellings the probing decoder still reads (id, top-level weekNumber,
+# course); any of them present rules out the direct decoder.
+_SCHEDULE_LEGACY_ALIASES = frozenset({"id", "weekNumber", "course"})
+
+
+def schedule_schema(schedule_json):
+    """Fingerprint a /schedule payload: (event rows, PayloadSchema)."""
+    container = "schedule" if schedule_json.get("schedule") else "tournaments"
+    rows = schedule_json.get(container) or []
+    keys = _union_keys(rows)
+    id_key = _pick_alias(keys, ("tournId", "id"))
+    dates = [ev.get("date") for ev in rows if isinstance(ev, dict) and ev.get("date") is not None]
+    if dates and all(isinstance(d, dict) and "start" in d for d in dates):
+        date_shape = "nested date"
+    else:
+        date_shape = "flat date"
+    if id_key is False:
+        id_key = "mixed ids"
+    variant = f"{container}/{id_key or 'no id'}/{date_shape}"
+    if keys & _SCHEDULE_LEGACY_ALIASES:
+        variant += " + legacy fields"
+    schema = PayloadSchema("schedule event", keys, _SCHEDULE_EVENT_KNOWN, _SCHEDULE_EVENT_REQUIRED, variant)
+    _report_drift(schema)
+    return rows, schema
+
+
+def _current_schedule_event(ev):
+    date = ev.get("date") or {}
+    return {
+        "tourn_id": str(unwrap(ev.get("tournId")) or "").strip(),
+        "name": str(ev.get("name", "") or "").strip(),
+        "week_number": to_int(date.get("weekNumber")),
+        "start_ms": to_epoch_ms(date.get("start")),
+        "end_ms": to_epoch_ms(date.get("end") or date.get("start")),
+        "purse": to_float(ev.get("purse")),
+        "winners_share": to_float(ev.get("winnersShare")),
+        "course": str(ev.get("courseName") or "").strip() or None,
+        "location": str(ev.get("location") or "").strip() or None,
+        "format": str(ev.get("format") or "").strip() or None,
+    }
+
+
+def _probed_schedule_event(ev):
+    date = ev.get("date") or {}
+    return {
+        "tourn_id": str(unwrap(ev.get("tournId") or ev.get("id")) or "").strip(),
+        "name": str(ev.get("name", "") or "").strip(),
+        "week_number": to_int(date.get("weekNumber") or ev.get("weekNumber")),
+        "start_ms": to_epoch_ms(date.get("start") or ev.get("date")),
+        "end_ms": to_epoch_ms(date.get("end") or date.get("start") or ev.get("date")),
+        "purse": to_float(ev.get("purse")),
+        "winners_share": to_float(ev.get("winnersShare")),
+        "course": str(ev.get("courseName") or ev.get("course") or "").strip() or None,
+        "location": str(ev.get("location") or "").strip() or None,
+        "format": str(ev.get("format") or "").strip() or None,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Season schedule index
+#
+# Mapping a DB tournament onto its Slash Golf event (resolve_tourn_id, the
+# schedule sync) used to refetch and re-parse the whole season /schedule and
+# re-normalize every event name for every lookup. The index stores the parsed
+# events once per (orgId, season), with each name's normalized and
+# initialism-collapsed forms precomputed, so a lookup is a dict hit and the
+# loose tournament_names_match rules only run as a fallback over prepared
+# strings. It lives next to the response cache, stamped with the fetched_at of
+# the /schedule entry it was built from: a lookup reuses it without touching
+# the schedule at all, and it is rebuilt only when a refresh finds a newer
+# /schedule payload than that.
+# ---------------------------------------------------------------------------
+class TournamentMatcher:
+    """Inverted token index answering tournament_names_match queries against a
+    fixed set of names without rescanning them.
+
+    Entries are ``(collapsed_name, item)`` pairs, names already normalized and
+    initialism-collapsed. Each name is split once; a query first looks at the
+    entries sharing a whole word with it, in their original order, applying
+    the same exact / substring / significant-token rules. A substring match
+    needn't share a whole word (a fragment like "ron nel"), so the entries
+    ahead of that hit — all of them on a miss — also get the substring check,
+    which keeps the answer the linear scan's first match.
+    """
+
+    def __init__(self, entries):
+        self._entries = []
+        self._exact = {}
+        self._postings = {}
+        for pos, (collapsed, item) in enumerate(entries):
+            tokens = frozenset(collapsed.split())
+            self._entries.append((collapsed, tokens, item))
+            self._exact.setdefault(collapsed, item)
+            for tok in tokens:
+                self._postings.setdefault(tok, []).append(pos)
+
+    def match(self, collapsed):
+        """The first entry (in insertion order) matching ``collapsed``, else None."""
+        if not collapsed:
+            return None
+        item = self._exact.get(collapsed)
+        if item is not None:
+            return item
+        tokens = set(collapsed.split())
+        candidates = set()
+        for tok in tokens:
+            candidates.update(self._postings.get(tok, ()))
+        significant = {t for t in tokens if len(t) > 3} - _GENERIC_TOURNAMENT_WORDS
+        hit = len(self._entries)
+        for pos in sorted(candidates):
+            name, name_tokens, _ = self._entries[pos]
+            if name in collapsed or collapsed in name or significant & name_tokens:
+                hit = pos
+                break
+        for pos in range(hit):
+            name, _, item = self._entries[pos]
+            if pos not in candidates and (name in collapsed or collapsed in name):
+                return item
+        return self._entries[hit][2] if hit < len(self._entries) else None
+
+
+class ScheduleIndex:
+    """Parsed season schedule with O(1) name lookups.
+
+    ``events`` are parse_schedule dicts (only those with a tournId), each
+    carrying extra ``norm`` and ``collapsed`` keys.
+    """
+
+    def __init__(self, events, version=None):
+        self.events = events
+        self.version = version
+        self.by_tourn_id = {}
+        self._by_norm = {}
+        self._by_collapsed = {}
+        for ev in events:
+            self.by_tourn_id.setdefault(ev["tourn_id"], ev)
+            self._by_norm.setdefault(ev["norm"], ev)
+            self._by_collapsed.setdefault(ev["collapsed"], ev)
+        self._matcher = TournamentMatcher((ev["collapsed"], ev) for ev in events if ev["collapsed"])
+
+    @classmethod
+    def from_schedule(cls, schedule_json, version=None):
+        events = []
+        for ev in parse_schedule(schedule_json):
+            if not ev["tourn_id"]:
+                continue
+            norm = normalize_name(ev["name"])
+            events.append(dict(ev, norm=norm, collapsed=_collapse_initialisms(norm)))
+        return cls(events, version)
+
+    def match(self, name, loose=True):
+        """The schedule event for a tournament name: exact normalized, then
+        exact collapsed, then (with ``loose``) the tournament_names_match
+        rules."""
+        norm = normalize_name(name)
+        ev = self._by_norm.get(norm)
+        if ev:
+            return ev
+        collapsed = _collapse_initialisms(norm)
+        if not loose:
+            return self._by_collapsed.get(collapsed) if collapsed else None
+        return self._matcher.match(collapsed)
+
+
+# Indexes this process has already loaded, by (orgId, year), with whether
+# each was checked against /schedule. A run that maps many weeks loads a
+# season once and refreshes it at most once, even with --no-cache (where
+# nothing persisted is read).
+_loaded_indexes = {}
+
+
+def load_schedule_index(year, org_id=DEFAULT_ORG_ID, refresh=False):
+    """The season's ScheduleIndex.
+
+    The persisted index is used as is when there is one — no fetch, no
+    schedule payload decoded — since a season's event list barely changes.
+    ``refresh`` (a lookup missed, or the schedule sync wants current purses
+    and new events) loads /schedule through the response cache and rebuilds
+    only when that payload's fetched_at differs from the index's version.
+    """
+    key = (str(org_id), str(year))
+    index, refreshed = _loaded_indexes.get(key, (None, False))
+    if index is not None and (refreshed or not refresh):
+        return index
+
+    index_file = _cache_path("/schedule-index", org_id, None, year)
+    if index is None and CACHE_ENABLED:
+        try:
+            with open(index_file, encoding="utf-8") as fh:
+                stored = json.load(fh)
+            index = ScheduleIndex(stored["events"], stored["version"])
+        except (OSError, ValueError, KeyError):
+            index = None
+        if index is not None and not refresh:
+            _loaded_indexes[key] = (index, False)
+            return index
+
+    entry = _fetch_entry("/schedule", org_id, year)
+    if index is None or index.version != entry["fetched_at"]:
+        index = ScheduleIndex.from_schedule(entry["payload"], entry["fetched_at"])
+        if CACHE_ENABLED:
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                tmp = index_file + ".tmp"
+                with open(tmp, "w", encoding="utf-8") as fh:
+                    json.dump({"version": index.version, "events": index.events}, fh, separators=(",", ":"))
+                os.replace(tmp, index_file)
+            except OSError as exc:
+                print(f"  [slashgolf] (schedule index not persisted: {exc})")
+    _loaded_indexes[key] = (index, True)
+    return index
 
 
 # ---------------------------------------------------------------------------
@@ -428,15 +1087,215 @@ def _headers():
     return {"x-rapidapi-key": RAPIDAPI_KEY, "x-rapidapi-host": RAPIDAPI_HOST}
 
 
+# One pooled, keep-alive session per process, so a run's calls (leaderboard +
+# earnings, the schedule lookup in resolve_tourn_id, ...) share a single
+# TCP+TLS connection instead of paying a fresh handshake each time.
+_session = None
+
+# Transient failures worth retrying: gateway/server errors and dropped or
+# timed-out connections. Anything else (4xx) is a real answer and fails fast.
+_RETRY_STATUSES = {500, 502, 503, 504}
+MAX_RETRIES = int(os.getenv("SLASHGOLF_MAX_RETRIES", "3"))
+BACKOFF_BASE_S = 1.0
+BACKOFF_CAP_S = 20.0
+# Longest 429 Retry-After we're willing to sleep through. A short wait is a
+# per-second burst limit; a long one means the daily quota is spent, and
+# sleeping for hours inside a cron job helps nobody — fail with the usual
+# rate-limit error instead.
+MAX_RETRY_AFTER_S = 60.0
+
+# Per-call diagnostics for the current process: one dict per _get, with
+# path, final status, wall latency (including retries) and retry count.
+CALL_LOG = []
+
+# Optional cross-job API budget (api_budget.Budget, installed by each job's
+# CLI). None means unmetered — the pure-module default for tests and ad-hoc
+# use. Only real network calls consult it; cache hits are free.
+_budget = None
+
+
+class BudgetDeferred(RuntimeError):
+    """A call was refused because the remaining API budget is reserved for a
+    higher-priority job (the Monday scorer). Jobs treat it as 'try later'."""
+
+
+def set_budget(budget):
+    """Meter every network call against ``budget`` (an object with
+    ``acquire(path)`` and ``record(path, calls)``), or None to stop."""
+    global _budget
+    _budget = budget
+
+
+def _get_session():
+    global _session
+    if _session is None:
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=8))
+        _session = session
+    return _session
+
+
+def _backoff_delay(attempt):
+    """Full-jitter exponential backoff: uniform in [0, base * 2^attempt],
+    capped, so parallel retries don't stampede the API in lockstep."""
+    return random.uniform(0, min(BACKOFF_CAP_S, BACKOFF_BASE_S * (2 ** attempt)))
+
+
+def _retry_after_s(resp):
+    """Seconds a 429 asks us to wait (delta-seconds or HTTP-date form), or
+    None if the header is absent or unparseable."""
+    raw = resp.headers.get("Retry-After")
+    if not raw:
+        return None
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(raw).timestamp() - time.time())
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _record_call(path, status, started, retries):
+    if _budget is not None:
+        # Every attempt counts against the RapidAPI quota, retries included.
+        _budget.record(path, retries + 1)
+    latency_ms = (time.monotonic() - started) * 1000
+    CALL_LOG.append({"path": path, "status": status, "latency_ms": latency_ms, "retries": retries})
+    retry_note = f", {retries} retr{'y' if retries == 1 else 'ies'}" if retries else ""
+    print(f"  [slashgolf] GET {path} -> {status} in {latency_ms:.0f} ms{retry_note}")
+
+
+def call_stats():
+    """Totals over CALL_LOG: ``{"calls", "retries", "latency_ms"}``."""
+    return {
+        "calls": len(CALL_LOG),
+        "retries": sum(c["retries"] for c in CALL_LOG),
+        "latency_ms": sum(c["latency_ms"] for c in CALL_LOG),
+    }
+
+
+def _send(path, url, params):
+    """Issue the GET on the pooled session, retrying transient failures.
+
+    5xx responses and connection errors/timeouts back off exponentially with
+    jitter; a 429 is retried only when its Retry-After is short enough to be
+    a burst limit. Returns the final response (which may still be an error
+    for _get to classify); re-raises the last connection error if retries run
+    out. Every exit settles the budget reservation _checked_response took."""
+    try:
+        headers = _headers()
+    except RuntimeError:
+        if _budget is not None:
+            _budget.record(path, 0)  # nothing went out: refund the reservation
+        raise
+    session = _get_session()
+    started = time.monotonic()
+    retries = 0
+    while True:
+        try:
+            resp = session.get(url, headers=headers, params=params, timeout=30)
+        except requests.RequestException as exc:
+            transient = isinstance(exc, (requests.ConnectionError, requests.Timeout))
+            if not transient or retries >= MAX_RETRIES:
+                _record_call(path, type(exc).__name__, started, retries)
+                raise
+            retries += 1
+            time.sleep(_backoff_delay(retries))
+            continue
+
+        if retries < MAX_RETRIES:
+            if resp.status_code in _RETRY_STATUSES:
+                resp.close()
+                retries += 1
+                time.sleep(_backoff_delay(retries))
+                continue
+            if resp.status_code == 429:
+                wait = _retry_after_s(resp)
+                if wait is not None and wait <= MAX_RETRY_AFTER_S:
+                    resp.close()
+                    retries += 1
+                    time.sleep(wait)
+                    continue
+
+        _record_call(path, resp.status_code, started, retries)
+        return resp
+
+
+# Record/replay cassettes. With SLASHGOLF_CASSETTE=record every successful
+# response body is also saved, gzipped, under CASSETTE_DIR keyed by endpoint +
+# params; with SLASHGOLF_CASSETTE=replay _get serves those files and never
+# touches the network (or the budget). Whole pipelines can then be re-run,
+# profiled and benchmarked offline against real payloads.
+CASSETTE_MODE = os.getenv("SLASHGOLF_CASSETTE") or None
+CASSETTE_DIR = os.getenv("SLASHGOLF_CASSETTE_DIR") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".cassettes"
+)
+_CASSETTE_MODES = (None, "record", "replay")
+
+
+def set_cassette_mode(mode, directory=None):
+    """Switch cassette recording/replay on (``"record"``/``"replay"``) or off
+    (None) for this process, optionally pointing at another directory."""
+    global CASSETTE_MODE, CASSETTE_DIR
+    if mode not in _CASSETTE_MODES:
+        raise ValueError(f"cassette mode must be one of {_CASSETTE_MODES}, not {mode!r}")
+    CASSETTE_MODE = mode
+    if directory:
+        CASSETTE_DIR = directory
+
+
+def _cassette_path(path, params):
+    key = "_".join(f"{k}-{params[k]}" for k in sorted(params))
+    safe = re.sub(r"[^A-Za-z0-9._-]", "", path.strip("/") + "__" + key)
+    return os.path.join(CASSETTE_DIR, safe + ".json.gz")
+
+
+def _cassette_save(path, params, body):
+    os.makedirs(CASSETTE_DIR, exist_ok=True)
+    with gzip.open(_cassette_path(path, params), "wb") as fh:
+        fh.write(body)
+
+
+def _cassette_load(path, params):
+    cassette = _cassette_path(path, params)
+    try:
+        with gzip.open(cassette, "rb") as fh:
+            body = fh.read()
+    except FileNotFoundError:
+        raise RuntimeError(
+            f"No recorded Slash Golf response for GET {path} {params} in "
+            f"{CASSETTE_DIR} (replay mode never calls the network). Record one "
+            "first with SLASHGOLF_CASSETTE=record."
+        ) from None
+    print(f"  [slashgolf] GET {path} replayed from {os.path.basename(cassette)}")
+    return decode_payload(body)
+
+
 def _get(path, params):
-    """GET a Slash Golf endpoint, raising informative errors that distinguish
-    a sandbox egress block from a real RapidAPI rejection or a rate limit."""
+    """GET a Slash Golf endpoint and decode the body."""
+    if CASSETTE_MODE == "replay":
+        return _cassette_load(path, params)
+    resp = _checked_response(path, params)
+    if CASSETTE_MODE == "record":
+        _cassette_save(path, params, resp.content)
+    return decode_payload(resp.content)
+
+
+def _checked_response(path, params):
+    """A metered, retried GET whose response is a 2xx, raising informative
+    errors that distinguish a sandbox egress block from a real RapidAPI
+    rejection or a rate limit."""
     url = f"https://{RAPIDAPI_HOST}{path}"
-    resp = requests.get(url, headers=_headers(), params=params, timeout=30)
+    if _budget is not None:
+        _budget.acquire(path)
+    resp = _send(path, url, params)
     # A managed environment's network proxy returns a plain "Host not in
     # allowlist" 403 before the request leaves the container; the key is
-    # never tested in that case.
-    if "allowlist" in resp.text.lower():
+    # never tested in that case. (Only error bodies are scanned — a 200
+    # leaderboard is megabytes of JSON.)
+    if resp.status_code >= 400 and "allowlist" in resp.text.lower():
         raise RuntimeError(
             f"Slash Golf call to {RAPIDAPI_HOST} was blocked by this "
             f"environment's network allowlist (status {resp.status_code}); the "
@@ -448,36 +1307,273 @@ def _get(path, params):
             f"not subscribed to Live Golf Data. Body: {resp.text[:200]}"
         )
     if resp.status_code == 429:
-        raise RuntimeError("Slash Golf rate-limited (429). Free tier is 20 req/day.")
+        raise RuntimeError(
+            "Slash Golf rate-limited (429). Free tier is 20 req/day. "
+            "Check spend with: python api_budget.py"
+        )
     resp.raise_for_status()
-    return resp.json()
+    return resp
+
+
+# ---------------------------------------------------------------------------
+# Persistent response cache
+#
+# The free tier is ~20 requests/day, yet the schedule sync, field sync, live
+# updater and Monday scorer each want the same few payloads. Every fetch_*
+# goes through an on-disk cache keyed by (endpoint, orgId, tournId, year), so
+# a repeated or manually re-run job costs zero API calls. In GitHub Actions the
+# directory is carried between runs by actions/cache.
+#
+# TTLs are per endpoint: the season schedule barely changes; a live
+# leaderboard must stay fresh; and once a leaderboard is Official its payload
+# (and the matching /earnings) is final, so it never expires. The directory is
+# bounded by size, evicting least-recently-written entries first. --no-cache
+# (or SLASHGOLF_NO_CACHE=1) bypasses it entirely, reads and writes.
+# ---------------------------------------------------------------------------
+CACHE_DIR = os.getenv("SLASHGOLF_CACHE_DIR") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".cache", "slashgolf"
+)
+CACHE_ENABLED = not os.getenv("SLASHGOLF_NO_CACHE")
+CACHE_MAX_BYTES = int(os.getenv("SLASHGOLF_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+CACHE_TTL_S = {
+    "/schedule": 24 * 3600,
+    "/leaderboard": 10 * 60,
+    "/earnings": 10 * 60,
+}
+
+
+def disable_cache():
+    """Bypass the response cache for this process (the ``--no-cache`` flag)."""
+    global CACHE_ENABLED
+    CACHE_ENABLED = False
+
+
+def _cache_path(path, org_id, tourn_id, year):
+    parts = [path.strip("/"), str(org_id), str(tourn_id or "-"), str(year)]
+    safe = "_".join(re.sub(r"[^A-Za-z0-9.-]", "", p) or "-" for p in parts)
+    return os.path.join(CACHE_DIR, safe + ".json")
+
+
+def _cache_read(cache_file):
+    """The cached payload if present and unexpired, else None."""
+    try:
+        with open(cache_file, "rb") as fh:
+            entry = decode_payload(fh.read())
+    except (OSError, ValueError):  # orjson's decode error is a ValueError too
+        return None
+    expires_at = entry.get("expires_at")
+    if expires_at is not None and expires_at <= time.time():
+        return None
+    return entry
+
+
+def _cache_write(cache_file, path, payload, permanent, fetched_at=None):
+    """Store a payload, then evict oldest entries past CACHE_MAX_BYTES. Cache
+    failures never fail the job — the payload is already in hand."""
+    ttl = CACHE_TTL_S.get(path, 0)
+    now = time.time() if fetched_at is None else fetched_at
+    entry = {
+        "fetched_at": now,
+        "expires_at": None if permanent else now + ttl,
+        "payload": payload,
+    }
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = cache_file + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(entry, fh, separators=(",", ":"))
+        os.replace(tmp, cache_file)
+        _cache_evict()
+    except OSError as exc:
+        print(f"  [slashgolf] (cache write skipped: {exc})")
+
+
+def _cache_evict():
+    entries = []
+    for name in os.listdir(CACHE_DIR):
+        if not name.endswith(".json"):
+            continue
+        full = os.path.join(CACHE_DIR, name)
+        st = os.stat(full)
+        entries.append((st.st_mtime, st.st_size, full))
+    total = sum(size for _, size, _ in entries)
+    for _, size, full in sorted(entries):
+        if total <= CACHE_MAX_BYTES:
+            break
+        os.remove(full)
+        total -= size
+
+
+def _cache_pin(path, org_id, tourn_id, year):
+    """Make an existing cache entry permanent (used once its event is known
+    to be Official, when the entry was written before that was known)."""
+    cache_file = _cache_path(path, org_id, tourn_id, year)
+    entry = _cache_read(cache_file)
+    if entry is None or entry["expires_at"] is None:
+        return
+    if path == "/earnings" and not _has_earnings(entry["payload"]):
+        return
+    _cache_write(cache_file, path, entry["payload"], permanent=True, fetched_at=entry["fetched_at"])
+
+
+def _cache_write_is_permanent(path, payload, org_id, tourn_id, year):
+    if path == "/leaderboard":
+        return is_event_official(payload)
+    if path == "/earnings":
+        # Earnings carry no status; they're final once the same event's
+        # leaderboard is — and once money has actually posted (an all-$0
+        # payload fetched right at 'Official' must stay refetchable). When
+        # both are fetched concurrently the leaderboard may not be cached
+        # yet, so get_tournament_results pins the earnings afterwards.
+        lb = _cache_read(_cache_path("/leaderboard", org_id, tourn_id, year))
+        return bool(lb) and lb["expires_at"] is None and _has_earnings(payload)
+    return False
+
+
+def _has_earnings(earnings_json):
+    return any(v > 0 for v in earnings_by_player(earnings_json).values())
+
+
+# Single-flight: concurrent callers asking for the same payload (e.g. the
+# field and live projections fetched from parallel threads) share one
+# in-flight request instead of each spending a call before the cache fills.
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def _fetch(path, org_id, year, tourn_id=None):
+    """Cached, single-flight GET of one endpoint. Params keep the API's own
+    names/order."""
+    return _fetch_entry(path, org_id, year, tourn_id)["payload"]
+
+
+def _fetch_entry(path, org_id, year, tourn_id=None):
+    """_fetch, returning ``{"fetched_at", "payload"}`` — when the payload
+    left the API, whether or not it was served from the cache."""
+    cache_file = _cache_path(path, org_id, tourn_id, year)
+    with _inflight_lock:
+        pending = _inflight.get(cache_file)
+        leader = pending is None
+        if leader:
+            pending = _inflight[cache_file] = Future()
+    if not leader:
+        return pending.result()
+
+    try:
+        entry = _fetch_uncoalesced(path, org_id, year, tourn_id, cache_file)
+    except BaseException as exc:
+        pending.set_exception(exc)
+        raise
+    else:
+        pending.set_result(entry)
+        return entry
+    finally:
+        with _inflight_lock:
+            _inflight.pop(cache_file, None)
+
+
+def _fetch_uncoalesced(path, org_id, year, tourn_id, cache_file):
+    params = {"orgId": org_id}
+    if tourn_id is not None:
+        params["tournId"] = tourn_id
+    params["year"] = year
+
+    if CACHE_ENABLED:
+        entry = _cache_read(cache_file)
+        if entry is not None:
+            print(f"  [slashgolf] GET {path} served from cache (tournId={tourn_id}, year={year})")
+            return entry
+
+    entry = {"fetched_at": time.time(), "payload": _get(path, params)}
+
+    if CACHE_ENABLED:
+        permanent = _cache_write_is_permanent(path, entry["payload"], org_id, tourn_id, year)
+        _cache_write(cache_file, path, entry["payload"], permanent, entry["fetched_at"])
+    return entry
 
 
 def fetch_schedule(year, org_id=DEFAULT_ORG_ID):
-    return _get("/schedule", {"orgId": org_id, "year": year})
+    return _fetch("/schedule", org_id, year)
 
 
 def fetch_leaderboard(tourn_id, year, org_id=DEFAULT_ORG_ID):
-    return _get("/leaderboard", {"orgId": org_id, "tournId": tourn_id, "year": year})
+    return _fetch("/leaderboard", org_id, year, tourn_id)
 
 
 def fetch_earnings(tourn_id, year, org_id=DEFAULT_ORG_ID):
-    return _get("/earnings", {"orgId": org_id, "tournId": tourn_id, "year": year})
+    return _fetch("/earnings", org_id, year, tourn_id)
+
+
+def fetch_concurrently(calls, max_workers=MAX_CONCURRENCY):
+    """Run independent fetches at once and return their results in order.
+
+    ``calls`` is a list of ``(fn, args)`` tuples, e.g.
+    ``[(fetch_leaderboard, (tid, year)), (fetch_earnings, (tid, year))]``.
+    Threads, not asyncio, because the work is blocking ``requests`` I/O on the
+    shared pooled session; the first exception (including BudgetDeferred) is
+    re-raised once every call has finished.
+    """
+    if len(calls) <= 1:
+        return [fn(*args) for fn, args in calls]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as pool:
+        futures = [pool.submit(fn, *args) for fn, args in calls]
+        return [f.result() for f in futures]
 
 
 def get_tournament_results(tourn_id, year, org_id=DEFAULT_ORG_ID, tournament_name=None):
     """High-level: fetch leaderboard + earnings for an event and return the
-    parsed scoring shape. Two API calls (leaderboard, earnings)."""
-    leaderboard = fetch_leaderboard(tourn_id, year, org_id)
-    earnings = fetch_earnings(tourn_id, year, org_id)
+    parsed scoring shape. Two API calls (leaderboard, earnings), issued
+    concurrently — they're independent until parse_leaderboard joins them."""
+    leaderboard, earnings = fetch_concurrently([
+        (fetch_leaderboard, (tourn_id, year, org_id)),
+        (fetch_earnings, (tourn_id, year, org_id)),
+    ])
+    return tournament_results(leaderboard, earnings, tourn_id, year, org_id, tournament_name)
+
+
+def tournament_results(leaderboard, earnings, tourn_id, year, org_id=DEFAULT_ORG_ID, tournament_name=None):
+    """The parsed scoring shape from an event's already-fetched leaderboard
+    and earnings (for callers batching many events' fetches themselves).
+    Pins the cached earnings once the leaderboard shows the event Official."""
+    if CACHE_ENABLED and is_event_official(leaderboard):
+        _cache_pin("/earnings", org_id, tourn_id, year)
     return parse_leaderboard(leaderboard, earnings, tournament_name=tournament_name)
 
 
+def ingest_leaderboard(tourn_id, year, org_id=DEFAULT_ORG_ID, tournament_name=None):
+    """Fetch an event's leaderboard ONCE and derive both pre-results views of
+    it: the field entry list (sync_field) and the live snapshot
+    (update_leaderboard). Scoring fetches through get_tournament_results,
+    which issues /leaderboard and /earnings together.
+
+    The sharing is per process (the fetch is single-flight and cached): one
+    run that needs both views, or several threads asking for the same event,
+    pay for one call. Across jobs only the response cache applies, and a live
+    board is cached for CACHE_TTL_S["/leaderboard"] — the field sync (Tue/Wed)
+    and the live updater (Thu night on) never run within that window of each
+    other, and a longer pre-event TTL would serve the next field sync a stale,
+    often still empty, entry list.
+
+    Returns::
+
+        {
+          "live": <parse_live_leaderboard shape>,
+          "field": [...],              # the live players; empty = not posted
+          "event_completed": bool,
+        }
+    """
+    board = Leaderboard(fetch_leaderboard(tourn_id, year, org_id), tournament_name=tournament_name)
+    return {
+        "live": board.live(),
+        "field": board.field,
+        "event_completed": board.event_completed,
+    }
+
+
 def get_live_leaderboard(tourn_id, year, org_id=DEFAULT_ORG_ID, tournament_name=None):
     """High-level: fetch ONLY the leaderboard for an event and return the live
     parsed shape. One API call (no earnings) — for the in-event live board."""
-    leaderboard = fetch_leaderboard(tourn_id, year, org_id)
-    return parse_live_leaderboard(leaderboard, tournament_name=tournament_name)
+    return ingest_leaderboard(tourn_id, year, org_id, tournament_name=tournament_name)["live"]
 
 
 def fetch_field(tourn_id, year, org_id=DEFAULT_ORG_ID):
@@ -485,5 +1581,33 @@ def fetch_field(tourn_id, year, org_id=DEFAULT_ORG_ID):
     leaderboard endpoint once tee times are posted (typically Tue/Wed); before
     that the rows are empty. Returns the parsed live shape; callers treat an
     empty player list as 'field not confirmed yet'."""
-    leaderboard = fetch_leaderboard(tourn_id, year, org_id)
-    return parse_live_leaderboard(leaderboard)
+    return ingest_leaderboard(tourn_id, year, org_id)["live"]
+
+
+# ---------------------------------------------------------------------------
+# Async variants
+#
+# Thin asyncio wrappers for callers that already run an event loop (e.g.
+# fetching several events at once). Each runs the blocking fetch in a worker
+# thread, so caching, budget metering and retries behave exactly as in the
+# sync path.
+# ---------------------------------------------------------------------------
+async def fetch_schedule_async(year, org_id=DEFAULT_ORG_ID):
+    return await asyncio.to_thread(fetch_schedule, year, org_id)
+
+
+async def fetch_leaderboard_async(tourn_id, year, org_id=DEFAULT_ORG_ID):
+    return await asyncio.to_thread(fetch_leaderboard, tourn_id, year, org_id)
+
+
+async def fetch_earnings_async(tourn_id, year, org_id=DEFAULT_ORG_ID):
+    return await asyncio.to_thread(fetch_earnings, tourn_id, year, org_id)
+
+
+async def get_tournament_results_async(tourn_id, year, org_id=DEFAULT_ORG_ID, tournament_name=None):
+    """Async get_tournament_results: both calls in flight together."""
+    leaderboard, earnings = await asyncio.gather(
+        fetch_leaderboard_async(tourn_id, year, org_id),
+        fetch_earnings_async(tourn_id, year, org_id),
+    )
+    return tournament_results(leaderboard, earnings, tourn_id, year, org_id, tournament_name)
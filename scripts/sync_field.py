@@ -13,29 +13,32 @@ matches a field entry (so the Monday scorer gets an exact join) and opportunis-
 tically backfills available_golfers.golfer_id — both free, since the field is
 the same payload.
 
-Which week is driven by OUR schedule: the earliest non-completed tournament.
+Which week is driven by OUR schedule: the earliest non-completed tournament,
+per tour when ORG_IDS lists several (their fields are fetched concurrently; a
+tour whose fetch is deferred or fails is skipped without losing the others).
 
 Usage:
     python sync_field.py            # dry run, prints a preview
     python sync_field.py --apply    # store the field + attach ids
+    python sync_field.py --no-cache # bypass the Slash Golf response cache
+    python sync_field.py --orgs 1,2 # every tour's current event (default: ORG_IDS)
 """
 
 import sys
 from datetime import datetime, timezone
 
+import api_budget
 import slashgolf
-from golf_common import get_supabase_client
+from golf_common import get_supabase_client, paginate
 from slashgolf import normalize_name
 # Reuse the scorer's event mapping + id backfill, and the live updater's
 # schedule-driven tournament selection.
 from update_results import (
-    resolve_tourn_id,
+    tournament_org_id,
     tournament_season_year,
     backfill_available_golfer_ids,
 )
-from update_leaderboard import get_current_tournament
-
-ORG_ID = slashgolf.DEFAULT_ORG_ID
+from update_leaderboard import get_current_tournaments, ingest_targets, report_ingest_error, resolve_targets
 
 
 def replace_field(supabase, tournament_id, players):
@@ -67,14 +70,9 @@ def attach_golfer_ids_to_picks(supabase, tournament_id, players):
         if pid:
             by_norm.setdefault(normalize_name(p.get("player_name", "")), pid)
 
-    picks = (
-        supabase.table("picks")
-        .select("id, golfer_name, golfer_id")
-        .eq("tournament_id", tournament_id)
-        .execute()
-        .data
-        or []
-    )
+    picks = list(paginate(
+        lambda: supabase.table("picks").select("id, golfer_name, golfer_id").eq("tournament_id", tournament_id)
+    ))
     filled = 0
     for pick in picks:
         if pick.get("golfer_id"):
@@ -89,54 +87,72 @@ def attach_golfer_ids_to_picks(supabase, tournament_id, players):
     return filled
 
 
-def sync_field(dry_run=True):
+def sync_field(dry_run=True, org_ids=None):
+    """Sync every tour's current field. Returns False if any tour's fetch
+    failed (the others are still synced), True otherwise."""
     print("=" * 50)
     print("Golf League Field Sync (Slash Golf)")
     print("=" * 50)
 
     supabase = get_supabase_client()
-    tournament = get_current_tournament(supabase)
-    if not tournament:
+    tournaments = get_current_tournaments(supabase, org_ids)
+    if not tournaments:
         print("No active tournament (everything is scored). Nothing to do.")
-        return
+        return True
 
-    year = tournament_season_year(tournament)
-    print(f"Active tournament: '{tournament['name']}' (Week {tournament['week']}, season {year})")
+    for t in tournaments:
+        print(f"Active tournament: '{t['name']}' (Week {t['week']}, season {tournament_season_year(t)}, "
+              f"orgId {tournament_org_id(t)})")
 
-    tourn_id = resolve_tourn_id(tournament, year)
-    if not tourn_id:
-        print("Could not map this tournament to a Slash Golf event; skipping.")
-        return
+    targets = resolve_targets(tournaments, org_ids)
+    failed = 0
+    for (tournament, _, _, _), ingest in zip(targets, ingest_targets(targets)):
+        if isinstance(ingest, Exception):
+            failed += report_ingest_error(tournament, ingest)
+            continue
+        players = ingest["field"]
+        print(f"\n'{tournament['name']}': field size from Slash Golf: {len(players)}")
 
-    parsed = slashgolf.fetch_field(tourn_id, year, ORG_ID)
-    players = parsed["players"]
-    print(f"Field size from Slash Golf: {len(players)}")
+        if not players:
+            print("Field not confirmed yet (no entrants posted). Nothing to store.")
+            continue
 
-    if not players:
-        print("Field not confirmed yet (no entrants posted). Nothing to store.")
-        return
+        if dry_run:
+            for p in players[:12]:
+                print(f"  {p['player_name']:<26} (id={p['player_id']})")
+            if len(players) > 12:
+                print(f"  ... and {len(players) - 12} more")
+            continue
 
-    if dry_run:
-        for p in players[:12]:
-            print(f"  {p['player_name']:<26} (id={p['player_id']})")
-        if len(players) > 12:
-            print(f"  ... and {len(players) - 12} more")
-        print("\n[DRY RUN] No changes made. Run with --apply to store the field.")
-        return
+        n = replace_field(supabase, tournament["id"], players)
+        print(f"Stored {n} field entries.")
 
-    n = replace_field(supabase, tournament["id"], players)
-    print(f"Stored {n} field entries.")
+        filled = attach_golfer_ids_to_picks(supabase, tournament["id"], players)
+        if filled:
+            print(f"Attached golfer_id to {filled} pick(s) from the field.")
 
-    filled = attach_golfer_ids_to_picks(supabase, tournament["id"], players)
-    if filled:
-        print(f"Attached golfer_id to {filled} pick(s) from the field.")
+        backfill_available_golfer_ids(supabase, players)
 
-    backfill_available_golfer_ids(supabase, players)
+    if dry_run:
+        print("\n[DRY RUN] No changes made. Run with --apply to store the field.")
+        return not failed
     print("Done!")
+    return not failed
 
 
 if __name__ == "__main__":
     dry_run = "--apply" not in sys.argv
+    if "--no-cache" in sys.argv:
+        slashgolf.disable_cache()
+    slashgolf.set_budget(api_budget.Budget("sync_field", "low"))
     if dry_run:
         print("Running in DRY RUN mode (no DB writes). Use --apply to store.\n")
-    sync_field(dry_run=dry_run)
+    ok = True
+    try:
+        ok = sync_field(dry_run=dry_run, org_ids=slashgolf.org_ids_from_args(sys.argv))
+    except slashgolf.BudgetDeferred as exc:
+        # The field is advisory — skip this run rather than eat into quota the
+        # scorer needs; the next Tue/Wed slot re-syncs it.
+        print(f"\nDeferred: {exc}")
+    if not ok:
+        sys.exit(1)  # a tour's fetch failed: go red so someone looks
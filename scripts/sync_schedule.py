@@ -18,68 +18,69 @@ Usage:
     python sync_schedule.py --year 2026     # dry run, explicit season
     python sync_schedule.py --apply         # write tournId + purse onto matches
     python sync_schedule.py --apply --create  # also insert unmatched events
+    python sync_schedule.py --no-cache      # refetch /schedule, bypassing the cache
+    python sync_schedule.py --orgs 1,2      # map against several tours (default: ORG_IDS)
 """
 
 import sys
 from datetime import datetime, timezone
 
+import api_budget
 import slashgolf
-from golf_common import get_supabase_client
-from slashgolf import normalize_name, tournament_names_match
-
-ORG_ID = slashgolf.DEFAULT_ORG_ID
-
-
-def _iso(ms):
-    if not ms:
-        return None
-    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).isoformat()
-
-
-def _year_of(tournament):
-    date_str = tournament.get("tournament_date")
-    if date_str:
-        try:
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00")).year
-        except ValueError:
-            return None
-    return None
-
-
-def match_event(tournament, events, by_norm):
-    """Find the schedule event for a DB tournament: exact normalized name
-    first, then the looser tournament_names_match."""
-    ev = by_norm.get(normalize_name(tournament["name"]))
-    if ev:
-        return ev
-    return next((e for e in events if tournament_names_match(e["name"], tournament["name"])), None)
-
-
-def sync_schedule(year, apply=False, create=False):
+from golf_common import get_supabase_client, paginate
+from tournaments import format_epoch_ms, tournament_records
+from update_results import tournament_org_id
+
+
+def match_event(tournament, indexes):
+    """Find the schedule event for a DB tournament across the season's
+    ScheduleIndex per tour (``{org_id: index}``): the tournament's own tour
+    first (exact normalized name, then the looser tournament_names_match),
+    then the others in order on an exact name only — one shared word with
+    another tour's event must not repoint the row at that tour. Returns
+    ``(org_id, event)`` or ``(None, None)``."""
+    own = tournament_org_id(tournament)
+    for org_id in sorted(indexes, key=lambda o: o != own):
+        ev = indexes[org_id].match(tournament["name"], loose=org_id == own)
+        if ev:
+            return org_id, ev
+    return None, None
+
+
+def sync_schedule(year, apply=False, create=False, org_ids=None):
     supabase = get_supabase_client()
 
-    events = [e for e in slashgolf.parse_schedule(slashgolf.fetch_schedule(year, ORG_ID)) if e["tourn_id"]]
-    by_norm = {}
-    for e in events:
-        by_norm.setdefault(normalize_name(e["name"]), e)
-    print(f"Slash Golf schedule: {len(events)} events for season {year}")
-
-    db = supabase.table("tournaments").select("*").execute().data or []
-    db_this_year = [t for t in db if _year_of(t) in (int(year), None)]
+    org_ids = org_ids or slashgolf.ORG_IDS
+    # One /schedule per tour, fetched concurrently (each is normally a cache
+    # hit anyway). Refreshed, unlike a scorer's lookup: the sync is what picks
+    # up new events and purses.
+    indexes = dict(zip(org_ids, slashgolf.fetch_concurrently(
+        [(slashgolf.load_schedule_index, (year, org_id, True)) for org_id in org_ids]
+    )))
+    for org_id, index in indexes.items():
+        print(f"Slash Golf schedule: {len(index.events)} events for season {year} (orgId {org_id})")
+
+    db = tournament_records(paginate(lambda: supabase.table("tournaments").select("*")))
+    db_this_year = [t for t in db if t.season in (int(year), None)]
     print(f"DB tournaments in scope: {len(db_this_year)}")
 
-    existing_ids = {str(t["slashgolf_tourn_id"]) for t in db if t.get("slashgolf_tourn_id")}
+    # tournIds are only unique within a tour, so events are keyed by both.
+    existing_ids = {(tournament_org_id(t), str(t["slashgolf_tourn_id"])) for t in db if t.get("slashgolf_tourn_id")}
     matched_event_ids = set()
     updates = []  # (tournament, event, changes)
 
     for t in db_this_year:
-        ev = match_event(t, events, by_norm)
+        org_id, ev = match_event(t, indexes)
         if not ev:
             continue
-        matched_event_ids.add(ev["tourn_id"])
+        matched_event_ids.add((org_id, ev["tourn_id"]))
         changes = {}
         if str(t.get("slashgolf_tourn_id") or "") != ev["tourn_id"]:
             changes["slashgolf_tourn_id"] = ev["tourn_id"]
+        # Only written when it differs from the row's effective tour, so a
+        # single-tour league never needs the slashgolf_org_id column.
+        if org_id != tournament_org_id(t):
+            changes["slashgolf_org_id"] = org_id
         purse = int(ev["purse"]) if ev["purse"] else 0
         if purse and purse != int(t.get("prize_pool") or 0):
             changes["prize_pool"] = purse
@@ -100,25 +101,30 @@ def sync_schedule(year, apply=False, create=False):
     # --- Optional: create unmatched events ---
     if create:
         to_create = [
-            e for e in events
-            if e["tourn_id"] not in matched_event_ids
-            and e["tourn_id"] not in existing_ids
+            (org_id, e)
+            for org_id, index in indexes.items()
+            for e in index.events
+            if (org_id, e["tourn_id"]) not in matched_event_ids
+            and (org_id, e["tourn_id"]) not in existing_ids
             and e["start_ms"] and e["week_number"]
         ]
         print(f"\n{'=' * 60}\nNew tournaments to create ({len(to_create)}):\n{'=' * 60}")
         rows = []
-        for e in to_create:
+        for org_id, e in to_create:
             row = {
                 "name": e["name"],
                 "week": e["week_number"],
-                "tournament_date": _iso(e["start_ms"]),
-                "picks_lock_time": _iso(e["start_ms"]),
+                "tournament_date": format_epoch_ms(e["start_ms"]),
+                "picks_lock_time": format_epoch_ms(e["start_ms"]),
                 "prize_pool": int(e["purse"]) if e["purse"] else None,
                 "slashgolf_tourn_id": e["tourn_id"],
                 "completed": False,
             }
+            if org_id != slashgolf.DEFAULT_ORG_ID:
+                row["slashgolf_org_id"] = org_id
             rows.append(row)
-            print(f"  week {row['week']:>2}  {row['name']}  (tournId={e['tourn_id']}, purse=${(row['prize_pool'] or 0):,})")
+            print(f"  week {row['week']:>2}  {row['name']}  (orgId={org_id}, tournId={e['tourn_id']}, "
+                  f"purse=${(row['prize_pool'] or 0):,})")
         if apply and rows:
             supabase.table("tournaments").insert(rows).execute()
             print(f"  Inserted {len(rows)} tournament(s).")
@@ -136,7 +142,15 @@ if __name__ == "__main__":
     year = str(datetime.now(timezone.utc).year)
     if "--year" in args:
         year = args[args.index("--year") + 1]
+    if "--no-cache" in args:
+        slashgolf.disable_cache()
+    slashgolf.set_budget(api_budget.Budget("sync_schedule", "low"))
 
     if not apply:
         print("Running in DRY RUN mode. Use --apply to write, --create to add new events.\n")
-    sync_schedule(year, apply=apply, create=create)
+    try:
+        sync_schedule(year, apply=apply, create=create, org_ids=slashgolf.org_ids_from_args(args))
+    except slashgolf.BudgetDeferred as exc:
+        # Mapping is self-healing week to week, so yielding quota to the scorer
+        # costs nothing but a delay.
+        print(f"\nDeferred: {exc}")
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the cross-job API budget ledger.
+
+The ledger table is a mock; these check the token-bucket priority floors,
+the fail-open behavior when the table is missing, and the forecast math.
+
+Run with: cd scripts && python -m unittest test_api_budget -v
+"""
+
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import api_budget
+import slashgolf
+
+
+def _client(rows):
+    """A mock Supabase client whose api_usage select returns ``rows`` (as a
+    single page of golf_common.paginate's ordered range scan)."""
+    client = mock.MagicMock()
+    query = client.table.return_value.select.return_value.gte.return_value
+    query.order.return_value.range.return_value.execute.return_value.data = rows
+    return client
+
+
+class BudgetPriorityTests(unittest.TestCase):
+    def _budget(self, priority, spent):
+        return api_budget.Budget("job", priority, client=_client([{"calls": spent}]), quota=20, reserve=3)
+
+    def test_scoring_may_spend_to_zero(self):
+        self._budget("scoring", 19).acquire("/earnings")
+        with self.assertRaises(slashgolf.BudgetDeferred):
+            self._budget("scoring", 20).acquire("/earnings")
+
+    def test_live_leaves_scoring_reserve(self):
+        self._budget("live", 16).acquire("/leaderboard")
+        with self.assertRaises(slashgolf.BudgetDeferred):
+            self._budget("live", 17).acquire("/leaderboard")
+
+    def test_low_yields_before_live(self):
+        margin = api_budget.LOW_PRIORITY_MARGIN
+        self._budget("low", 16 - margin).acquire("/leaderboard")
+        with self.assertRaises(slashgolf.BudgetDeferred):
+            self._budget("low", 17 - margin).acquire("/leaderboard")
+
+    def test_acquire_reserves_the_last_token(self):
+        budget = self._budget("scoring", 19)
+        budget.acquire("/leaderboard")
+        with self.assertRaises(slashgolf.BudgetDeferred):
+            budget.acquire("/earnings")  # the last token is already taken
+
+    def test_concurrent_acquires_cannot_overdraw(self):
+        budget = self._budget("scoring", 19)
+        budget.spent()  # load the ledger before the race
+        barrier = threading.Barrier(2)
+        outcomes = []
+
+        def worker():
+            barrier.wait()
+            try:
+                budget.acquire("/leaderboard")
+                outcomes.append("ok")
+            except slashgolf.BudgetDeferred:
+                outcomes.append("deferred")
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(sorted(outcomes), ["deferred", "ok"])
+
+    def test_record_settles_the_reservation(self):
+        client = _client([{"calls": 10}])
+        budget = api_budget.Budget("update_results", "scoring", client=client, quota=20)
+        budget.acquire("/leaderboard")
+        self.assertEqual(budget.spent(), 11)
+        budget.record("/leaderboard", 3)  # two retries on top of the reserved call
+        self.assertEqual(budget.spent(), 13)
+        budget.acquire("/earnings")
+        budget.record("/earnings", 0)  # never went out: refunded, nothing logged
+        self.assertEqual(budget.spent(), 13)
+        client.table.return_value.insert.assert_called_once()
+
+    def test_record_debits_locally_and_to_ledger(self):
+        client = _client([])
+        budget = api_budget.Budget("sync_field", "low", client=client, quota=20)
+        budget.record("/leaderboard", 2)
+        self.assertEqual(budget.spent(), 2)
+        client.table.return_value.insert.assert_called_once_with(
+            {"job": "sync_field", "endpoint": "/leaderboard", "calls": 2}
+        )
+
+    def test_missing_ledger_fails_open(self):
+        client = mock.MagicMock()
+        client.table.return_value.select.side_effect = Exception("relation does not exist")
+        budget = api_budget.Budget("sync_field", "low", client=client, quota=0)
+        budget.acquire("/leaderboard")  # no raise
+        budget.record("/leaderboard", 1)
+        client.table.return_value.insert.assert_not_called()
+
+    def test_unknown_priority_rejected(self):
+        with self.assertRaises(ValueError):
+            api_budget.Budget("job", "urgent")
+
+
+class WindowTests(unittest.TestCase):
+    def test_day_and_month_windows(self):
+        now = datetime(2026, 6, 15, 9, 30, tzinfo=timezone.utc)
+        self.assertEqual(api_budget.window_start(now, "day"), datetime(2026, 6, 15, tzinfo=timezone.utc))
+        self.assertEqual(api_budget.window_start(now, "month"), datetime(2026, 6, 1, tzinfo=timezone.utc))
+
+
+class ForecastTests(unittest.TestCase):
+    NOW = datetime(2026, 6, 15, 9, 30, tzinfo=timezone.utc)  # a Monday
+
+    def test_daily_forecast_uses_same_weekday_history(self):
+        rows = [{"called_at": self.NOW.replace(hour=2).isoformat(), "job": "update_leaderboard", "calls": 1}]
+        for weeks in (1, 2, 3, 4):
+            day = self.NOW - timedelta(weeks=weeks)
+            rows.append({"called_at": day.isoformat(), "job": "update_results", "calls": 4})
+        f = api_budget.forecast(_client(rows), now=self.NOW, quota=20, reserve=3, window="day")
+        self.assertEqual(f["spent"], 1)
+        self.assertEqual(f["by_job"], {"update_leaderboard": 1})
+        self.assertEqual(f["projected"], 4)
+        self.assertEqual(f["headroom"], 13)
+
+    def test_monthly_forecast_extrapolates_daily_average(self):
+        rows = [{"called_at": (self.NOW - timedelta(days=n)).isoformat(), "job": "x", "calls": 1}
+                for n in range(1, 29)]
+        f = api_budget.forecast(_client(rows), now=self.NOW, quota=250, reserve=3, window="month")
+        # 14 calls so far in June, ~1/day for the 15 days after today.
+        self.assertEqual(f["spent"], 14)
+        self.assertAlmostEqual(f["projected"], 14 + 15)
+
+
+if __name__ == "__main__":
+    unittest.main()
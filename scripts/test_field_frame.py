@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the columnar field view.
+
+Run with: cd scripts && python -m unittest test_field_frame -v
+"""
+
+import math
+import unittest
+
+import slashgolf
+from field_frame import FieldFrame
+
+
+LEADERBOARD = {
+    "status": "Official",
+    "leaderboardRows": [
+        {"firstName": "Russell", "lastName": "Henley", "playerId": "34098",
+         "position": "1", "total": "-12", "status": "complete"},
+        {"firstName": "Eric", "lastName": "Cole", "playerId": "47591",
+         "position": "2", "total": "-12", "status": "complete"},
+        {"firstName": "Ben", "lastName": "Griffin", "playerId": "54591",
+         "position": "T3", "total": "-10", "status": "complete"},
+        {"firstName": "Matthieu", "lastName": "Pavon", "playerId": "99001",
+         "position": "CUT", "total": "-1", "status": "cut"},
+        {"firstName": "Stephan", "lastName": "Jaeger", "playerId": "99002",
+         "position": "WD", "total": "E", "status": "wd"},
+    ],
+}
+
+EARNINGS = {
+    "leaderboard": [
+        {"playerId": "34098", "earnings": {"$numberInt": "1782000"}},
+        {"playerId": "47591", "earnings": {"$numberInt": "1079100"}},
+        {"playerId": "54591", "earnings": {"$numberInt": "524700"}},
+    ],
+}
+
+
+class FieldFrameTests(unittest.TestCase):
+    def setUp(self):
+        self.players = slashgolf.parse_leaderboard(LEADERBOARD, EARNINGS)["players"]
+        self.frame = FieldFrame.from_players(self.players)
+
+    def test_columns(self):
+        self.assertEqual(list(self.frame.player_id), ["34098", "47591", "54591", "99001", "99002"])
+        self.assertEqual(list(self.frame.rank), [1, 2, 3, 9000, 9001])
+        self.assertEqual(list(self.frame.tied), [False, False, True, False, False])
+        self.assertEqual(list(self.frame.to_par), [-12.0, -12.0, -10.0, -1.0, 0.0])
+
+    def test_aggregates_match_record_loops(self):
+        self.assertEqual(self.frame.total_winnings(), sum(p["winnings"] for p in self.players))
+        self.assertEqual(self.frame.paid_count(), 3)
+        self.assertEqual(self.frame.status_counts(),
+                         {"active": 3, "cut": 1, "withdrawn": 1, "disqualified": 0})
+
+    def test_unreported_score_is_nan(self):
+        frame = FieldFrame.from_players([{"player_id": "1", "position": "", "score": "-", "status": "active"}])
+        self.assertTrue(math.isnan(frame.to_par[0]))
+        self.assertEqual(frame.rank[0], slashgolf.RANK_NO_POSITION)
+
+    def test_dict_rows_decoded_like_records(self):
+        rows = [{k: p[k] for k in ("player_id", "position", "score", "status", "winnings")} for p in self.players]
+        frame = FieldFrame.from_players(rows)
+        self.assertEqual(list(frame.rank), list(self.frame.rank))
+        self.assertEqual(list(frame.to_par), list(self.frame.to_par))
+
+    def test_pick_join(self):
+        picks = ["54591", "00000", "", "34098", "99001"]
+        self.assertEqual(list(self.frame.index_of(picks)), [2, -1, -1, 0, 3])
+
+    def test_empty_field(self):
+        frame = FieldFrame.from_players([])
+        self.assertEqual(frame.total_winnings(), 0.0)
+        self.assertEqual(list(frame.index_of(["1"])), [-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the paginated table scan.
+
+Run with: cd scripts && python -m unittest test_golf_common -v
+"""
+
+import unittest
+
+from golf_common import paginate
+
+
+class FakeQuery:
+    """A query builder over ``rows`` that records its order/range calls."""
+
+    def __init__(self, rows, calls):
+        self.rows = rows
+        self.calls = calls
+        self.orders = []
+        self.window = None
+
+    def order(self, column):
+        self.orders.append(column)
+        return self
+
+    def range(self, start, end):
+        self.window = (start, end)
+        return self
+
+    def execute(self):
+        self.calls.append((tuple(self.orders), self.window))
+        start, end = self.window
+        return type("Response", (), {"data": self.rows[start:end + 1]})()
+
+
+class PaginateTests(unittest.TestCase):
+    def scan(self, n_rows, **kwargs):
+        rows = [{"id": i} for i in range(n_rows)]
+        calls = []
+        got = list(paginate(lambda: FakeQuery(rows, calls), **kwargs))
+        return got, calls
+
+    def test_reads_every_page_in_order(self):
+        got, calls = self.scan(25, page_size=10)
+        self.assertEqual([r["id"] for r in got], list(range(25)))
+        self.assertEqual([w for _, w in calls], [(0, 9), (10, 19), (20, 29)])
+        self.assertTrue(all(orders == ("id",) for orders, _ in calls))
+
+    def test_exact_multiple_ends_on_empty_page(self):
+        got, calls = self.scan(20, page_size=10)
+        self.assertEqual(len(got), 20)
+        self.assertEqual(len(calls), 3)
+
+    def test_single_short_page(self):
+        got, calls = self.scan(3, page_size=10)
+        self.assertEqual(len(got), 3)
+        self.assertEqual(len(calls), 1)
+
+    def test_order_column(self):
+        _, calls = self.scan(3, page_size=10, order="league_id")
+        self.assertEqual(calls[0][0], ("league_id",))
+
+    def test_parallel_keeps_row_order(self):
+        got, _ = self.scan(95, page_size=10, workers=4)
+        self.assertEqual([r["id"] for r in got], list(range(95)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the streaming leaderboard reader, against the same fixtures as
+test_slashgolf.
+
+Run with: cd scripts && python -m unittest test_leaderboard_stream -v
+"""
+
+import json
+import unittest
+
+import slashgolf as sg
+from leaderboard_stream import LeaderboardStream
+from test_slashgolf import EARNINGS, LEADERBOARD, LIVE_IN_PROGRESS
+
+
+def _chunked(payload, size):
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+class LeaderboardStreamTests(unittest.TestCase):
+    """The incremental reader yields exactly what a whole-body parse would."""
+
+    def test_rows_match_whole_parse_at_any_chunking(self):
+        payload = dict(LIVE_IN_PROGRESS, lastUpdated={"$date": {"$numberLong": "1780245840000"}})
+        payload["leaderboardRows"] = payload["leaderboardRows"] + [
+            {"firstName": "Nicolás", "lastName": "Echavarría", "playerId": "51766",
+             "position": "T12", "total": "-3", "status": "active", "thru": 18.0,
+             "rounds": [{"strokes": {"$numberInt": "70"}}, [], {}], "note": "a\"b\\c\u00e9"},
+            {"firstName": "", "lastName": "", "playerId": ""},
+        ]
+        board = sg.Leaderboard(payload)
+        for size in (1, 2, 3, 7, 64, 1 << 16):
+            stream = LeaderboardStream(_chunked(payload, size))
+            self.assertEqual(list(stream.live_players()), board.live_players, size)
+            self.assertEqual(stream.cut_line, board.cut_line)
+            self.assertEqual(stream.event_status, board.event_status)
+            self.assertEqual(stream.updated_ms, board.updated_ms)
+            self.assertTrue(stream.exhausted)
+
+    def test_numbers_split_at_every_byte_offset(self):
+        """A chunk boundary inside a number ("1.5e" | "3") must not end it early."""
+        meta = {"lastUpdated": 1.5e3, "cutLines": [{"cutScore": -1.25, "cutCount": 65}], "ratio": -0.5e-2}
+        payload = dict(LEADERBOARD, **meta)
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        want = list(LeaderboardStream([body]).rows())
+        for cut in range(1, len(body)):
+            stream = LeaderboardStream([body[:cut], body[cut:]])
+            self.assertEqual(list(stream.rows()), want, cut)
+            self.assertEqual({k: stream.meta[k] for k in meta}, meta, cut)
+
+    def test_scored_players_with_earnings(self):
+        stream = LeaderboardStream(_chunked(LEADERBOARD, 5))
+        self.assertEqual(list(stream.players(EARNINGS)), sg.parse_leaderboard(LEADERBOARD, EARNINGS)["players"])
+        self.assertTrue(stream.event_completed)
+
+    def test_rows_yielded_before_body_is_read(self):
+        chunks = iter(_chunked(LIVE_IN_PROGRESS, 16))
+        pulled = []
+        stream = LeaderboardStream(c for c in chunks if not pulled.append(c))
+        first = next(stream.live_players())
+        self.assertEqual(first["player_name"], "Scottie Scheffler")
+        self.assertLess(sum(map(len, pulled)), len(b"".join(_chunked(LIVE_IN_PROGRESS, 16))))
+
+    def test_rooted_and_empty_documents(self):
+        wrapped = {"fetched_at": 1.0, "expires_at": None, "payload": LEADERBOARD}
+        stream = LeaderboardStream(_chunked(wrapped, 4), root=("payload",))
+        self.assertEqual(len(list(stream.rows())), 5)
+        self.assertEqual(list(LeaderboardStream([b'{"leaderboardRows": []}']).rows()), [])
+
+    def test_malformed_stream_raises(self):
+        for body in (b'{"leaderboardRows": [{"a": 1}', b'{"leaderboardRows": []} x', b"[]"):
+            with self.assertRaises(ValueError):
+                list(LeaderboardStream([body]).rows())
+
+    def test_fingerprints_after_rows(self):
+        stream = LeaderboardStream(_chunked(LIVE_IN_PROGRESS, 8))
+        self.assertIsNone(stream.schema)
+        list(stream.rows())
+        self.assertEqual(stream.schema.fingerprint, sg.Leaderboard(LIVE_IN_PROGRESS).schema.fingerprint)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,9 +10,13 @@ golfer matcher and ESPN payload parser were deleted along with the scrape.)
 Run with: cd scripts && python -m unittest test_name_matching -v
 """
 
+import re
+import unicodedata
 import unittest
 
-from slashgolf import normalize_name, tournament_names_match
+import slashgolf
+from slashgolf import ScheduleIndex, normalize_name, tournament_names_match
+from sync_schedule import match_event
 
 
 class NormalizeNameTests(unittest.TestCase):
@@ -45,6 +49,56 @@ class NormalizeNameTests(unittest.TestCase):
         self.assertEqual(normalize_name("  Rory   McIlroy  "), "rory mcilroy")
 
 
+def _reference_normalize_name(name):
+    """normalize_name as it was before the translate table and cache; the
+    parity tests hold the fast version to it exactly."""
+    if not name:
+        return ""
+    decomposed = unicodedata.normalize("NFD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    despaced = re.sub(r"[\.\,\'\"\`‘’“”\-–—]", " ", stripped.lower())
+    tokens = despaced.split()
+    while tokens and tokens[-1] in {"jr", "sr", "ii", "iii", "iv", "v"}:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+class NormalizeNameParityTests(unittest.TestCase):
+    NAMES = [
+        "José Ramírez", "Nicolás Echavarría", "Ángel Cabrera", "Davis Thompson III",
+        "Sammy Davis Jr.", "J.J. Spaun", "K.H. Lee", "Séamus O'Hara", "Byeong-Hun An",
+        "Ludvig Åberg", "Thorbjørn Olesen", "Sami Välimäki", "Rasmus Højgaard",
+        "  Matt   Fitzpatrick ", "U.S. Open", "AT&T Pebble Beach Pro-Am", "Jr.", "v",
+        "Cameron Young — Jr", "Tom Kim “Joohyung”", "İsmail Özdemir", "ǅemal", "ﬁnau",
+        "Ⅳ", "x\u0301\u0327y", "Ke\u030ain Na", "Kevin\tNa\nJr",
+    ]
+
+    def test_known_names(self):
+        for name in self.NAMES:
+            self.assertEqual(normalize_name(name), _reference_normalize_name(name), name)
+
+    def test_every_bmp_character(self):
+        # Each character once as a leading, inner and trailing token.
+        for cp in range(0x20, 0x10000):
+            if 0xD800 <= cp < 0xE000:
+                continue
+            c = chr(cp)
+            name = f"{c}Ab c{c}d Jr{c} {c}"
+            self.assertEqual(normalize_name(name), _reference_normalize_name(name), hex(cp))
+
+    def test_falsy(self):
+        self.assertEqual(normalize_name(None), "")
+        self.assertEqual(normalize_name(""), "")
+
+    def test_repeat_calls_are_cached(self):
+        slashgolf._normalize_name.cache_clear()
+        normalize_name("Scottie Scheffler")
+        normalize_name("Scottie Scheffler")
+        info = slashgolf._normalize_name.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+        self.assertEqual(info.maxsize, slashgolf.NORMALIZE_CACHE_SIZE)
+
+
 class TournamentNamesMatchTests(unittest.TestCase):
     def test_exact(self):
         self.assertTrue(tournament_names_match("CJ Cup Byron Nelson", "CJ Cup Byron Nelson"))
@@ -79,5 +133,35 @@ class TournamentNamesMatchTests(unittest.TestCase):
         self.assertFalse(tournament_names_match("Rocket Classic", ""))
 
 
+class MatchEventAcrossToursTests(unittest.TestCase):
+    """sync_schedule.match_event over one ScheduleIndex per tour."""
+
+    INDEXES = {
+        "1": ScheduleIndex.from_schedule({"schedule": [{"tournId": "026", "name": "U.S. Open"}]}),
+        "2": ScheduleIndex.from_schedule({"schedule": [
+            {"tournId": "026", "name": "Visit Knoxville Open"},
+            {"tournId": "031", "name": "U.S. Open Qualifier Classic"},
+        ]}),
+    }
+
+    def test_default_tour_first(self):
+        self.assertEqual(match_event({"name": "US Open"}, self.INDEXES)[0], "1")
+
+    def test_own_tour_preferred(self):
+        org, ev = match_event({"name": "US Open", "slashgolf_org_id": "2"}, self.INDEXES)
+        self.assertEqual((org, ev["tourn_id"]), ("2", "031"))
+
+    def test_falls_through_to_other_tours_on_exact_names(self):
+        org, ev = match_event({"name": "Visit Knoxville Open"}, self.INDEXES)
+        self.assertEqual((org, ev["tourn_id"]), ("2", "026"))
+
+    def test_no_loose_match_on_other_tours(self):
+        self.assertEqual(match_event({"name": "Knoxville Open"}, self.INDEXES), (None, None))
+        self.assertEqual(match_event({"name": "Qualifier Classic"}, self.INDEXES), (None, None))
+
+    def test_no_match(self):
+        self.assertEqual(match_event({"name": "Masters Tournament"}, self.INDEXES), (None, None))
+
+
 if __name__ == "__main__":
     unittest.main()
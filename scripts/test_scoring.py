@@ -11,7 +11,9 @@ Run with: cd scripts && python -m unittest test_scoring -v
 
 import unittest
 
-from update_results import calculate_penalty, field_ids_by_norm, index_players, match_pick_to_player
+from update_results import (
+    NameSuggester, calculate_penalty, field_ids_by_norm, index_players, match_picks, pick_changes,
+)
 
 
 def _field():
@@ -24,30 +26,86 @@ def _field():
 
 class MatchPickTests(unittest.TestCase):
     def setUp(self):
-        self.by_id, self.by_norm = index_players(_field())
+        self.field = _field()
+        _, self.by_norm = index_players(self.field)
+
+    def _match(self, pick):
+        return match_picks([pick], self.field, self.by_norm)[0]
 
     def test_match_by_golfer_id(self):
         pick = {"golfer_id": "34098", "golfer_name": "stale name"}
-        self.assertEqual(match_pick_to_player(pick, self.by_id, self.by_norm)["player_name"], "Russell Henley")
+        self.assertEqual(self._match(pick)["player_name"], "Russell Henley")
 
     def test_match_by_name_when_no_id(self):
         pick = {"golfer_name": "Russell Henley"}
-        self.assertEqual(match_pick_to_player(pick, self.by_id, self.by_norm)["player_id"], "34098")
+        self.assertEqual(self._match(pick)["player_id"], "34098")
 
     def test_name_fallback_normalizes_accents(self):
         pick = {"golfer_name": "Nicolas Echavarria"}
-        self.assertEqual(match_pick_to_player(pick, self.by_id, self.by_norm)["player_id"], "99001")
+        self.assertEqual(self._match(pick)["player_id"], "99001")
 
     def test_id_miss_falls_back_to_name(self):
         pick = {"golfer_id": "00000", "golfer_name": "Ben Griffin"}
-        self.assertEqual(match_pick_to_player(pick, self.by_id, self.by_norm)["player_id"], "54591")
+        self.assertEqual(self._match(pick)["player_id"], "54591")
 
     def test_unknown_golfer_returns_none(self):
-        self.assertIsNone(match_pick_to_player({"golfer_name": "Tiger Woods"}, self.by_id, self.by_norm))
+        self.assertIsNone(self._match({"golfer_name": "Tiger Woods"}))
+
+    def test_batch_join_stays_aligned(self):
+        picks = [{"golfer_id": "99001"}, {"golfer_name": "Tiger Woods"},
+                 {"golfer_id": 54591}, {"golfer_name": "Russell Henley"}]
+        matched = match_picks(picks, self.field, self.by_norm)
+        self.assertEqual([m and m["player_id"] for m in matched], ["99001", None, "54591", "34098"])
 
     def test_empty_pick_returns_none(self):
-        self.assertIsNone(match_pick_to_player({"golfer_name": ""}, self.by_id, self.by_norm))
-        self.assertIsNone(match_pick_to_player({}, self.by_id, self.by_norm))
+        self.assertIsNone(self._match({"golfer_name": ""}))
+        self.assertIsNone(self._match({}))
+
+
+class NameSuggesterTests(unittest.TestCase):
+    def setUp(self):
+        _, by_norm = index_players(_field())
+        self.suggester = NameSuggester(by_norm)
+
+    def _ids(self, name):
+        return [p["player_id"] for p, _ in self.suggester.suggest(name)]
+
+    def test_misspelling_ranks_intended_golfer_first(self):
+        self.assertEqual(self._ids("Russel Henly")[0], "34098")
+        self.assertEqual(self._ids("Nico Echavaria")[0], "99001")
+
+    def test_similarity_is_reported_best_first(self):
+        sims = [sim for _, sim in self.suggester.suggest("Ben Griffen")]
+        self.assertEqual(sims, sorted(sims, reverse=True))
+        self.assertTrue(0 < sims[0] < 1)
+
+    def test_unrelated_or_empty_name_has_no_suggestions(self):
+        self.assertEqual(self.suggester.suggest("Tiger Woods"), [])
+        self.assertEqual(self.suggester.suggest(""), [])
+        self.assertEqual(NameSuggester({}).suggest("Ben Griffin"), [])
+
+
+class PickChangesTests(unittest.TestCase):
+    STORED = {"id": "p1", "winnings": 524700, "penalty_amount": 10, "penalty_reason": "missed_cut"}
+
+    def test_unchanged_rescore_is_empty(self):
+        update = {"winnings": 524700.0, "penalty": 10, "penalty_reason": "missed_cut"}
+        self.assertEqual(pick_changes(update, self.STORED), {})
+
+    def test_zero_penalty_never_counts_as_clearing(self):
+        # Writes leave penalty columns alone when the new penalty is 0.
+        self.assertEqual(pick_changes({"winnings": 524700, "penalty": 0}, self.STORED), {})
+
+    def test_reports_old_and_new(self):
+        update = {"winnings": 1068200.0, "penalty": 25, "penalty_reason": "withdrawal"}
+        self.assertEqual(pick_changes(update, self.STORED), {
+            "winnings": (524700, 1068200),
+            "penalty_amount": (10, 25),
+            "penalty_reason": ("missed_cut", "withdrawal"),
+        })
+
+    def test_null_stored_winnings_is_a_change(self):
+        self.assertEqual(pick_changes({"winnings": 0}, {"winnings": None}), {"winnings": (None, 0)})
 
 
 class FieldIdsByNormTests(unittest.TestCase):
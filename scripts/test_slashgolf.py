@@ -5,7 +5,15 @@ Unit tests for the Slash Golf parsers (no network, no DB).
 Run with: cd scripts && python -m unittest test_slashgolf -v
 """
 
+import asyncio
+import json
+import os
+import tempfile
+import threading
 import unittest
+from unittest import mock
+
+import requests
 
 import slashgolf as sg
 
@@ -91,6 +99,98 @@ class UnwrapTests(unittest.TestCase):
         self.assertEqual(sg.to_epoch_ms({"$date": {"$numberLong": "1768435200000"}}), 1768435200000)
 
 
+class PositionScoreDecoderTests(unittest.TestCase):
+    def test_positions(self):
+        for pos, expected in (("1", (1, False)), ("T4", (4, True)), ("t12", (12, True)),
+                              ("CUT", (9000, False)), ("MDF", (9000, False)), ("WD", (9001, False)),
+                              ("DQ", (9002, False)), ("", (sg.RANK_NO_POSITION, False)),
+                              ("T451", (451, True)), (None, (sg.RANK_NO_POSITION, False))):
+            self.assertEqual(sg.decode_position(pos), expected, pos)
+
+    def test_scores(self):
+        for score, expected in (("-12", -12), ("E", 0), ("+3", 3), ("4", 4), ("+75", 75),
+                                ("", None), ("-", None), (None, None), ("WD", None)):
+            self.assertEqual(sg.decode_to_par(score), expected, score)
+
+    def test_tables_agree_with_parsers(self):
+        for pos, decoded in sg._POSITION_TABLE.items():
+            self.assertEqual(decoded, sg._parse_position(pos), pos)
+        for score, decoded in sg._TO_PAR_TABLE.items():
+            self.assertEqual(decoded, sg._parse_to_par(score), score)
+
+    def test_stored_on_records(self):
+        live = sg.parse_live_leaderboard(LIVE_IN_PROGRESS)["players"]
+        self.assertEqual([(p["rank"], p["tied"], p["to_par"]) for p in live],
+                         [(1, True, -9), (1, True, -9), (80, True, 5)])
+        scored = sg.parse_leaderboard(LEADERBOARD)["players"]
+        self.assertEqual([p["rank"] for p in scored], [1, 2, 3, 9000, 9001])
+
+
+class PlayerRecordTests(unittest.TestCase):
+    """Parsed rows are slotted records that still read like the old dicts."""
+
+    def setUp(self):
+        self.scored = sg.parse_leaderboard(LEADERBOARD, EARNINGS)["players"]
+        self.live = sg.parse_live_leaderboard(LIVE_IN_PROGRESS)["players"]
+
+    def test_parsers_return_records(self):
+        self.assertTrue(all(isinstance(p, sg.Player) for p in self.scored))
+        self.assertTrue(all(isinstance(p, sg.LivePlayer) for p in self.live))
+        self.assertFalse(hasattr(self.scored[0], "__dict__"))
+
+    def test_mapping_style_access(self):
+        henley = self.scored[0]
+        self.assertEqual(henley["player_id"], "34098")
+        self.assertEqual(henley.get("winnings"), 1782000.0)
+        self.assertEqual(henley.get("thru", "n/a"), "n/a")
+        with self.assertRaises(KeyError):
+            henley["thru"]
+
+    def test_to_row_is_plain_json(self):
+        row = self.live[0].to_row()
+        self.assertEqual(row, {"player_id": "46046", "player_name": "Scottie Scheffler",
+                               "position": "T1", "score": "-9", "status": "active",
+                               "thru": "12", "round": 2, "rank": 1, "tied": True, "to_par": -9})
+        json.dumps(row)
+        self.assertEqual(sg.player_rows(self.live)[1], self.live[1].to_row())
+
+    def test_player_rows_passes_dicts_through(self):
+        row = {"player_id": "1", "player_name": "A B"}
+        self.assertEqual(sg.player_rows([row]), [row])
+
+    def test_equality(self):
+        again = sg.parse_leaderboard(LEADERBOARD, EARNINGS)["players"]
+        self.assertEqual(self.scored, again)
+        self.assertEqual(self.scored[0], self.scored[0].to_row())
+        self.assertNotEqual(self.scored[0], self.scored[1])
+
+    def test_unknown_field_rejected(self):
+        with self.assertRaises(TypeError):
+            sg.Player(player_id="1", thru="F")
+
+
+class DecodePayloadTests(unittest.TestCase):
+    """Whichever JSON backend is installed, the parsers see the same tree."""
+
+    def _body(self, payload):
+        return json.dumps(payload).encode("utf-8")
+
+    def test_stdlib_backend(self):
+        for payload in (LEADERBOARD, EARNINGS, SCHEDULE, LIVE_IN_PROGRESS):
+            self.assertEqual(sg.decode_payload(self._body(payload), fast=False), payload)
+
+    @unittest.skipUnless(sg.orjson, "orjson not installed")
+    def test_backends_agree(self):
+        for payload in (LEADERBOARD, EARNINGS, SCHEDULE, LIVE_IN_PROGRESS):
+            body = self._body(payload)
+            self.assertEqual(sg.decode_payload(body, fast=True), sg.decode_payload(body, fast=False))
+
+    def test_default_backend_matches_parsers(self):
+        lb = sg.decode_payload(self._body(LEADERBOARD))
+        earn = sg.decode_payload(self._body(EARNINGS))
+        self.assertEqual(sg.parse_leaderboard(lb, earn), sg.parse_leaderboard(LEADERBOARD, EARNINGS))
+
+
 class IsOfficialTests(unittest.TestCase):
     def test_official(self):
         self.assertTrue(sg.is_event_official({"status": "Official"}))
@@ -227,5 +327,568 @@ class ParseLiveLeaderboardTests(unittest.TestCase):
         self.assertFalse(res["event_completed"])
 
 
+class PayloadSchemaTests(unittest.TestCase):
+    """Key-set fingerprints pick the row decoder and surface drift."""
+
+    def setUp(self):
+        self.addCleanup(sg._REPORTED_SCHEMAS.clear)
+
+    def _quiet(self, fn, *args):
+        with mock.patch("builtins.print") as printed:
+            return fn(*args), printed
+
+    def test_known_shape_has_no_drift(self):
+        schema, printed = self._quiet(lambda: sg.Leaderboard(LIVE_IN_PROGRESS).schema)
+        self.assertFalse(schema.drift)
+        self.assertEqual(schema.variant, "thru=thru, round=currentRound")
+        printed.assert_not_called()
+        self.assertEqual(sg.parse_leaderboard(LEADERBOARD)["missing_keys"], [])
+
+    def test_alias_schema_decodes_like_probing(self):
+        rows = [{k.replace("thru", "holesPlayed").replace("currentRound", "round"): v
+                 for k, v in row.items()} for row in LIVE_IN_PROGRESS["leaderboardRows"]]
+        aliased = dict(LIVE_IN_PROGRESS, leaderboardRows=rows)
+        board = sg.Leaderboard(aliased)
+        self.assertEqual(board.schema.variant, "thru=holesPlayed, round=round")
+        self.assertEqual(board.live_players, sg.Leaderboard(LIVE_IN_PROGRESS).live_players)
+
+    def test_mixed_aliases_fall_back_to_probing(self):
+        rows = [dict(LIVE_IN_PROGRESS["leaderboardRows"][0]),
+                {k.replace("thru", "holesPlayed"): v for k, v in LIVE_IN_PROGRESS["leaderboardRows"][1].items()}]
+        board = sg.Leaderboard(dict(LIVE_IN_PROGRESS, leaderboardRows=rows))
+        self.assertIn("probing", board.schema.variant)
+        self.assertEqual([p["thru"] for p in board.live_players], ["12", "F"])
+
+    def test_empty_board_is_not_drift(self):
+        """No rows before tee times are posted: nothing missing, nothing printed."""
+        empty = dict(LEADERBOARD, leaderboardRows=[])
+        res, printed = self._quiet(sg.parse_leaderboard, empty)
+        self.assertEqual(res["missing_keys"], [])
+        self.assertFalse(sg.Leaderboard(empty).schema.drift)
+        printed.assert_not_called()
+
+    def test_missing_required_keys_reported_once(self):
+        rows = [{k: v for k, v in row.items() if k != "position"} for row in LEADERBOARD["leaderboardRows"]]
+        drifted = dict(LEADERBOARD, leaderboardRows=rows)
+        res, printed = self._quiet(sg.parse_leaderboard, drifted)
+        self.assertEqual(res["missing_keys"], ["position"])
+        self.assertIn("SCHEMA DRIFT", printed.call_args[0][0])
+        _, printed = self._quiet(sg.parse_leaderboard, drifted)
+        printed.assert_not_called()
+
+    def test_new_keys_flagged_but_not_missing(self):
+        rows = [dict(row, sponsorLogo="x") for row in LEADERBOARD["leaderboardRows"]]
+        schema, _ = self._quiet(lambda: sg.Leaderboard(dict(LEADERBOARD, leaderboardRows=rows)).schema)
+        self.assertEqual(schema.unknown, ("sponsorLogo",))
+        self.assertEqual(schema.missing, ())
+
+    def test_schedule_variants(self):
+        rows, schema = sg.schedule_schema(SCHEDULE)
+        self.assertEqual(schema.variant, "schedule/tournId/nested date")
+        legacy = {"tournaments": [{"id": "006", "name": "Sony Open in Hawaii", "weekNumber": "3",
+                                   "date": {"$date": {"$numberLong": "1768435200000"}}}]}
+        _, schema = sg.schedule_schema(legacy)
+        self.assertEqual(schema.variant, "tournaments/id/flat date + legacy fields")
+        ev = sg.parse_schedule(legacy)[0]
+        self.assertEqual((ev["tourn_id"], ev["week_number"], ev["start_ms"]), ("006", 3, 1768435200000))
+
+
+class _FakeResponse:
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body if body is not None else {}
+        self.text = "{}" if status_code < 400 else "error"
+
+    def json(self):
+        return self._body
+
+    @property
+    def content(self):
+        return json.dumps(self._body).encode("utf-8")
+
+    def iter_content(self, chunk_size=1):
+        body = self.content
+        for i in range(0, len(body), chunk_size):
+            yield body[i:i + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(str(self.status_code))
+
+
+class GetRetryTests(unittest.TestCase):
+    """_get's pooled-session retry policy, with the session and sleep faked."""
+
+    def setUp(self):
+        self.session = mock.MagicMock()
+        self.sleeps = []
+        for target, kwargs in (
+            ("_get_session", {"return_value": self.session}),
+            ("RAPIDAPI_KEY", {"new": "test-key"}),
+        ):
+            p = mock.patch.object(sg, target, **kwargs)
+            p.start()
+            self.addCleanup(p.stop)
+        p = mock.patch.object(sg.time, "sleep", side_effect=self.sleeps.append)
+        p.start()
+        self.addCleanup(p.stop)
+        p = mock.patch.object(sg, "CALL_LOG", [])
+        p.start()
+        self.addCleanup(p.stop)
+
+    def test_success_first_try(self):
+        self.session.get.return_value = _FakeResponse(200, {"ok": 1})
+        self.assertEqual(sg._get("/schedule", {}), {"ok": 1})
+        self.assertEqual(self.sleeps, [])
+        self.assertEqual(sg.CALL_LOG[0]["retries"], 0)
+
+    def test_retries_5xx_then_succeeds(self):
+        self.session.get.side_effect = [_FakeResponse(503), _FakeResponse(502), _FakeResponse(200, {"ok": 1})]
+        self.assertEqual(sg._get("/leaderboard", {}), {"ok": 1})
+        self.assertEqual(len(self.sleeps), 2)
+        self.assertEqual(sg.call_stats()["retries"], 2)
+
+    def test_retries_connection_error(self):
+        self.session.get.side_effect = [requests.ConnectionError("reset"), _FakeResponse(200, {"ok": 1})]
+        self.assertEqual(sg._get("/earnings", {}), {"ok": 1})
+        self.assertEqual(sg.CALL_LOG[0]["retries"], 1)
+
+    def test_gives_up_after_max_retries(self):
+        self.session.get.side_effect = requests.Timeout("slow")
+        with self.assertRaises(requests.Timeout):
+            sg._get("/leaderboard", {})
+        self.assertEqual(self.session.get.call_count, sg.MAX_RETRIES + 1)
+
+    def test_429_honors_short_retry_after(self):
+        self.session.get.side_effect = [
+            _FakeResponse(429, headers={"Retry-After": "2"}), _FakeResponse(200, {"ok": 1}),
+        ]
+        self.assertEqual(sg._get("/schedule", {}), {"ok": 1})
+        self.assertEqual(self.sleeps, [2.0])
+
+    def test_429_quota_exhausted_fails_fast(self):
+        """A long Retry-After means the daily quota is gone: no sleeping."""
+        self.session.get.return_value = _FakeResponse(429, headers={"Retry-After": "40000"})
+        with self.assertRaisesRegex(RuntimeError, "rate-limited"):
+            sg._get("/schedule", {})
+        self.assertEqual(self.sleeps, [])
+
+    def test_budget_metered_per_attempt(self):
+        budget = mock.MagicMock()
+        self.session.get.side_effect = [_FakeResponse(503), _FakeResponse(200, {"ok": 1})]
+        with mock.patch.object(sg, "_budget", budget):
+            sg._get("/leaderboard", {})
+        budget.acquire.assert_called_once_with("/leaderboard")
+        budget.record.assert_called_once_with("/leaderboard", 2)
+
+    def test_budget_refunded_when_nothing_goes_out(self):
+        budget = mock.MagicMock()
+        with mock.patch.object(sg, "_budget", budget), mock.patch.object(sg, "RAPIDAPI_KEY", None), \
+             self.assertRaisesRegex(RuntimeError, "RAPIDAPI_KEY"):
+            sg._get("/leaderboard", {})
+        budget.record.assert_called_once_with("/leaderboard", 0)
+        self.session.get.assert_not_called()
+
+    def test_budget_refusal_makes_no_call(self):
+        budget = mock.MagicMock()
+        budget.acquire.side_effect = sg.BudgetDeferred("held for scoring")
+        with mock.patch.object(sg, "_budget", budget), self.assertRaises(sg.BudgetDeferred):
+            sg._get("/leaderboard", {})
+        self.session.get.assert_not_called()
+
+    def test_4xx_not_retried(self):
+        self.session.get.return_value = _FakeResponse(401)
+        with self.assertRaisesRegex(RuntimeError, "401"):
+            sg._get("/schedule", {})
+        self.assertEqual(self.session.get.call_count, 1)
+
+
+class CassetteTests(unittest.TestCase):
+    """Record mode saves response bodies; replay serves them offline."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.session = mock.MagicMock()
+        for target, kwargs in (
+            ("CASSETTE_DIR", {"new": tmp.name}),
+            ("CASSETTE_MODE", {"new": None}),
+            ("_get_session", {"return_value": self.session}),
+            ("RAPIDAPI_KEY", {"new": "test-key"}),
+            ("CALL_LOG", {"new": []}),
+        ):
+            p = mock.patch.object(sg, target, **kwargs)
+            p.start()
+            self.addCleanup(p.stop)
+        self.params = {"orgId": "1", "tournId": "020", "year": "2026"}
+
+    def test_record_then_replay_without_network(self):
+        self.session.get.return_value = _FakeResponse(200, LEADERBOARD)
+        sg.set_cassette_mode("record")
+        self.assertEqual(sg._get("/leaderboard", self.params), LEADERBOARD)
+
+        self.session.get.reset_mock()
+        budget = mock.MagicMock()
+        sg.set_cassette_mode("replay")
+        with mock.patch.object(sg, "_budget", budget):
+            self.assertEqual(sg._get("/leaderboard", self.params), LEADERBOARD)
+        self.session.get.assert_not_called()
+        budget.acquire.assert_not_called()
+
+    def test_replay_miss_is_an_error(self):
+        sg.set_cassette_mode("replay")
+        with self.assertRaisesRegex(RuntimeError, "No recorded"):
+            sg._get("/earnings", self.params)
+        self.session.get.assert_not_called()
+
+    def test_errors_are_not_recorded(self):
+        self.session.get.return_value = _FakeResponse(404)
+        sg.set_cassette_mode("record")
+        with self.assertRaises(requests.HTTPError):
+            sg._get("/leaderboard", self.params)
+        self.assertEqual(os.listdir(sg.CASSETTE_DIR), [])
+
+    def test_rejects_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            sg.set_cassette_mode("rewind")
+
+
+class ResponseCacheTests(unittest.TestCase):
+    """fetch_* through the on-disk cache, with _get faked to count API calls."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = tmp.name
+        self.now = [1_000_000.0]
+        self.payloads = {"/schedule": SCHEDULE, "/leaderboard": LIVE_IN_PROGRESS, "/earnings": EARNINGS}
+        self.get = mock.MagicMock(side_effect=lambda path, params: self.payloads[path])
+        for target, kwargs in (
+            ("CACHE_DIR", {"new": self.cache_dir}),
+            ("CACHE_ENABLED", {"new": True}),
+            ("_get", {"new": self.get}),
+        ):
+            p = mock.patch.object(sg, target, **kwargs)
+            p.start()
+            self.addCleanup(p.stop)
+        p = mock.patch.object(sg.time, "time", side_effect=lambda: self.now[0])
+        p.start()
+        self.addCleanup(p.stop)
+
+    def test_repeat_fetch_is_served_from_cache(self):
+        self.assertEqual(sg.fetch_schedule("2026"), SCHEDULE)
+        self.assertEqual(sg.fetch_schedule("2026"), SCHEDULE)
+        self.assertEqual(self.get.call_count, 1)
+
+    def test_key_includes_tourn_id_and_year(self):
+        sg.fetch_leaderboard("020", "2026")
+        sg.fetch_leaderboard("021", "2026")
+        sg.fetch_leaderboard("020", "2025")
+        self.assertEqual(self.get.call_count, 3)
+
+    def test_live_leaderboard_expires(self):
+        sg.fetch_leaderboard("020", "2026")
+        self.now[0] += sg.CACHE_TTL_S["/leaderboard"] + 1
+        sg.fetch_leaderboard("020", "2026")
+        self.assertEqual(self.get.call_count, 2)
+
+    def test_official_leaderboard_and_earnings_never_expire(self):
+        self.payloads["/leaderboard"] = LEADERBOARD
+        sg.fetch_leaderboard("020", "2026")
+        sg.fetch_earnings("020", "2026")
+        self.now[0] += 365 * 24 * 3600
+        sg.fetch_leaderboard("020", "2026")
+        sg.fetch_earnings("020", "2026")
+        self.assertEqual(self.get.call_count, 2)
+
+    def test_earnings_pinned_once_event_known_official(self):
+        """Earnings cached before their leaderboard (the concurrent path) are
+        made permanent as soon as the leaderboard proves the event final."""
+        self.payloads["/leaderboard"] = LEADERBOARD
+        sg.fetch_earnings("020", "2026")
+        sg.get_tournament_results("020", "2026")
+        self.now[0] += 365 * 24 * 3600
+        sg.fetch_earnings("020", "2026")
+        self.assertEqual(self.get.call_count, 2)
+
+    def test_all_zero_earnings_stay_refetchable(self):
+        """Earnings fetched the moment an event goes Official may not have
+        posted yet; an all-$0 payload must not be cached forever."""
+        self.payloads["/leaderboard"] = LEADERBOARD
+        self.payloads["/earnings"] = {"leaderboard": [{"playerId": "34098", "earnings": 0}]}
+        sg.fetch_leaderboard("020", "2026")
+        sg.fetch_earnings("020", "2026")
+        self.now[0] += sg.CACHE_TTL_S["/earnings"] + 1
+        sg.fetch_earnings("020", "2026")
+        self.assertEqual(self.get.call_count, 3)
+
+    def test_concurrent_identical_fetches_share_one_call(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_get(path, params):
+            started.set()
+            release.wait(2)
+            return LIVE_IN_PROGRESS
+
+        self.get.side_effect = slow_get
+        with mock.patch.object(sg, "CACHE_ENABLED", False):
+            results = []
+            threads = [threading.Thread(target=lambda: results.append(sg.fetch_leaderboard("020", "2026")))
+                       for _ in range(3)]
+            threads[0].start()
+            started.wait(2)
+            for t in threads[1:]:
+                t.start()
+            # Give the followers time to join the in-flight request.
+            threading.Event().wait(0.05)
+            release.set()
+            for t in threads:
+                t.join(2)
+        self.assertEqual(self.get.call_count, 1)
+        self.assertEqual(results, [LIVE_IN_PROGRESS] * 3)
+
+    def test_schedule_expires_after_its_ttl(self):
+        sg.fetch_schedule("2026")
+        self.now[0] += sg.CACHE_TTL_S["/schedule"] - 60
+        sg.fetch_schedule("2026")
+        self.assertEqual(self.get.call_count, 1)
+        self.now[0] += 120
+        sg.fetch_schedule("2026")
+        self.assertEqual(self.get.call_count, 2)
+
+    def test_disabled_cache_always_calls_api(self):
+        with mock.patch.object(sg, "CACHE_ENABLED", False):
+            sg.fetch_schedule("2026")
+            sg.fetch_schedule("2026")
+        self.assertEqual(self.get.call_count, 2)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_eviction_bounds_directory_size(self):
+        with mock.patch.object(sg, "CACHE_MAX_BYTES", 1):
+            sg.fetch_leaderboard("020", "2026")
+            sg.fetch_leaderboard("021", "2026")
+        self.assertLessEqual(len(os.listdir(self.cache_dir)), 1)
+
+
+class ConcurrentResultsTests(unittest.TestCase):
+    """get_tournament_results issues /leaderboard and /earnings together."""
+
+    def setUp(self):
+        # Each fake fetch waits at a barrier that only opens once BOTH are in
+        # flight, so a sequential implementation would time out.
+        self.barrier = threading.Barrier(2, timeout=2)
+
+        def fake(payload):
+            def fetch(tourn_id, year, org_id):
+                self.barrier.wait()
+                return payload
+            return fetch
+
+        for target, payload in (("fetch_leaderboard", LEADERBOARD), ("fetch_earnings", EARNINGS)):
+            p = mock.patch.object(sg, target, side_effect=fake(payload))
+            p.start()
+            self.addCleanup(p.stop)
+        p = mock.patch.object(sg, "CACHE_ENABLED", False)
+        p.start()
+        self.addCleanup(p.stop)
+
+    def test_both_fetches_in_flight_together(self):
+        res = sg.get_tournament_results("020", "2026", tournament_name="Charles Schwab Challenge")
+        self.assertEqual(res["winner_name"], "Russell Henley")
+        self.assertEqual(res["players"][0]["winnings"], 1782000.0)
+
+    def test_async_variant(self):
+        res = asyncio.run(sg.get_tournament_results_async("020", "2026"))
+        self.assertTrue(res["event_completed"])
+        self.assertEqual(res["players"][1]["winnings"], 1079100.0)
+
+    def test_fetch_concurrently_preserves_order_and_errors(self):
+        self.assertEqual(sg.fetch_concurrently([(lambda x: x * 2, (i,)) for i in range(5)]), [0, 2, 4, 6, 8])
+        with self.assertRaises(sg.BudgetDeferred):
+            sg.fetch_concurrently([
+                (lambda: 1, ()),
+                (mock.Mock(side_effect=sg.BudgetDeferred("held")), ()),
+            ])
+
+
+class UnifiedLeaderboardTests(unittest.TestCase):
+    """One lazy Leaderboard backs every projection of a payload."""
+
+    def test_matches_legacy_shapes(self):
+        board = sg.Leaderboard(LEADERBOARD, EARNINGS, "Charles Schwab Challenge")
+        self.assertEqual(board.results(), sg.parse_leaderboard(LEADERBOARD, EARNINGS, "Charles Schwab Challenge"))
+        self.assertEqual(board.live(), sg.parse_live_leaderboard(LEADERBOARD, "Charles Schwab Challenge"))
+        self.assertEqual(board.winner, ("34098", "Russell Henley"))
+        self.assertEqual(board.cut_line, "-2")
+
+    def test_rows_decoded_once_across_projections(self):
+        board = sg.Leaderboard(LIVE_IN_PROGRESS, EARNINGS)
+        with mock.patch.object(sg, "_player_status", wraps=sg._player_status) as status:
+            board.live_players, board.field, board.players, board.winner
+        self.assertEqual(status.call_count, len(LIVE_IN_PROGRESS["leaderboardRows"]))
+
+    def test_unrequested_projections_cost_nothing(self):
+        board = sg.Leaderboard(LIVE_IN_PROGRESS, EARNINGS)
+        with mock.patch.object(sg, "earnings_by_player") as earnings, \
+                mock.patch.object(sg, "_row_thru") as thru:
+            board.event_status, board.cut_line
+            self.assertNotIn("rows", board.__dict__)
+            board.players
+        earnings.assert_called_once()
+        thru.assert_not_called()
+
+
+class IngestLeaderboardTests(unittest.TestCase):
+    """One leaderboard fetch feeds the field and live pipelines."""
+
+    def setUp(self):
+        self.fetch_lb = mock.MagicMock(return_value=LIVE_IN_PROGRESS)
+        self.fetch_earn = mock.MagicMock(return_value=EARNINGS)
+        for target, value in (("fetch_leaderboard", self.fetch_lb), ("fetch_earnings", self.fetch_earn)):
+            p = mock.patch.object(sg, target, value)
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_field_and_live_from_one_fetch(self):
+        ingest = sg.ingest_leaderboard("020", "2026", tournament_name="The Memorial")
+        self.assertEqual(self.fetch_lb.call_count, 1)
+        self.assertEqual(ingest["live"]["tournament_name"], "The Memorial")
+        self.assertEqual(len(ingest["field"]), 3)
+        self.assertFalse(ingest["event_completed"])
+        self.fetch_earn.assert_not_called()
+
+
+SEASON = {
+    "schedule": [
+        {"tournId": "006", "name": "Sony Open in Hawaii"},
+        {"tournId": "026", "name": "U.S. Open"},
+        {"tournId": "019", "name": "THE CJ CUP Byron Nelson"},
+        {"tournId": "", "name": "Unannounced Event"},
+    ],
+}
+
+
+class ScheduleIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.index = sg.ScheduleIndex.from_schedule(SEASON)
+
+    def test_skips_events_without_tourn_id(self):
+        self.assertEqual([e["tourn_id"] for e in self.index.events], ["006", "026", "019"])
+
+    def test_exact_collapsed_and_loose_matches(self):
+        self.assertEqual(self.index.match("Sony Open in Hawaii")["tourn_id"], "006")
+        self.assertEqual(self.index.match("US Open")["tourn_id"], "026")
+        self.assertEqual(self.index.match("AT&T Byron Nelson")["tourn_id"], "019")
+        self.assertIsNone(self.index.match("Genesis Open"))
+
+
+class TournamentMatcherTests(unittest.TestCase):
+    EVENTS = [
+        "Sony Open in Hawaii", "The American Express", "Farmers Insurance Open",
+        "AT&T Pebble Beach Pro-Am", "WM Phoenix Open", "The Genesis Invitational",
+        "Arnold Palmer Invitational presented by Mastercard", "THE PLAYERS Championship",
+        "Valspar Championship", "Masters Tournament", "RBC Heritage",
+        "THE CJ CUP Byron Nelson", "PGA Championship", "Charles Schwab Challenge",
+        "the Memorial Tournament presented by Workday", "U.S. Open", "Travelers Championship",
+        "Rocket Classic", "John Deere Classic", "The Open Championship", "3M Open",
+        "FedEx St. Jude Championship", "BMW Championship", "TOUR Championship",
+    ]
+    QUERIES = [
+        "Sony Open", "American Express", "Farmers Open", "Pebble Beach", "Phoenix Open",
+        "W.M. Phoenix Open", "Genesis Invitational", "Arnold Palmer Invitational", "The Players",
+        "Valspar", "The Masters", "RBC Heritage", "AT&T Byron Nelson", "PGA Championship",
+        "Charles Schwab", "The Memorial", "US Open", "Travelers", "Rocket Mortgage Classic",
+        "John Deere", "The Open", "3M Open", "St. Jude", "BMW", "Tour Championship",
+        "Genesis Open", "Zurich Classic", "Unknown Cup", "", "Open",
+        "Ron Nel", "nix open", "ers Insur",  # substring, but no whole word in common
+    ]
+
+    def _collapsed(self, name):
+        return sg._collapse_initialisms(sg.normalize_name(name))
+
+    def test_parity_with_linear_scan(self):
+        events = [self._collapsed(n) for n in self.EVENTS]
+        matcher = sg.TournamentMatcher((c, i) for i, c in enumerate(events))
+        for q in self.QUERIES:
+            collapsed = self._collapsed(q)
+            expected = next((i for i, e in enumerate(events) if sg._collapsed_names_match(e, collapsed)), None)
+            self.assertEqual(matcher.match(collapsed), expected, q)
+        # An earlier fragment-only match still beats a later word-sharing one.
+        matcher = sg.TournamentMatcher([("the byron nelson", "fragment"), ("ron nel championship", "words")])
+        self.assertEqual(matcher.match("ron nel"), "fragment")
+
+    def test_query_never_runs_the_linear_rule(self):
+        matcher = sg.TournamentMatcher([("sony open in hawaii", "sony"), ("rocket classic", "rocket")])
+        with mock.patch.object(sg, "_collapsed_names_match") as linear:
+            self.assertEqual(matcher.match("rocket mortgage classic"), "rocket")
+            self.assertIsNone(matcher.match("zurich"))
+        linear.assert_not_called()
+        self.assertEqual(set(matcher._postings["classic"]), {1})
+
+
+class PersistedScheduleIndexTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.entry = {"fetched_at": 1000.0, "payload": SEASON}
+        self.fetch = mock.MagicMock(side_effect=lambda path, org_id, year: self.entry)
+        for target, kwargs in (
+            ("CACHE_DIR", {"new": tmp.name}),
+            ("CACHE_ENABLED", {"new": True}),
+            ("_fetch_entry", {"new": self.fetch}),
+        ):
+            p = mock.patch.object(sg, target, **kwargs)
+            p.start()
+            self.addCleanup(p.stop)
+        p = mock.patch.dict(sg._loaded_indexes, clear=True)
+        p.start()
+        self.addCleanup(p.stop)
+
+    def next_job(self):
+        """A later process: only what was persisted carries over."""
+        sg._loaded_indexes.clear()
+
+    def test_persisted_index_reused_without_fetching(self):
+        first = sg.load_schedule_index("2026")
+        self.assertEqual(first.version, 1000.0)
+        self.next_job()
+        with mock.patch.object(sg, "parse_schedule") as parse:
+            again = sg.load_schedule_index("2026")
+        parse.assert_not_called()
+        self.assertEqual(self.fetch.call_count, 1)
+        self.assertEqual(again.version, first.version)
+        self.assertEqual(again.match("US Open")["tourn_id"], "026")
+
+    def test_refresh_rebuilds_only_for_a_newer_schedule(self):
+        sg.load_schedule_index("2026")
+        self.next_job()
+        with mock.patch.object(sg, "parse_schedule", wraps=sg.parse_schedule) as parse:
+            same = sg.load_schedule_index("2026", refresh=True)
+            parse.assert_not_called()
+            self.assertEqual(same.version, 1000.0)
+
+            self.next_job()
+            self.entry = {"fetched_at": 2000.0, "payload": {
+                "schedule": SEASON["schedule"] + [{"tournId": "100", "name": "Rocket Classic"}],
+            }}
+            rebuilt = sg.load_schedule_index("2026", refresh=True)
+            parse.assert_called_once()
+        self.assertEqual(rebuilt.version, 2000.0)
+        self.assertEqual(rebuilt.match("Rocket Classic")["tourn_id"], "100")
+
+    def test_one_schedule_load_per_season_per_run(self):
+        with mock.patch.object(sg, "CACHE_ENABLED", False):
+            for _ in range(3):
+                sg.load_schedule_index("2026")
+                sg.load_schedule_index("2026", refresh=True)
+            sg.load_schedule_index("2025")
+        self.assertEqual(self.fetch.call_count, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the typed tournament records.
+
+Run with: cd scripts && python -m unittest test_tournaments -v
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import tournaments
+from tournaments import Tournament, parse_timestamp, tournament_record
+
+
+class ParseTimestampTests(unittest.TestCase):
+    def test_formats(self):
+        want = datetime(2026, 6, 18, 11, 0, tzinfo=timezone.utc)
+        for raw in ("2026-06-18T11:00:00Z", "2026-06-18T11:00:00+00:00", "2026-06-18T11:00:00", want):
+            self.assertEqual(parse_timestamp(raw), want, raw)
+        self.assertEqual(parse_timestamp("2026-06-18T07:00:00-04:00"), want)
+
+    def test_missing_or_garbage_is_none(self):
+        for raw in (None, "", "not a date"):
+            self.assertIsNone(parse_timestamp(raw))
+
+    def test_memoized(self):
+        tournaments._parse_timestamp.cache_clear()
+        parse_timestamp("2026-06-18")
+        parse_timestamp("2026-06-18")
+        self.assertEqual(tournaments._parse_timestamp.cache_info().hits, 1)
+
+    def test_format_epoch_ms(self):
+        self.assertEqual(tournaments.format_epoch_ms(1768435200000), "2026-01-15T00:00:00+00:00")
+        self.assertIsNone(tournaments.format_epoch_ms(None))
+
+
+class TournamentRecordTests(unittest.TestCase):
+    def setUp(self):
+        self.row = {"id": "t1", "name": "US Open", "week": 23,
+                    "tournament_date": "2026-06-18T11:00:00Z", "picks_lock_time": None}
+        self.t = Tournament(self.row)
+
+    def test_decoded_fields(self):
+        start = datetime(2026, 6, 18, 11, 0, tzinfo=timezone.utc)
+        self.assertEqual(self.t.start, start)
+        self.assertEqual(self.t.end, start + timedelta(days=3, hours=23, minutes=59))
+        self.assertEqual(self.t.lock, start)  # no explicit lock: tee-off
+        self.assertEqual(self.t.season, 2026)
+
+    def test_explicit_lock_wins(self):
+        t = Tournament(dict(self.row, picks_lock_time="2026-06-17T23:00:00Z"))
+        self.assertEqual(t.lock, datetime(2026, 6, 17, 23, 0, tzinfo=timezone.utc))
+
+    def test_undated_row(self):
+        t = Tournament({"name": "TBD"})
+        self.assertIsNone(t.start)
+        self.assertIsNone(t.season)
+        self.assertFalse(t.ended(datetime.now(timezone.utc)))
+        self.assertFalse(t.open_for_picks(datetime.now(timezone.utc)))
+
+    def test_reads_and_writes_like_the_row(self):
+        self.assertEqual(self.t["name"], "US Open")
+        self.assertEqual(self.t.get("missing", 5), 5)
+        self.assertIn("week", self.t)
+        self.t["slashgolf_org_id"] = "2"
+        self.assertEqual(self.row["slashgolf_org_id"], "2")
+        self.assertIs(tournament_record(self.t), self.t)
+
+    def test_windows(self):
+        self.assertFalse(self.t.ended(self.t.end))
+        self.assertTrue(self.t.ended(self.t.end + timedelta(seconds=1)))
+        before = self.t.lock - timedelta(hours=6)
+        self.assertTrue(self.t.open_for_picks(before))
+        self.assertFalse(self.t.open_for_picks(before, horizon=before + timedelta(hours=1)))
+        self.assertFalse(self.t.open_for_picks(self.t.lock))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Unit tests for live-snapshot change detection.
+
+update_leaderboard skips the live_leaderboard upsert when the parsed board
+hashes the same as the stored snapshot, so an end-of-round run where nothing
+moved costs no JSONB rewrite or realtime fan-out. The DB is a mock here, so
+this runs offline.
+
+Run with: cd scripts && python -m unittest test_update_leaderboard -v
+"""
+
+import unittest
+from unittest import mock
+
+import slashgolf
+import update_leaderboard
+from update_leaderboard import get_current_tournaments, snapshot_hash, store_snapshot
+
+
+def _parsed(score="-9"):
+    return {
+        "tournament_name": "The Memorial",
+        "players": [
+            {"player_id": "46046", "player_name": "Scottie Scheffler", "position": "1",
+             "score": score, "status": "active", "thru": "12", "round": 2,
+             "rank": 1, "tied": False, "to_par": int(score)},
+        ],
+        "cut_line": "-1",
+        "event_status": "In Progress",
+        "round_status": "In Progress",
+        "event_completed": False,
+        "updated_ms": 1780245840000,
+    }
+
+
+def _supabase(stored_rows):
+    """A mock client whose live_leaderboard select returns ``stored_rows``."""
+    client = mock.MagicMock()
+    query = client.table.return_value.select.return_value.eq.return_value
+    query.execute.return_value.data = stored_rows
+    return client
+
+
+class SnapshotHashTests(unittest.TestCase):
+    def test_stable_across_key_order(self):
+        a = _parsed()
+        b = dict(reversed(list(a.items())))
+        b["players"] = [dict(reversed(list(p.items()))) for p in a["players"]]
+        self.assertEqual(snapshot_hash(a), snapshot_hash(b))
+
+    def test_changes_when_board_moves(self):
+        self.assertNotEqual(snapshot_hash(_parsed("-9")), snapshot_hash(_parsed("-10")))
+
+    def test_ignores_fetch_metadata(self):
+        """A newer payload stamp with an identical board is not a change."""
+        later = _parsed()
+        later["updated_ms"] += 60_000
+        self.assertEqual(snapshot_hash(_parsed()), snapshot_hash(later))
+
+
+class StoreSnapshotTests(unittest.TestCase):
+    def test_unchanged_board_skips_write(self):
+        client = _supabase([{"content_hash": snapshot_hash(_parsed())}])
+        self.assertFalse(store_snapshot(client, "t1", _parsed()))
+        client.table.return_value.upsert.assert_not_called()
+
+    def test_changed_board_is_written_with_hash(self):
+        client = _supabase([{"content_hash": snapshot_hash(_parsed("-8"))}])
+        self.assertTrue(store_snapshot(client, "t1", _parsed()))
+        row = client.table.return_value.upsert.call_args[0][0]
+        self.assertEqual(row["content_hash"], snapshot_hash(_parsed()))
+
+    def test_first_snapshot_is_written(self):
+        client = _supabase([])
+        self.assertTrue(store_snapshot(client, "t1", _parsed()))
+
+    def test_records_are_written_as_plain_rows(self):
+        """Parser records hash like their dict rows and land as JSON-ready dicts."""
+        parsed = _parsed()
+        parsed["players"] = [slashgolf.LivePlayer(**p) for p in parsed["players"]]
+        self.assertEqual(snapshot_hash(parsed), snapshot_hash(_parsed()))
+        client = _supabase([])
+        store_snapshot(client, "t1", parsed)
+        row = client.table.return_value.upsert.call_args[0][0]
+        self.assertEqual(row["players"], _parsed()["players"])
+        self.assertIs(type(row["players"][0]), dict)
+
+    def test_missing_column_falls_back_to_plain_write(self):
+        client = _supabase([])
+        client.table.return_value.select.side_effect = Exception("column does not exist")
+        self.assertTrue(store_snapshot(client, "t1", _parsed()))
+        row = client.table.return_value.upsert.call_args[0][0]
+        self.assertNotIn("content_hash", row)
+
+
+class CurrentTournamentsTests(unittest.TestCase):
+    ROWS = [  # incomplete, ordered by week as the query returns them
+        {"id": "a", "name": "Korn Ferry Event", "week": 20, "slashgolf_org_id": "2"},
+        {"id": "b", "name": "Charles Schwab Challenge", "week": 20},
+        {"id": "c", "name": "The Memorial", "week": 21, "slashgolf_org_id": "1"},
+    ]
+
+    def _client(self):
+        client = mock.MagicMock()
+        query = client.table.return_value.select.return_value.eq.return_value.order.return_value
+        query.order.return_value.range.return_value.execute.return_value.data = self.ROWS
+        return client
+
+    def test_default_tour_only(self):
+        current = get_current_tournaments(self._client(), ["1"])
+        self.assertEqual([t["id"] for t in current], ["b"])
+
+    def test_one_per_tour(self):
+        current = get_current_tournaments(self._client(), ["1", "2"])
+        self.assertEqual([t["id"] for t in current], ["b", "a"])
+
+    def test_name_lookups_use_the_requested_tours(self):
+        with mock.patch.object(update_leaderboard, "resolve_tourn_id", return_value="020") as resolve:
+            targets = update_leaderboard.resolve_targets([self.ROWS[0]], ["2", "3"])
+        self.assertEqual(resolve.call_args.args[2], ["2", "3"])
+        self.assertEqual(targets[0][2:], ("2", "020"))
+
+
+class IngestTargetsTests(unittest.TestCase):
+    TOURS = [({"id": t, "name": name, "week": 20}, "2026", org, "020")
+             for t, name, org in (("a", "PGA Event", "1"), ("b", "KFT Event", "2"), ("c", "DPWT Event", "3"))]
+
+    def _ingest(self, tourn_id, year, org_id, tournament_name):
+        if org_id == "2":
+            raise slashgolf.BudgetDeferred("held for scoring")
+        if org_id == "3":
+            raise RuntimeError("Slash Golf rate-limited (429)")
+        return {"live": _parsed(), "field": [], "event_completed": False}
+
+    def test_one_tour_failing_keeps_the_others(self):
+        with mock.patch.object(slashgolf, "ingest_leaderboard", side_effect=self._ingest):
+            ingests = update_leaderboard.ingest_targets(self.TOURS)
+        self.assertEqual(ingests[0]["live"], _parsed())
+        self.assertIsInstance(ingests[1], slashgolf.BudgetDeferred)
+        self.assertIsInstance(ingests[2], RuntimeError)
+
+    def test_update_stores_successes_and_fails_on_errors(self):
+        with mock.patch.object(update_leaderboard, "get_supabase_client"), \
+             mock.patch.object(update_leaderboard, "get_current_tournaments",
+                               return_value=[t for t, *_ in self.TOURS]), \
+             mock.patch.object(update_leaderboard, "resolve_targets", return_value=self.TOURS), \
+             mock.patch.object(slashgolf, "ingest_leaderboard", side_effect=self._ingest), \
+             mock.patch.object(update_leaderboard, "store_snapshot", return_value=True) as store:
+            self.assertFalse(update_leaderboard.update_leaderboard(dry_run=False))
+        self.assertEqual([c.args[1] for c in store.call_args_list], ["a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,10 +4,10 @@ Unit tests for the update_results run-outcome contract.
 
 The Monday scorer must return True only when it had nothing to do (an off
 week) or actually scored, and False when an ended tournament was due to be
-scored but the run couldn't apply it — couldn't map, results not final, $0
-field, or zero picks matched. The CLI turns False into a non-zero exit so a
-scheduled GitHub Actions run goes RED (with a failure notification) instead of
-a misleading green check.
+scored but the run couldn't apply it — couldn't map, results not final, the
+leaderboard schema drifted, $0 field, or zero picks matched. The CLI turns
+False into a non-zero exit so a scheduled GitHub Actions run goes RED (with a
+failure notification) instead of a misleading green check.
 
 update_results' heavy imports are lazy, and these tests patch out the DB and
 Slash Golf calls, so this runs offline.
@@ -16,6 +16,7 @@ Run with: cd scripts && python -m unittest test_update_results -v
 """
 
 import unittest
+from datetime import datetime, timezone
 from unittest import mock
 
 import update_results
@@ -72,6 +73,15 @@ class RunOutcomeTests(unittest.TestCase):
              mock.patch.object(update_results.slashgolf, "get_tournament_results", return_value=live):
             self.assertFalse(update_results.update_results(dry_run=True, force=False))
 
+    def test_schema_drift_fails(self):
+        """Rows missing fields scoring reads -> failure (red) unless forced."""
+        drifted = _final_results()
+        drifted["missing_keys"] = ["position"]
+        with mock.patch.object(update_results, "get_tournament_to_update", return_value=_tournament()), \
+             mock.patch.object(update_results, "resolve_tourn_id", return_value="026"), \
+             mock.patch.object(update_results.slashgolf, "get_tournament_results", return_value=drifted):
+            self.assertFalse(update_results.update_results(dry_run=True, force=False))
+
     def test_final_with_matches_is_success(self):
         """Final results with a matched pick -> success (green), even in a dry run."""
         picks = [{
@@ -84,6 +94,239 @@ class RunOutcomeTests(unittest.TestCase):
              mock.patch.object(update_results, "get_picks_for_tournament", return_value=picks):
             self.assertTrue(update_results.update_results(dry_run=True))
 
+    def test_rerun_writes_only_changed_picks(self):
+        """--apply again with nothing moved: no pick write, no notification."""
+        picks = [
+            {"id": "p1", "league_id": "L1", "golfer_id": "1", "golfer_name": "Winner Guy",
+             "winnings": 1000000, "penalty_amount": 0, "penalty_reason": None, "user_info": {"name": "Greg"}},
+            {"id": "p2", "league_id": "L2", "golfer_id": "1", "golfer_name": "Winner Guy",
+             "winnings": 0, "penalty_amount": 0, "penalty_reason": None, "user_info": {"name": "Ann"}},
+        ]
+        with mock.patch.object(update_results, "get_tournament_to_update", return_value=_tournament()), \
+             mock.patch.object(update_results, "resolve_tourn_id", return_value="026"), \
+             mock.patch.object(update_results.slashgolf, "get_tournament_results", return_value=_final_results()), \
+             mock.patch.object(update_results, "get_picks_for_tournament", return_value=picks), \
+             mock.patch.object(update_results, "write_pick_winnings", return_value=1) as write, \
+             mock.patch.object(update_results, "finish_apply", return_value=True) as finish:
+            self.assertTrue(update_results.update_results(dry_run=False))
+            self.assertEqual([u["pick_id"] for u in write.call_args.args[1]], ["p2"])
+            self.assertTrue(finish.call_args.kwargs["notify"])
+
+            picks[1]["winnings"] = 1000000
+            write.reset_mock()
+            self.assertTrue(update_results.update_results(dry_run=False))
+            write.assert_not_called()
+            self.assertFalse(finish.call_args.kwargs["notify"])
+
+    def test_server_scoring_calls_rpc_once(self):
+        """--server: one RPC with the parsed field, no pick fetch on the runner."""
+        client = update_results.get_supabase_client.return_value
+        client.rpc.return_value.execute.return_value.data = {
+            "picks": 3, "matched": 2, "no_pick": 1, "unmatched": [], "no_pick_inserted": 1, "written": 0,
+        }
+        with mock.patch.object(update_results, "get_tournament_to_update", return_value=_tournament()), \
+             mock.patch.object(update_results, "resolve_tourn_id", return_value="026"), \
+             mock.patch.object(update_results.slashgolf, "get_tournament_results", return_value=_final_results()), \
+             mock.patch.object(update_results, "get_picks_for_tournament") as get_picks:
+            self.assertTrue(update_results.update_results(dry_run=True, server=True))
+        get_picks.assert_not_called()
+        name, params = client.rpc.call_args.args
+        self.assertEqual(name, "score_tournament")
+        self.assertEqual(params["p_tournament_id"], "t1")
+        self.assertFalse(params["p_apply"])
+        self.assertTrue(params["p_require_match"])
+        self.assertFalse(params["p_owed_only"])  # the Monday run charges every member
+        self.assertEqual(params["p_field"], [{"player_id": "1", "name": "Winner Guy", "position": "1",
+                                              "status": "active", "winnings": 1000000}])
+
+    def test_server_refusal_fails(self):
+        """The RPC raising (zero matched, or not installed) -> failure (red)."""
+        client = update_results.get_supabase_client.return_value
+        client.rpc.return_value.execute.side_effect = Exception("ZERO real picks matched the leaderboard")
+        with mock.patch.object(update_results, "get_tournament_to_update", return_value=_tournament()), \
+             mock.patch.object(update_results, "resolve_tourn_id", return_value="026"), \
+             mock.patch.object(update_results.slashgolf, "get_tournament_results", return_value=_final_results()):
+            self.assertFalse(update_results.update_results(dry_run=False, server=True))
+
+
+class ResolveTournIdTests(unittest.TestCase):
+    def _index(self, events):
+        return update_results.slashgolf.ScheduleIndex.from_schedule({"schedule": events})
+
+    def test_stored_id_needs_no_schedule(self):
+        with mock.patch.object(update_results.slashgolf, "load_schedule_index") as load:
+            self.assertEqual(update_results.resolve_tourn_id(dict(_tournament(), slashgolf_tourn_id=26), "2026"), "26")
+        load.assert_not_called()
+
+    def test_only_a_miss_refreshes_the_index(self):
+        stale = self._index([{"tournId": "006", "name": "Sony Open in Hawaii"}])
+        fresh = self._index([{"tournId": "026", "name": "U.S. Open"}])
+        with mock.patch.object(update_results.slashgolf, "load_schedule_index",
+                               side_effect=lambda year, org_id, refresh: fresh if refresh else stale) as load:
+            self.assertEqual(update_results.resolve_tourn_id(_tournament(), "2026", ["1"]), "026")
+        self.assertEqual([c.args for c in load.call_args_list], [("2026", "1", False), ("2026", "1", True)])
+
+
+class MissingPickTests(unittest.TestCase):
+    PICKS = [{"id": "p1", "user_id": "u1", "league_id": "L1", "golfer_name": "Winner Guy"}]
+    MEMBERS = [
+        {"user_id": "u1", "league_id": "L1", "joined_at": "2026-01-01T00:00:00Z"},
+        {"user_id": "u2", "league_id": "L1", "joined_at": "2026-03-01T00:00:00Z"},
+        {"user_id": "u3", "league_id": "L1", "joined_at": "2026-07-01T00:00:00Z"},  # joined after
+        {"user_id": "u4", "league_id": "L2", "joined_at": None},
+    ]
+
+    def _client(self):
+        tables = {name: mock.MagicMock() for name in ("picks", "league_members", "profiles")}
+        picks = tables["picks"].select.return_value.eq.return_value
+        picks.order.return_value.range.return_value.execute.return_value.data = self.PICKS
+        members = tables["league_members"].select.return_value
+        members.order.return_value.range.return_value.execute.return_value.data = self.MEMBERS
+        client = mock.MagicMock()
+        client.table.side_effect = tables.__getitem__
+        return client, tables
+
+    def test_apply_inserts_a_no_pick_for_every_member_without_one(self):
+        client, tables = self._client()
+        update_results.get_picks_for_tournament(client, _tournament())
+        inserted = tables["picks"].insert.call_args.args[0]
+        self.assertEqual([row["user_id"] for row in inserted], ["u2", "u3", "u4"])
+
+    def test_owed_only_skips_members_who_joined_after_tee_off(self):
+        client, tables = self._client()
+        update_results.get_picks_for_tournament(client, _tournament(), owed_only=True)
+        inserted = tables["picks"].insert.call_args.args[0]
+        self.assertEqual([row["user_id"] for row in inserted], ["u2", "u4"])
+
+    def test_no_picks_in_memory_only_without_insert(self):
+        client, tables = self._client()
+        picks = update_results.get_picks_for_tournament(client, _tournament(), insert_missing=False, owed_only=True)
+        tables["picks"].insert.assert_not_called()
+        self.assertEqual([(p["id"], p["user_id"], p["golfer_name"]) for p in picks],
+                         [("p1", "u1", "Winner Guy"), (None, "u2", "No Pick"), (None, "u4", "No Pick")])
+
+    def test_dry_run_scores_missing_picks_without_writing(self):
+        client = mock.MagicMock()
+        with mock.patch.object(update_results, "get_picks_for_tournament",
+                               return_value=[dict(self.PICKS[0], golfer_id="1", user_info={}),
+                                             {"id": None, "user_id": "u2", "league_id": "L1",
+                                              "golfer_name": "No Pick", "user_info": {}},
+                                             {"id": "p3", "user_id": "u4", "league_id": "L2",
+                                              "golfer_name": "Not In Field", "user_info": {}}]) as get_picks, \
+             mock.patch.object(update_results, "write_pick_winnings") as write:
+            stats = {}
+            self.assertTrue(update_results.score_tournament(
+                client, _tournament(), _final_results(), {}, dry_run=True, stats=stats))
+        self.assertFalse(get_picks.call_args.kwargs["insert_missing"])
+        write.assert_not_called()
+        self.assertEqual(stats["picks"], 2)  # scored only: the unmatched pick isn't counted, as in SQL
+
+
+class BackfillTests(unittest.TestCase):
+    ROWS = [
+        {"id": "a", "name": "Sony Open", "week": 3, "tournament_date": "2026-01-15T00:00:00Z", "completed": True},
+        {"id": "b", "name": "US Open", "week": 23, "tournament_date": "2026-06-18T00:00:00Z", "completed": False},
+        {"id": "c", "name": "Old Open", "week": 23, "tournament_date": "2025-06-19T00:00:00Z", "completed": True},
+        {"id": "d", "name": "Future Open", "week": 40, "tournament_date": "2026-10-01T00:00:00Z", "completed": False},
+        {"id": "e", "name": "KFT Event", "week": 5, "tournament_date": "2026-01-29T00:00:00Z",
+         "slashgolf_org_id": "2", "completed": False},
+    ]
+    NOW = datetime(2026, 7, 1, tzinfo=timezone.utc)
+
+    def _client(self):
+        client = mock.MagicMock()
+        query = client.table.return_value.select.return_value.order.return_value
+        query.order.return_value.range.return_value.execute.return_value.data = self.ROWS
+        return client
+
+    def test_parse_week_range(self):
+        self.assertEqual(update_results.parse_week_range("5-12"), (5, 12))
+        self.assertEqual(update_results.parse_week_range("7"), (7, 7))
+        with self.assertRaises(ValueError):
+            update_results.parse_week_range("12-5")
+
+    def test_selects_ended_weeks_of_the_season_on_our_tours(self):
+        picked = update_results.get_backfill_tournaments(self._client(), "2026", org_ids=["1"], now=self.NOW)
+        self.assertEqual([t["id"] for t in picked], ["a", "b"])
+        picked = update_results.get_backfill_tournaments(self._client(), "2026", (4, 30), ["1", "2"], now=self.NOW)
+        self.assertEqual([t["id"] for t in picked], ["b", "e"])
+
+    def test_scores_each_week_and_reports_deferrals_and_errors(self):
+        weeks = [update_results.tournament_record(r) for r in self.ROWS]
+        weeks.append(update_results.tournament_record({"id": "f", "name": "Mystery Open", "week": 6}))
+
+        def resolve(tournament, org_ids):
+            if tournament["id"] == "d":
+                raise update_results.slashgolf.BudgetDeferred("no quota for /schedule")
+            return None if tournament["id"] == "f" else ("2026", "1", tournament["id"])
+
+        def leaderboard(tourn_id, year, org_id):
+            if tourn_id == "b":
+                raise update_results.slashgolf.BudgetDeferred("quota held back")
+            return {"leaderboard": tourn_id}
+
+        def earnings(tourn_id, year, org_id):
+            if tourn_id == "c":
+                raise RuntimeError("HTTP 429 from /earnings")
+            return {"earnings": tourn_id}
+
+        def score(supabase, tournament, results, settings, **kwargs):
+            kwargs["stats"].update(picks=4, written=2)
+            return True
+
+        sg = update_results.slashgolf
+        with mock.patch.object(update_results, "get_supabase_client"), \
+             mock.patch.object(update_results, "get_all_league_settings", return_value={}), \
+             mock.patch.object(update_results, "get_backfill_tournaments", return_value=weeks), \
+             mock.patch.object(update_results, "resolve_target", side_effect=resolve), \
+             mock.patch.object(sg, "fetch_leaderboard", side_effect=leaderboard), \
+             mock.patch.object(sg, "fetch_earnings", side_effect=earnings), \
+             mock.patch.object(sg, "fetch_concurrently", wraps=sg.fetch_concurrently) as batch, \
+             mock.patch.object(sg, "tournament_results", return_value=_final_results()) as parse, \
+             mock.patch.object(update_results, "score_tournament", side_effect=score) as scored:
+            self.assertFalse(update_results.backfill_results("2026", dry_run=False))
+        # One flat batch: leaderboard + earnings for each of the 4 mapped weeks.
+        batch.assert_called_once()
+        self.assertEqual(len(batch.call_args.args[0]), 8)
+        self.assertEqual([c.args[:3] for c in parse.call_args_list], [
+            ({"leaderboard": "a"}, {"earnings": "a"}, "a"),
+            ({"leaderboard": "e"}, {"earnings": "e"}, "e"),
+        ])
+        # Unmapped, deferred and failed weeks are skipped; the rest score.
+        self.assertEqual([c.args[1]["id"] for c in scored.call_args_list], ["a", "e"])
+        self.assertFalse(scored.call_args.kwargs["notify"])
+        # An apply stores the owed No Picks, but not for weeks before a member joined.
+        self.assertFalse(scored.call_args.kwargs["dry_run"])
+        self.assertTrue(scored.call_args.kwargs["owed_only"])
+
+
+class WritePickWinningsTests(unittest.TestCase):
+    def _updates(self, n):
+        return [{"pick_id": f"p{i}", "winnings": 1068200.0, "penalty": 0, "penalty_reason": None}
+                for i in range(n)] + [{"pick_id": "bad", "winnings": 0, "error": "not_found"}]
+
+    def test_chunks_through_rpc_with_int_coercion(self):
+        supabase = mock.MagicMock()
+        written = update_results.write_pick_winnings(supabase, self._updates(5), chunk_size=2)
+        self.assertEqual(written, 5)
+        calls = supabase.rpc.call_args_list
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(calls[0].args[0], "apply_pick_winnings")
+        first = calls[0].args[1]["updates"][0]
+        self.assertEqual(first, {"pick_id": "p0", "winnings": 1068200, "penalty_amount": 0, "penalty_reason": None})
+        self.assertIsInstance(first["winnings"], int)
+        supabase.table.assert_not_called()
+
+    def test_falls_back_to_per_pick_without_rpc(self):
+        supabase = mock.MagicMock()
+        supabase.rpc.side_effect = Exception("function apply_pick_winnings does not exist")
+        updates = self._updates(2)
+        updates[1].update(penalty=10.0, penalty_reason="missed_cut")
+        with mock.patch.object(update_results, "update_pick_winnings") as per_pick:
+            self.assertEqual(update_results.write_pick_winnings(supabase, updates), 2)
+        self.assertEqual([c.args[1:] for c in per_pick.call_args_list],
+                         [("p0", 1068200, 0, None), ("p1", 1068200, 10, "missed_cut")])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Typed tournament rows, with their dates decoded once.
+
+Every job reads the same few instants off a ``tournaments`` row — first-round
+tee-off (``tournament_date``), the pick lock (``picks_lock_time``), when play
+is over, and the season — and each used to re-parse the ISO strings itself,
+per row, per run. Here a row is wrapped once in a Tournament whose ``start``,
+``end``, ``lock`` and ``season`` are already decoded, and the string parsing
+behind them is memoized, so a timestamp shared by many rows (or seen again by
+a later helper in the same run) is parsed once.
+
+A Tournament still reads and writes like the row dict it wraps
+(``t["name"]``, ``t.get("week")``, ``t["slashgolf_org_id"] = ...``), so
+records can be handed to code that expects rows.
+
+Standard library only; safe to import anywhere.
+"""
+
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+# Play starts Thursday and ends Sunday night, so an event is over once we're
+# past start + 3 days 23:59.
+PLAY_LENGTH = timedelta(days=3, hours=23, minutes=59)
+
+TIMESTAMP_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def _parse_timestamp(text):
+    try:
+        dt = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def parse_timestamp(raw):
+    """An ISO timestamp (as Supabase or Slash Golf render it) as an aware
+    datetime, or None when missing or unparseable. Naive values are UTC."""
+    if not raw:
+        return None
+    if isinstance(raw, datetime):
+        return raw if raw.tzinfo else raw.replace(tzinfo=timezone.utc)
+    return _parse_timestamp(str(raw))
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def format_epoch_ms(ms):
+    """Epoch millis as a UTC ISO string (None for 0/None)."""
+    if not ms:
+        return None
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).isoformat()
+
+
+class Tournament:
+    """One ``tournaments`` row plus its decoded instants:
+
+      start   first-round tee-off (tournament_date), or None
+      end     start + PLAY_LENGTH, or None
+      lock    picks_lock_time, falling back to start (you can't pick once
+              play has started), or None
+      season  start's calendar year (the Slash Golf season), or None
+    """
+
+    __slots__ = ("row", "start", "end", "lock", "season")
+
+    def __init__(self, row):
+        self.row = row
+        self.start = parse_timestamp(row.get("tournament_date"))
+        self.end = self.start + PLAY_LENGTH if self.start else None
+        self.lock = parse_timestamp(row.get("picks_lock_time")) or self.start
+        self.season = self.start.year if self.start else None
+
+    # Row access, so a record can stand in for the dict it wraps.
+    def __getitem__(self, key):
+        return self.row[key]
+
+    def __setitem__(self, key, value):
+        self.row[key] = value
+
+    def __contains__(self, key):
+        return key in self.row
+
+    def get(self, key, default=None):
+        return self.row.get(key, default)
+
+    def __repr__(self):
+        return f"Tournament({self.row.get('name')!r}, week={self.row.get('week')!r}, start={self.start})"
+
+    def ended(self, now):
+        """Play is over (False when the start date isn't known)."""
+        return self.end is not None and now > self.end
+
+    def open_for_picks(self, now, horizon=None):
+        """The pick lock is still ahead of ``now`` (and no later than
+        ``horizon``, when given)."""
+        if self.lock is None or not now < self.lock:
+            return False
+        return horizon is None or self.lock <= horizon
+
+
+def tournament_record(row):
+    """``row`` as a Tournament (records pass through unchanged)."""
+    return row if isinstance(row, Tournament) else Tournament(row)
+
+
+def tournament_records(rows):
+    """A list of Tournament records for ``rows`` (None-safe)."""
+    return [tournament_record(row) for row in rows or []]
@@ -12,98 +12,218 @@ event (that is the Monday job, update_results.py). A live refresh is therefore
 a single API call, cheap enough to run a handful of times each tournament day.
 
 Which event to snapshot is driven by OUR schedule: the earliest tournament that
-isn't completed yet. If it hasn't teed off, the leaderboard comes back empty and
-nothing is written (so an off-week or a Wednesday run is a harmless no-op).
+isn't completed yet — one per tour when ORG_IDS lists several, fetched
+concurrently against the shared budget. If it hasn't teed off, the leaderboard
+comes back empty and nothing is written (so an off-week or a Wednesday run is
+a harmless no-op). A tour whose fetch is deferred or fails is reported and
+skipped; the others are still stored.
+
+Each snapshot is stored with a content hash. When a run fetches a board that
+hashes the same as the stored one (nothing moved since the last run), the
+write is skipped — no JSONB rewrite, no realtime fan-out to every open app.
 
 Usage:
     python update_leaderboard.py            # dry run, prints a preview
     python update_leaderboard.py --apply    # store the snapshot
+    python update_leaderboard.py --no-cache # bypass the Slash Golf response cache
+    python update_leaderboard.py --orgs 1,2 # every tour's current event (default: ORG_IDS)
 """
 
+import hashlib
+import json
 import sys
 from datetime import datetime, timezone
 
+import api_budget
 import slashgolf
-from golf_common import get_supabase_client
+from golf_common import get_supabase_client, paginate
 # Reuse the schedule->Slash Golf event mapping the scorer already implements.
-from update_results import resolve_tourn_id, tournament_season_year
-
-ORG_ID = slashgolf.DEFAULT_ORG_ID
-
-
-def get_current_tournament(supabase):
-    """The tournament the league is currently on: earliest by week that isn't
-    completed. Returns None when everything is already scored."""
-    resp = (
-        supabase.table("tournaments")
-        .select("*")
-        .eq("completed", False)
-        .order("week")
-        .limit(1)
-        .execute()
-    )
-    return resp.data[0] if resp.data else None
+from update_results import resolve_tourn_id, tournament_org_id, tournament_season_year
+
+
+def get_current_tournaments(supabase, org_ids=None):
+    """The tournament each tour in ``org_ids`` is currently on: per tour, the
+    earliest by week that isn't completed. With a single tour that's the one
+    tournament the league is on. Empty when everything is already scored."""
+    org_ids = org_ids or slashgolf.ORG_IDS
+    rows = paginate(lambda: supabase.table("tournaments").select("*").eq("completed", False).order("week"))
+    current = {}
+    for t in rows:
+        current.setdefault(tournament_org_id(t), t)
+    return [current[org] for org in org_ids if org in current]
+
+
+def resolve_targets(tournaments, org_ids=None):
+    """Map each current tournament to ``(tournament, year, org_id, tourn_id)``
+    (name lookups across ``org_ids``), reporting (and dropping) any that can't
+    be mapped to a Slash Golf event."""
+    targets = []
+    for t in tournaments:
+        year = tournament_season_year(t)
+        tourn_id = resolve_tourn_id(t, year, org_ids)
+        if not tourn_id:
+            print(f"Could not map '{t['name']}' to a Slash Golf event; skipping.")
+            continue
+        targets.append((t, year, tournament_org_id(t), tourn_id))
+    return targets
+
+
+def _ingest_or_error(tourn_id, year, org_id, tournament_name):
+    """ingest_leaderboard, but a budget deferral or failed fetch (429, HTTP
+    error, bad payload) comes back as the value instead of raising."""
+    try:
+        return slashgolf.ingest_leaderboard(tourn_id, year, org_id, tournament_name)
+    except Exception as exc:
+        return exc
+
+
+def ingest_targets(targets):
+    """Fetch every target's leaderboard at once (bounded by
+    slashgolf.MAX_CONCURRENCY, one shared budget); results are in order. A
+    tour whose fetch was deferred or failed gets the exception in its slot,
+    so it can't throw away the other tours' (already paid-for) fetches."""
+    return slashgolf.fetch_concurrently([
+        (_ingest_or_error, (tourn_id, year, org_id, t["name"]))
+        for t, year, org_id, tourn_id in targets
+    ])
+
+
+def report_ingest_error(tournament, exc):
+    """Say why a tour has no leaderboard this run. Returns True for a real
+    failure, False for a budget deferral (the next cron retries it)."""
+    if isinstance(exc, slashgolf.BudgetDeferred):
+        print(f"\n'{tournament['name']}': deferred: {exc}")
+        return False
+    print(f"\n'{tournament['name']}': fetch FAILED: {type(exc).__name__}: {exc}")
+    return True
+
+
+def snapshot_hash(parsed):
+    """A stable digest of everything the app renders from a snapshot: the
+    players, cut line and statuses. Key order and whitespace can't change it;
+    only the board itself can."""
+    content = {
+        "players": slashgolf.player_rows(parsed["players"]),
+        "cut_line": parsed["cut_line"],
+        "event_status": parsed["event_status"],
+        "round_status": parsed["round_status"],
+    }
+    blob = json.dumps(content, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def get_stored_hash(supabase, tournament_id):
+    """Return ``(stored_hash, supported)`` for a tournament's snapshot.
+
+    ``supported`` is False when the content_hash column doesn't exist yet
+    (add-live-leaderboard-hash.sql not run); the caller then writes every run
+    as it always has rather than failing the update.
+    """
+    try:
+        rows = (
+            supabase.table("live_leaderboard")
+            .select("content_hash")
+            .eq("tournament_id", tournament_id)
+            .execute()
+            .data
+            or []
+        )
+    except Exception as exc:
+        print(f"  (change detection unavailable: {exc})")
+        return None, False
+    return (rows[0].get("content_hash") if rows else None), True
 
 
 def store_snapshot(supabase, tournament_id, parsed):
-    """Upsert the single live snapshot row for a tournament."""
+    """Upsert the single live snapshot row for a tournament, unless it is
+    unchanged since the last write. Returns True if a row was written."""
+    content_hash = snapshot_hash(parsed)
+    stored_hash, supported = get_stored_hash(supabase, tournament_id)
+    if supported and stored_hash == content_hash:
+        return False
+
     row = {
         "tournament_id": tournament_id,
-        "players": parsed["players"],
+        "players": slashgolf.player_rows(parsed["players"]),
         "cut_line": parsed["cut_line"],
         "event_status": parsed["event_status"],
         "round_status": parsed["round_status"],
         "updated_at": datetime.now(timezone.utc).isoformat(),
     }
+    if supported:
+        row["content_hash"] = content_hash
     supabase.table("live_leaderboard").upsert(row, on_conflict="tournament_id").execute()
+    return True
 
 
-def update_leaderboard(dry_run=True):
+def update_leaderboard(dry_run=True, org_ids=None):
+    """Snapshot every tour's current event. Returns False if any tour's fetch
+    failed (the others are still stored), True otherwise."""
     print("=" * 50)
     print("Golf League Live Leaderboard Updater (Slash Golf)")
     print("=" * 50)
 
     supabase = get_supabase_client()
-    tournament = get_current_tournament(supabase)
-    if not tournament:
+    tournaments = get_current_tournaments(supabase, org_ids)
+    if not tournaments:
         print("No active tournament (everything is scored). Nothing to do.")
-        return
-
-    year = tournament_season_year(tournament)
-    print(f"Active tournament: '{tournament['name']}' (Week {tournament['week']}, season {year})")
-
-    tourn_id = resolve_tourn_id(tournament, year)
-    if not tourn_id:
-        print("Could not map this tournament to a Slash Golf event; skipping.")
-        return
-
-    parsed = slashgolf.get_live_leaderboard(
-        tourn_id, year, ORG_ID, tournament_name=tournament["name"]
-    )
-    n = len(parsed["players"])
-    print(
-        f"Fetched leaderboard: {n} players, status={parsed['event_status']!r}, "
-        f"round_status={parsed['round_status']!r}, cut_line={parsed['cut_line']!r}"
-    )
-
-    if n == 0:
-        print("Leaderboard is empty (event hasn't started). Nothing to store.")
-        return
+        return True
+
+    for t in tournaments:
+        print(f"Active tournament: '{t['name']}' (Week {t['week']}, season {tournament_season_year(t)}, "
+              f"orgId {tournament_org_id(t)})")
+
+    targets = resolve_targets(tournaments, org_ids)
+    changed = stored = failed = 0
+    for (tournament, _, _, _), ingest in zip(targets, ingest_targets(targets)):
+        if isinstance(ingest, Exception):
+            failed += report_ingest_error(tournament, ingest)
+            continue
+        parsed = ingest["live"]
+        n = len(parsed["players"])
+        print(
+            f"\n'{tournament['name']}': {n} players, status={parsed['event_status']!r}, "
+            f"round_status={parsed['round_status']!r}, cut_line={parsed['cut_line']!r}"
+        )
+
+        if n == 0:
+            print("Leaderboard is empty (event hasn't started). Nothing to store.")
+            continue
+
+        if dry_run:
+            for p in parsed["players"][:8]:
+                thru = f" thru {p['thru']}" if p.get("thru") else ""
+                print(f"  {p['position']:>4}  {p['player_name']:<24} {p['score']:>4}  {p['status']}{thru}")
+            continue
+
+        stored += 1
+        if store_snapshot(supabase, tournament["id"], parsed):
+            changed += 1
+            print("Snapshot stored.")
+        else:
+            print("Leaderboard unchanged since the last snapshot; write skipped.")
 
     if dry_run:
-        for p in parsed["players"][:8]:
-            thru = f" thru {p['thru']}" if p.get("thru") else ""
-            print(f"  {p['position']:>4}  {p['player_name']:<24} {p['score']:>4}  {p['status']}{thru}")
         print("\n[DRY RUN] No changes made. Run with --apply to store the snapshot.")
-        return
-
-    store_snapshot(supabase, tournament["id"], parsed)
-    print("Snapshot stored.")
+        return not failed
+    print(f"\nRows changed: {changed}/{stored}")
     print("Done!")
+    return not failed
 
 
 if __name__ == "__main__":
     dry_run = "--apply" not in sys.argv
+    if "--no-cache" in sys.argv:
+        slashgolf.disable_cache()
+    slashgolf.set_budget(api_budget.Budget("update_leaderboard", "live"))
     if dry_run:
         print("Running in DRY RUN mode (no DB writes). Use --apply to store.\n")
-    update_leaderboard(dry_run=dry_run)
+    ok = True
+    try:
+        ok = update_leaderboard(dry_run=dry_run, org_ids=slashgolf.org_ids_from_args(sys.argv))
+    except slashgolf.BudgetDeferred as exc:
+        # The rest of today's quota is held for the Monday scorer; the next
+        # evening run refreshes the board instead.
+        print(f"\nDeferred: {exc}")
+    if not ok:
+        sys.exit(1)  # a tour's fetch failed: go red so someone looks
@@ -17,14 +17,25 @@ Which week to score is driven by OUR schedule (the most recent ended-but-
 incomplete tournament), never by whatever event the API happens to surface.
 If a tournament can't be mapped or results aren't final, the commissioner can
 still override results manually through CommissionerTab in the web app.
+
+With --server, the gates still run here but the picks are scored inside
+Postgres in one transaction (create-score-tournament.sql), so the run no
+longer fetches and rewrites every league's picks itself.
+
+With --season/--range, every ended week in that span is (re)scored in one
+run (backfill_results), e.g. to catch up after missed Mondays or to rescore
+a season after a rule change.
 """
 
 import sys
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import datetime, timezone
 
+import api_budget
 import slashgolf
-from golf_common import get_supabase_client
-from slashgolf import normalize_name, tournament_names_match
+from golf_common import get_supabase_client, paginate
+from slashgolf import normalize_name
+from tournaments import parse_timestamp, tournament_record
 
 # orgId 1 = PGA Tour.
 ORG_ID = slashgolf.DEFAULT_ORG_ID
@@ -33,84 +44,103 @@ ORG_ID = slashgolf.DEFAULT_ORG_ID
 # ---------------------------------------------------------------------------
 # Tournament selection (schedule-driven) + Slash Golf event mapping
 # ---------------------------------------------------------------------------
-def get_tournament_to_update(supabase):
+def tournament_org_id(tournament):
+    """The Slash Golf tour (orgId) a tournament belongs to. Rows the schedule
+    sync hasn't tagged — every row, in a single-tour setup — are on the
+    default tour."""
+    return str(tournament.get("slashgolf_org_id") or ORG_ID)
+
+
+def get_tournament_to_update(supabase, org_ids=None):
     """Pick which tournament a run should score: the most recent one that has
-    finished play but isn't marked completed yet.
+    finished play but isn't marked completed yet, on one of ``org_ids``
+    (default: slashgolf.ORG_IDS).
 
     The league's own calendar decides the target week, NOT whatever event the
     API is showing. Tournaments are shared across all leagues. Returns None
     when nothing has both ended and is still pending (an off week, or
-    everything is already scored).
+    everything is already scored). The pick comes back as a
+    tournaments.Tournament record.
     """
-    response = (
-        supabase.table("tournaments")
-        .select("*")
-        .eq("completed", False)
-        .order("week", desc=True)
-        .execute()
+    org_ids = org_ids or slashgolf.ORG_IDS
+    rows = paginate(
+        lambda: supabase.table("tournaments").select("*").eq("completed", False).order("week", desc=True)
     )
-    if not response.data:
-        return None
-
     now = datetime.now(timezone.utc)
     # Ordered week-DESC, so the first ended-but-incomplete tournament is the
-    # most recent. Play starts Thursday and ends Sunday night, so it's over
-    # once we're past start + 3 days 23:59.
-    for tournament in response.data:
-        date_str = tournament.get("tournament_date")
-        if not date_str:
-            continue
-        start = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        if start.tzinfo is None:
-            start = start.replace(tzinfo=timezone.utc)
-        end = start + timedelta(days=3, hours=23, minutes=59)
-        if now > end:
+    # most recent.
+    for tournament in map(tournament_record, rows):
+        if tournament_org_id(tournament) in org_ids and tournament.ended(now):
             return tournament
 
     return None
 
 
 def tournament_season_year(tournament):
-    """The Slash Golf season year for a tournament, taken from its date."""
-    date_str = tournament.get("tournament_date")
-    if date_str:
-        try:
-            return str(datetime.fromisoformat(date_str.replace("Z", "+00:00")).year)
-        except ValueError:
-            pass
-    return str(datetime.now(timezone.utc).year)
+    """The Slash Golf season year for a tournament (row or record), taken
+    from its date; the current year when that's unknown."""
+    season = tournament_record(tournament).season
+    return str(season or datetime.now(timezone.utc).year)
 
 
-def resolve_tourn_id(tournament, year):
+def resolve_tourn_id(tournament, year, org_ids=None):
     """Find the Slash Golf tournId for a DB tournament.
 
     Prefers the stored ``slashgolf_tourn_id`` (set by sync_schedule.py). Falls
-    back to a one-time name match against that season's /schedule so scoring
-    still works before a sync has run. Returns None if it can't be mapped.
+    back to a name lookup in that season's persisted schedule index so scoring
+    still works before a sync has run — trying the tournament's own tour, then
+    the rest of ``org_ids`` (exact names only there, as in sync_schedule's
+    match_event). Only a miss refreshes the index against /schedule (an event
+    added since it was built). A match on another tour is noted on the row
+    dict (``slashgolf_org_id``) so tournament_org_id() fetches from the right
+    one. Returns None if it can't be mapped.
     """
     stored = tournament.get("slashgolf_tourn_id")
     if stored:
         return str(stored)
 
-    print("  No stored slashgolf_tourn_id — resolving via /schedule name match...")
-    schedule = slashgolf.parse_schedule(slashgolf.fetch_schedule(year, ORG_ID))
-    for ev in schedule:
-        if ev["tourn_id"] and tournament_names_match(ev["name"], tournament["name"]):
-            print(f"  Matched '{tournament['name']}' -> '{ev['name']}' (tournId={ev['tourn_id']})")
-            return ev["tourn_id"]
+    print("  No stored slashgolf_tourn_id — resolving via the season schedule index...")
+    own = tournament_org_id(tournament)
+    for refresh in (False, True):
+        for org_id in [own] + [o for o in (org_ids or slashgolf.ORG_IDS) if o != own]:
+            index = slashgolf.load_schedule_index(year, org_id, refresh)
+            ev = index.match(tournament["name"], loose=org_id == own)
+            if ev:
+                print(f"  Matched '{tournament['name']}' -> '{ev['name']}' (orgId={org_id}, tournId={ev['tourn_id']})")
+                tournament["slashgolf_org_id"] = org_id
+                return ev["tourn_id"]
     return None
 
 
 # ---------------------------------------------------------------------------
 # Picks + settings
 # ---------------------------------------------------------------------------
-def get_picks_for_tournament(supabase, tournament_id):
-    """Get all picks for a tournament across all leagues, inserting 'No Pick'
-    rows for members who didn't submit."""
-    picks = supabase.table("picks").select("*").eq("tournament_id", tournament_id).execute().data or []
+def member_owes_pick(member, tournament):
+    """Whether a league member had joined before ``tournament`` started, and
+    so owes a pick for it when a past week is backfilled. Rows without
+    joined_at, or an undated tournament, count as owing."""
+    joined = parse_timestamp(member.get("joined_at"))
+    start = tournament_record(tournament).start
+    return joined is None or start is None or joined < start
+
+
+def get_picks_for_tournament(supabase, tournament, insert_missing=True, owed_only=False):
+    """Get all picks for a tournament across all leagues, plus a 'No Pick'
+    for every member who didn't submit (with ``owed_only``, only members who
+    had joined by then — member_owes_pick).
+
+    With ``insert_missing`` those are inserted as real rows; without it (dry
+    runs) nothing is written and they come back in memory only, with ``id``
+    None."""
+    tournament_id = tournament["id"]
+
+    def picks_query():
+        return supabase.table("picks").select("*").eq("tournament_id", tournament_id)
+
+    picks = list(paginate(picks_query))
     existing = set((p["user_id"], p["league_id"]) for p in picks)
 
-    all_members = supabase.table("league_members").select("user_id, league_id").execute().data or []
+    all_members = paginate(lambda: supabase.table("league_members").select("user_id, league_id, joined_at"))
     missing = [
         {
             "user_id": m["user_id"],
@@ -120,18 +150,21 @@ def get_picks_for_tournament(supabase, tournament_id):
             "winnings": 0,
         }
         for m in all_members
-        if (m["user_id"], m["league_id"]) not in existing
+        if (m["user_id"], m["league_id"]) not in existing and (not owed_only or member_owes_pick(m, tournament))
     ]
-    if missing:
+    if missing and insert_missing:
         print(f"  Inserting {len(missing)} 'No Pick' row(s) for members who didn't submit")
         supabase.table("picks").insert(missing).execute()
-        picks = supabase.table("picks").select("*").eq("tournament_id", tournament_id).execute().data or []
+        picks = list(paginate(picks_query))
+    elif missing:
+        print(f"  {len(missing)} member(s) didn't submit; scoring their 'No Pick' in memory (not inserted)")
+        picks += [dict(m, id=None) for m in missing]
 
     # Attach display names.
     user_ids = list(set(p["user_id"] for p in picks if p.get("user_id")))
     users_map = {}
     if user_ids:
-        rows = supabase.table("profiles").select("id, name").in_("id", user_ids).execute().data or []
+        rows = paginate(lambda: supabase.table("profiles").select("id, name").in_("id", user_ids))
         users_map = {u["id"]: u for u in rows}
     for pick in picks:
         pick["user_info"] = users_map.get(pick.get("user_id"), {})
@@ -141,7 +174,7 @@ def get_picks_for_tournament(supabase, tournament_id):
 
 def get_all_league_settings(supabase):
     """Get settings for all leagues, keyed by league_id."""
-    rows = supabase.table("league_settings").select("*").execute().data or []
+    rows = paginate(lambda: supabase.table("league_settings").select("*"), order="league_id")
     return {s["league_id"]: s for s in rows}
 
 
@@ -168,6 +201,74 @@ def update_pick_winnings(supabase, pick_id, winnings, penalty_amount=0, penalty_
     supabase.table("picks").update(update_data).eq("id", pick_id).execute()
 
 
+def pick_changes(update, pick):
+    """What writing ``update`` would change on the stored ``pick`` row, as
+    ``{column: (stored, new)}``; empty when the write would be a no-op.
+
+    Mirrors the write itself: winnings is always written (as an int), the
+    penalty columns only when the penalty is > 0."""
+    changes = {}
+    winnings = int(round(update["winnings"] or 0))
+    if pick.get("winnings") != winnings:
+        changes["winnings"] = (pick.get("winnings"), winnings)
+    penalty = update.get("penalty", 0) or 0
+    if penalty > 0:
+        amount = int(round(penalty))
+        if pick.get("penalty_amount") != amount:
+            changes["penalty_amount"] = (pick.get("penalty_amount"), amount)
+        if pick.get("penalty_reason") != update.get("penalty_reason"):
+            changes["penalty_reason"] = (pick.get("penalty_reason"), update.get("penalty_reason"))
+    return changes
+
+
+def print_change_set(changed, total):
+    """The audit trail for a scoring run: one line per pick that differs."""
+    print(f"\nChange set: {len(changed)} of {total} scored pick(s) differ from what's stored")
+    for update, changes in changed:
+        diff = "; ".join(f"{col} {old!r} -> {new!r}" for col, (old, new) in changes.items())
+        print(f"  {update['user']} [{update['league_id']}] {update.get('golfer') or 'No pick'}: {diff}")
+
+
+# Picks per apply_pick_winnings call: keeps each request body small while
+# cutting a busy week to a handful of round trips.
+PICK_WRITE_CHUNK = 500
+
+
+def write_pick_winnings(supabase, updates, chunk_size=PICK_WRITE_CHUNK):
+    """Write scored ``updates`` (the scorer's update dicts; rows with an
+    ``error`` are skipped) and return how many picks were written.
+
+    Sends chunks through the apply_pick_winnings RPC
+    (create-apply-pick-winnings.sql), which applies the same int coercion and
+    penalty-only-when-positive rule as update_pick_winnings. If the RPC isn't
+    installed (or a chunk fails), the rest are written one pick at a time.
+    """
+    rows = [
+        {
+            "pick_id": u["pick_id"],
+            "winnings": int(round(u["winnings"] or 0)),
+            "penalty_amount": int(round(u.get("penalty", 0) or 0)),
+            "penalty_reason": u.get("penalty_reason"),
+        }
+        for u in updates
+        if not u.get("error")
+    ]
+    written = 0
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        try:
+            supabase.rpc("apply_pick_winnings", {"updates": chunk}).execute()
+        except Exception as exc:
+            print(f"  (bulk write skipped: {exc}; writing per pick)")
+            break
+        written += len(chunk)
+    for row in rows[written:]:
+        update_pick_winnings(
+            supabase, row["pick_id"], row["winnings"], row["penalty_amount"], row["penalty_reason"],
+        )
+    return len(rows)
+
+
 def mark_tournament_completed(supabase, tournament_id):
     """Mark a tournament as completed."""
     supabase.table("tournaments").update({"completed": True}).eq("id", tournament_id).execute()
@@ -182,10 +283,16 @@ def set_tournament_winner(supabase, tournament_id, winner_name):
 # Matching + penalties
 # ---------------------------------------------------------------------------
 def index_players(players):
-    """Build (by_player_id, by_normalized_name) lookups for a parsed field."""
-    by_id = {p["player_id"]: p for p in players if p.get("player_id")}
+    """Build (by_player_id, by_normalized_name) lookups for a parsed field.
+
+    Both indexes hold the same slashgolf.Player records (or row dicts) the
+    parser produced, so a season's worth of fields isn't copied per lookup."""
+    by_id = {}
     by_norm = {}
     for p in players:
+        pid = p.get("player_id")
+        if pid:
+            by_id[pid] = p
         norm = normalize_name(p.get("player_name", ""))
         if norm:
             by_norm.setdefault(norm, p)
@@ -216,9 +323,8 @@ def backfill_available_golfer_ids(supabase, players):
     """
     try:
         by_norm = field_ids_by_norm(players)
-        rows = supabase.table("available_golfers").select("*").execute().data or []
         filled = 0
-        for g in rows:
+        for g in paginate(lambda: supabase.table("available_golfers").select("*")):
             if g.get("golfer_id"):
                 continue
             pid = by_norm.get(normalize_name(g.get("name", "")))
@@ -231,22 +337,79 @@ def backfill_available_golfer_ids(supabase, players):
         print(f"  (golfer_id backfill skipped: {exc})")
 
 
-def match_pick_to_player(pick, by_id, by_norm):
-    """Resolve a pick to a leaderboard player.
+def match_picks(picks, players, by_norm, frame=None):
+    """Resolve each pick to a leaderboard player; a list aligned with
+    ``picks`` (None = no match).
 
     Exact ``golfer_id`` join first (the normal path for picks made through the
-    app). Falls back to an exact normalized-name match for legacy picks with
-    no golfer_id. No fuzzy matching: a miss is an honest miss.
+    app), done for every pick at once against the field frame
+    (FieldFrame.index_of; the first of duplicate ids wins, as in
+    score_tournament() in SQL). Picks it misses fall back to an exact
+    normalized-name match — legacy picks with no golfer_id. No fuzzy matching:
+    a miss is an honest miss.
+    """
+    if frame is None:
+        from field_frame import FieldFrame
+        frame = FieldFrame.from_players(players)
+    rows = frame.index_of([str(p.get("golfer_id") or "") for p in picks])
+    matches = []
+    for pick, row in zip(picks, rows):
+        if row >= 0:
+            matches.append(players[row])
+            continue
+        norm = normalize_name(pick.get("golfer_name", ""))
+        matches.append(by_norm.get(norm) if norm else None)
+    return matches
+
+
+def _trigrams(norm):
+    """Character trigrams of a normalized name, padded so word boundaries
+    count ('ben' -> '  b', ' be', 'ben', 'en ')."""
+    padded = f"  {norm} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameSuggester:
+    """"Did you mean" lookups for picks that missed the field.
+
+    Built once per run over index_players' ``by_norm``: each field name's
+    trigram set, plus an inverted index from trigram to the names containing
+    it, so ranking a miss only touches names that share a trigram with it
+    (never the whole field). Candidates are scored by Dice similarity
+    (2 * shared / total trigrams). Report-only: nothing here feeds scoring,
+    which stays an exact join.
     """
-    gid = pick.get("golfer_id")
-    if gid:
-        player = by_id.get(str(gid))
-        if player:
-            return player
-    norm = normalize_name(pick.get("golfer_name", ""))
-    if norm:
-        return by_norm.get(norm)
-    return None
+
+    MIN_SIMILARITY = 0.35
+
+    def __init__(self, by_norm):
+        self._names = list(by_norm.items())
+        self._sizes = []
+        self._postings = {}
+        for i, (norm, _) in enumerate(self._names):
+            grams = _trigrams(norm)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(i)
+
+    def suggest(self, name, limit=3):
+        """Up to ``limit`` ``(player, similarity)`` pairs for ``name``, best
+        first; empty when nothing in the field is close."""
+        norm = normalize_name(name)
+        if not norm:
+            return []
+        grams = _trigrams(norm)
+        shared = {}
+        for gram in grams:
+            for i in self._postings.get(gram, ()):
+                shared[i] = shared.get(i, 0) + 1
+        scored = []
+        for i, count in shared.items():
+            similarity = 2 * count / (len(grams) + self._sizes[i])
+            if similarity >= self.MIN_SIMILARITY:
+                scored.append((similarity, i))
+        scored.sort(key=lambda x: (-x[0], x[1]))
+        return [(self._names[i][1], round(similarity, 2)) for similarity, i in scored[:limit]]
 
 
 def calculate_penalty(status, position, league_settings):
@@ -260,10 +423,69 @@ def calculate_penalty(status, position, league_settings):
     return 0, None
 
 
+# ---------------------------------------------------------------------------
+# Server-side scoring (--server)
+# ---------------------------------------------------------------------------
+def field_payload(players):
+    """The parsed field as score_tournament() takes it, in leaderboard order
+    (winnings coerced to int, as for the per-pick writes)."""
+    return [
+        {
+            "player_id": p.get("player_id") or "",
+            "name": p.get("player_name") or "",
+            "position": p.get("position") or "",
+            "status": p.get("status") or "",
+            "winnings": int(round(p.get("winnings") or 0)),
+        }
+        for p in players
+    ]
+
+
+def score_on_server(supabase, tournament, players, apply=False, require_match=True, owed_only=False):
+    """Score every league's picks in one database transaction through the
+    score_tournament RPC (create-score-tournament.sql): the golfer_id/name
+    join, penalties and 'No Pick' inserts all happen in Postgres. Returns the
+    RPC's summary dict, or None when it refused or failed (nothing
+    written)."""
+    started = time.perf_counter()
+    try:
+        summary = supabase.rpc("score_tournament", {
+            "p_tournament_id": tournament["id"],
+            "p_field": field_payload(players),
+            "p_apply": apply,
+            "p_require_match": require_match,
+            "p_owed_only": owed_only,
+        }).execute().data
+    except Exception as exc:
+        print("\n" + "!" * 60)
+        print(f"SERVER-SIDE SCORING FAILED: {exc}")
+        print("Nothing was written (the RPC runs in one transaction). Check that")
+        print("create-score-tournament.sql is installed, or re-run without --server.")
+        print("!" * 60)
+        return None
+    elapsed = time.perf_counter() - started
+    unmatched = summary.get("unmatched") or []
+    print(f"[server] {summary.get('picks', 0)} pick(s) scored: {summary.get('matched', 0)} matched, "
+          f"{summary.get('no_pick', 0)} no pick ({summary.get('no_pick_inserted', 0)} inserted), "
+          f"{len(unmatched)} unmatched; {summary.get('written', 0)} written in {elapsed:.2f}s")
+    for name in unmatched:
+        print(f"  - '{name}' NOT FOUND on leaderboard (normalized: '{normalize_name(name)}')")
+    changes = summary.get("changes") or []
+    print(f"\nChange set: {len(changes)} pick(s) differ from what's stored")
+    for change in changes:
+        diff = "; ".join(
+            f"{col} {change[col][0]!r} -> {change[col][1]!r}"
+            for col in ("winnings", "penalty_amount", "penalty_reason")
+            if change[col][0] != change[col][1]
+        )
+        print(f"  {change.get('pick_id')} {change.get('golfer_name') or 'No pick'}: {diff}")
+    return summary
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
-def update_results(dry_run=True, mark_complete=False, force=False):
+def update_results(dry_run=True, mark_complete=False, force=False, org_ids=None, server=False):
     """Update tournament results across all leagues.
 
     Returns True on a clean outcome — an off week with nothing to score, a
@@ -275,6 +497,9 @@ def update_results(dry_run=True, mark_complete=False, force=False):
     as a RED GitHub Actions run (with a failure notification) instead of a
     green check that hides the problem. An off week stays green — there was
     genuinely nothing to do.
+
+    ``server=True`` keeps the gates up to the $0 check here but scores the
+    picks in Postgres (score_on_server) instead of on the runner.
     """
     print("=" * 50)
     print("Golf League Results Updater (Slash Golf)")
@@ -286,16 +511,28 @@ def update_results(dry_run=True, mark_complete=False, force=False):
     print(f"Loaded settings for {len(all_league_settings)} league(s)")
 
     # Decide which week to score from OUR schedule.
-    tournament = get_tournament_to_update(supabase)
+    tournament = get_tournament_to_update(supabase, org_ids)
     if not tournament:
         print("\nNo ended, incomplete tournament to score right now. Nothing to do.")
         return True  # genuine off week — a clean (green) outcome, not a failure
 
+    target = resolve_target(tournament, org_ids)
+    if target is None:
+        return False  # an ended tournament went unscored — fail loudly
+    results = fetch_results(tournament, target)
+    return score_tournament(
+        supabase, tournament, results, all_league_settings,
+        dry_run=dry_run, mark_complete=mark_complete, force=force, server=server,
+    )
+
+
+def resolve_target(tournament, org_ids=None):
+    """Map a DB tournament onto its Slash Golf event: ``(year, org_id,
+    tourn_id)``, or None (after saying so loudly) when it can't be mapped."""
     year = tournament_season_year(tournament)
     print(f"\n[tournament] Target from schedule: '{tournament['name']}' (Week {tournament['week']}, season {year})")
 
-    # Map our tournament onto a Slash Golf event.
-    tourn_id = resolve_tourn_id(tournament, year)
+    tourn_id = resolve_tourn_id(tournament, year, org_ids)
     if not tourn_id:
         print("\n" + "!" * 60)
         print("COULD NOT MAP THIS TOURNAMENT TO A SLASH GOLF EVENT.")
@@ -303,14 +540,41 @@ def update_results(dry_run=True, mark_complete=False, force=False):
         print("Set tournaments.slashgolf_tourn_id (run sync_schedule.py), or enter")
         print("results manually via CommissionerTab.")
         print("!" * 60)
-        return False  # an ended tournament went unscored — fail loudly
-
-    # Fetch + parse the leaderboard and earnings.
-    print(f"[tournament] Slash Golf tournId={tourn_id}, orgId={ORG_ID}, year={year}")
-    results = slashgolf.get_tournament_results(tourn_id, year, ORG_ID, tournament_name=tournament["name"])
+        return None
+    org_id = tournament_org_id(tournament)
+    print(f"[tournament] Slash Golf tournId={tourn_id}, orgId={org_id}, year={year}")
+    return year, org_id, tourn_id
+
+
+def fetch_results(tournament, target):
+    """Fetch + parse a mapped tournament's leaderboard and earnings."""
+    year, org_id, tourn_id = target
+    return slashgolf.get_tournament_results(tourn_id, year, org_id, tournament_name=tournament["name"])
+
+
+def score_tournament(supabase, tournament, results, all_league_settings, dry_run=True,
+                     mark_complete=False, force=False, server=False, notify=True, stats=None,
+                     owed_only=False):
+    """Gate and score one tournament's parsed ``results`` across all leagues
+    (the body of update_results, shared with the multi-week backfill).
+    Returns update_results' outcome for this week. ``stats``, when given, is
+    filled with ``picks`` (scored) and ``written`` counts.
+
+    Missing picks become 'No Pick' rows on an apply; a dry run scores them
+    in memory without storing them. ``owed_only`` (backfills) skips members
+    who joined after the tournament started."""
+    stats = {} if stats is None else stats
+    stats.update(picks=0, written=0)
     players = results["players"]
+    # Field-wide numbers come from the columnar view (NumPy, so imported here
+    # rather than at module load).
+    from field_frame import FieldFrame
+    frame = FieldFrame.from_players(players)
     print(f"[tournament] Parsed {len(players)} players; "
           f"status={results['event_status']!r} (completed={results['event_completed']})")
+    counts = frame.status_counts()
+    print(f"[tournament] Field: {counts['active']} made the cut, {counts['cut']} cut, "
+          f"{counts['withdrawn']} WD, {counts['disqualified']} DQ; {frame.paid_count()} paid")
     if results["winner_name"]:
         print(f"[tournament] Winner: {results['winner_name']} (playerId={results['winner_player_id']})")
 
@@ -324,9 +588,21 @@ def update_results(dry_run=True, mark_complete=False, force=False):
         print("!" * 60)
         return False  # results due but not final yet — fail loudly so it's re-run
 
+    # Safety gate: rows missing fields scoring reads (playerId, position,
+    # status, ...) mean Slash Golf changed shape under us; scoring them would
+    # quietly miss picks or zero them out.
+    missing_keys = results.get("missing_keys") or []
+    if missing_keys and not force:
+        print("\n" + "!" * 60)
+        print(f"SLASH GOLF LEADERBOARD SCHEMA CHANGED: rows missing {missing_keys}.")
+        print("Scoring would misread the field. Update slashgolf.py's row schema first.")
+        print("Refusing to apply updates. Use --force to override.")
+        print("!" * 60)
+        return False  # payload drifted — fail loudly so someone looks
+
     # Safety gate: a completed tournament always pays prize money. An all-$0
     # field means the payload isn't carrying final results.
-    total_field_winnings = sum((p.get("winnings") or 0) for p in players)
+    total_field_winnings = frame.total_winnings()
     if total_field_winnings <= 0 and not force:
         print("\n" + "!" * 60)
         print("LEADERBOARD HAS $0 EARNINGS ACROSS THE ENTIRE FIELD.")
@@ -337,14 +613,26 @@ def update_results(dry_run=True, mark_complete=False, force=False):
 
     print(f"[tournament] Verified final results for Week {tournament['week']} (field purse ${total_field_winnings:,.0f}).")
 
-    by_id, by_norm = index_players(players)
-
-    picks = get_picks_for_tournament(supabase, tournament["id"])
+    if server:
+        summary = score_on_server(supabase, tournament, players, apply=not dry_run,
+                                  require_match=not force, owed_only=owed_only)
+        if summary is None:
+            return False  # refused (zero matched) or failed — fail loudly
+        stats.update(picks=summary.get("picks", 0), written=summary.get("written", 0))
+        if dry_run:
+            print("\n[DRY RUN] No changes made to database.")
+            return True
+        return finish_apply(supabase, tournament, results, players, mark_complete,
+                            notify=notify and bool(summary.get("written")))
+
+    _, by_norm = index_players(players)
+
+    picks = get_picks_for_tournament(supabase, tournament, insert_missing=not dry_run, owed_only=owed_only)
     print(f"\nFound {len(picks)} picks across all leagues for this tournament")
 
     picks_by_league = {}
-    for pick in picks:
-        picks_by_league.setdefault(pick.get("league_id", "unknown"), []).append(pick)
+    for pick, match in zip(picks, match_picks(picks, players, by_norm, frame)):
+        picks_by_league.setdefault(pick.get("league_id", "unknown"), []).append((pick, match))
 
     updates = []
     matched_count = 0
@@ -362,7 +650,7 @@ def update_results(dry_run=True, mark_complete=False, force=False):
               f"dq=${league_settings.get('dq_penalty', 10)}")
         print(f"{'─' * 50}")
 
-        for pick in league_picks:
+        for pick, result in league_picks:
             golfer_name = pick.get("golfer_name")
             user_name = pick.get("user_info", {}).get("name", "Unknown User")
 
@@ -386,7 +674,6 @@ def update_results(dry_run=True, mark_complete=False, force=False):
                     })
                 continue
 
-            result = match_pick_to_player(pick, by_id, by_norm)
             if result:
                 matched_count += 1
                 winnings = result.get("winnings", 0) or 0
@@ -407,7 +694,7 @@ def update_results(dry_run=True, mark_complete=False, force=False):
                     "pick_id": pick["id"], "user": user_name, "league_id": league_id,
                     "golfer": golfer_name, "position": result["position"], "score": result["score"],
                     "winnings": winnings, "penalty": penalty, "penalty_reason": penalty_reason,
-                    "preserved": existing_penalty > 0 and existing_reason is not None,
+                    "preserved": existing_penalty > 0 and bool(existing_reason),
                 })
             else:
                 unmatched_count += 1
@@ -433,6 +720,18 @@ def update_results(dry_run=True, mark_complete=False, force=False):
             status += f" [ERROR: {update['error']}]"
         print(f"  {update['user']}: {update.get('golfer', 'No pick')} = {status}")
 
+    # Diff against what's stored, so a rerun (manual, --force, after a
+    # commissioner correction) only rewrites the picks that actually moved.
+    # A dry run's in-memory No Picks have no stored row to diff or write.
+    stored = {p["id"]: p for p in picks if p.get("id")}
+    scored = [u for u in updates if not u.get("error")]
+    changed = [(u, c) for u in scored if u["pick_id"] in stored and (c := pick_changes(u, stored[u["pick_id"]]))]
+    print_change_set(changed, len(scored))
+    unstored = sum(1 for u in scored if u["pick_id"] not in stored)
+    if unstored:
+        print(f"  + {unstored} 'No Pick' penalty(ies) scored in memory only (no row to write)")
+    stats["picks"] = len(scored)
+
     total_real_picks = matched_count + unmatched_count
     print("\n" + "=" * 50)
     print(f"Matched {matched_count}/{total_real_picks} real picks")
@@ -440,11 +739,19 @@ def update_results(dry_run=True, mark_complete=False, force=False):
 
     if unmatched_names:
         print(f"\nUnmatched picks ({len(unmatched_names)}):")
+        suggester = NameSuggester(by_norm)
         for name in unmatched_names:
             print(f"  - '{name}' (normalized: '{normalize_name(name)}')")
+            suggestions = suggester.suggest(name)
+            if suggestions:
+                print("      did you mean: " + ", ".join(
+                    f"{p.get('player_name')} (playerId {p.get('player_id') or '?'}, {similarity:.2f})"
+                    for p, similarity in suggestions
+                ))
         print("\nThese are individual misses (typically a legacy free-text pick with no")
         print("golfer_id whose name doesn't exactly match the field). Fix the pick's")
-        print("golfer, or enter its result manually via CommissionerTab.")
+        print("golfer, or enter its result manually via CommissionerTab. Suggestions")
+        print("are a hint only; they were not applied.")
 
     # Minimal, non-tunable sanity guard: a total wipeout means the wrong event
     # or a bad mapping, not individual misses. (Exact-join scoring makes the
@@ -463,15 +770,23 @@ def update_results(dry_run=True, mark_complete=False, force=False):
         print("Run with --apply --complete to also mark tournament as completed.")
         return True  # preview only — reaching here means the gates passed
 
-    print("\nApplying updates to database...")
-    for update in updates:
-        if not update.get("error"):
-            update_pick_winnings(
-                supabase, update["pick_id"], update["winnings"],
-                update.get("penalty", 0), update.get("penalty_reason"),
-            )
-    print("Results updated!")
-
+    if changed:
+        print("\nApplying updates to database...")
+        started = time.perf_counter()
+        written = write_pick_winnings(supabase, [u for u, _ in changed])
+        stats["written"] = written
+        elapsed = time.perf_counter() - started
+        print(f"Results updated! {written} pick(s) in {elapsed:.2f}s "
+              f"({written / elapsed if elapsed > 0 else 0:,.0f} rows/s)")
+    else:
+        print("\nStored results already match; no picks to write.")
+    return finish_apply(supabase, tournament, results, players, mark_complete, notify=notify and bool(changed))
+
+
+def finish_apply(supabase, tournament, results, players, mark_complete, notify=True):
+    """Everything after the picks are written: the winner badge, golfer_id
+    backfill, the push notification (skipped when a rerun changed nothing)
+    and (with --complete) closing the week."""
     # Record the tournament winner (drives the trophy badge; previously this
     # was only ever entered by hand).
     if results["winner_name"]:
@@ -483,16 +798,19 @@ def update_results(dry_run=True, mark_complete=False, force=False):
     backfill_available_golfer_ids(supabase, players)
 
     # Send push notifications.
-    try:
-        from send_notification import send_to_all
-        send_to_all(
-            title=f"Results: {tournament['name']}",
-            body=f"Week {tournament['week']} results have been posted!",
-            url="/",
-            tag=f"results-week-{tournament['week']}",
-        )
-    except Exception as exc:
-        print(f"  Push notifications skipped: {exc}")
+    if not notify:
+        print("No pick changed; skipping the results notification.")
+    else:
+        try:
+            from send_notification import send_to_all
+            send_to_all(
+                title=f"Results: {tournament['name']}",
+                body=f"Week {tournament['week']} results have been posted!",
+                url="/",
+                tag=f"results-week-{tournament['week']}",
+            )
+        except Exception as exc:
+            print(f"  Push notifications skipped: {exc}")
 
     if mark_complete:
         print(f"Marking tournament '{tournament['name']}' as completed...")
@@ -503,18 +821,179 @@ def update_results(dry_run=True, mark_complete=False, force=False):
     return True
 
 
+# ---------------------------------------------------------------------------
+# Multi-week backfill / rescore (--season / --range)
+# ---------------------------------------------------------------------------
+def parse_week_range(raw):
+    """``--range`` value: '5-12' -> (5, 12), '7' -> (7, 7)."""
+    lo, _, hi = raw.partition("-")
+    lo = int(lo)
+    hi = int(hi) if hi else lo
+    if hi < lo:
+        raise ValueError(f"--range {raw!r}: end week is before start week")
+    return lo, hi
+
+
+def get_backfill_tournaments(supabase, season, weeks=None, org_ids=None, now=None):
+    """Every ended tournament of ``season`` (optionally only the inclusive
+    ``weeks`` range) on one of ``org_ids``, oldest week first. Completed weeks
+    are included: a backfill catches up missed weeks, a rescore redoes
+    finished ones, and diff-only writes make re-scoring a settled week free."""
+    org_ids = org_ids or slashgolf.ORG_IDS
+    now = now or datetime.now(timezone.utc)
+    rows = paginate(lambda: supabase.table("tournaments").select("*").order("week"))
+    selected = []
+    for t in map(tournament_record, rows):
+        if tournament_org_id(t) not in org_ids or t.season != int(season) or not t.ended(now):
+            continue
+        if weeks and not weeks[0] <= (t.get("week") or 0) <= weeks[1]:
+            continue
+        selected.append(t)
+    return selected
+
+
+def _call_or_error(fn, *args):
+    """``fn(*args)``, but a budget refusal or a failure (429, HTTP error, bad
+    payload) comes back as the value instead of raising, so one bad week
+    doesn't discard the weeks fetched with it."""
+    try:
+        return fn(*args)
+    except Exception as exc:
+        return exc
+
+
+def backfill_results(season, weeks=None, dry_run=True, mark_complete=False, force=False,
+                     org_ids=None, server=False):
+    """Score every ended week of a season (or a week range) in one run.
+
+    Targets come from our schedule in one query and are mapped through the
+    season's schedule index (loaded once per tour and season). Every week's
+    leaderboard and earnings then go out as one flat batch (bounded by
+    slashgolf.MAX_CONCURRENCY, metered by the one budget — Official weeks are
+    permanent cache hits, so rescoring a fetched season costs no API calls).
+    Each week then goes through the same gates and bulk, diff-only writes as
+    the Monday run, except that members who joined after a week started
+    aren't charged a 'No Pick' for it and no notifications are sent. A week
+    that can't be mapped, or whose mapping or fetch is deferred or fails, is
+    reported and skipped. Returns True only if every week scored.
+    """
+    print("=" * 50)
+    print(f"Golf League Results Backfill (season {season}"
+          + (f", weeks {weeks[0]}-{weeks[1]})" if weeks else ")"))
+    print("=" * 50)
+
+    supabase = get_supabase_client()
+    all_league_settings = get_all_league_settings(supabase)
+    print(f"Loaded settings for {len(all_league_settings)} league(s)")
+
+    tournaments = get_backfill_tournaments(supabase, season, weeks, org_ids)
+    if not tournaments:
+        print("\nNo ended tournaments in that range. Nothing to do.")
+        return True
+    print(f"{len(tournaments)} week(s) to score: " + ", ".join(str(t.get("week")) for t in tournaments))
+
+    targets = [_call_or_error(resolve_target, t, org_ids) for t in tournaments]
+    mapped = [target for target in targets if target and not isinstance(target, Exception)]
+
+    # Leaderboard and earnings for every week in one batch: nesting
+    # get_tournament_results' own pair of threads inside a per-week pool
+    # would run more than MAX_CONCURRENCY requests at once.
+    started = time.perf_counter()
+    payloads = iter(slashgolf.fetch_concurrently([
+        (_call_or_error, (fetch, tourn_id, year, org_id))
+        for year, org_id, tourn_id in mapped
+        for fetch in (slashgolf.fetch_leaderboard, slashgolf.fetch_earnings)
+    ]))
+    print(f"\n[backfill] Fetched {len(mapped)} week(s) in {time.perf_counter() - started:.2f}s")
+
+    ok = True
+    report = []
+    for t, target in zip(tournaments, targets):
+        print(f"\n{'#' * 60}\n# Week {t.get('week')}: {t['name']}\n{'#' * 60}")
+        if target is None:
+            ok = False
+            report.append((t, "unmapped", 0, 0, 0.0))
+            continue
+        if isinstance(target, Exception):
+            results = target
+        else:
+            year, org_id, tourn_id = target
+            leaderboard, earnings = next(payloads), next(payloads)
+            results = next((p for p in (leaderboard, earnings) if isinstance(p, Exception)), None)
+            if results is None:
+                results = _call_or_error(slashgolf.tournament_results, leaderboard, earnings,
+                                         tourn_id, year, org_id, t["name"])
+        if isinstance(results, slashgolf.BudgetDeferred):
+            print(f"Deferred: {results}")
+            ok = False
+            report.append((t, "deferred", 0, 0, 0.0))
+            continue
+        if isinstance(results, Exception):
+            print(f"Fetch failed: {type(results).__name__}: {results}")
+            ok = False
+            report.append((t, "error", 0, 0, 0.0))
+            continue
+        stats = {}
+        week_started = time.perf_counter()
+        week_ok = score_tournament(
+            supabase, t, results, all_league_settings, dry_run=dry_run,
+            mark_complete=mark_complete, force=force, server=server, notify=False, stats=stats,
+            owed_only=True,
+        )
+        ok = ok and week_ok
+        report.append((t, "ok" if week_ok else "FAILED", stats["picks"], stats["written"],
+                       time.perf_counter() - week_started))
+
+    print(f"\n{'=' * 60}\nBackfill throughput:\n{'=' * 60}")
+    for t, outcome, picks, written, elapsed in report:
+        rate = f"{picks / elapsed:,.0f} picks/s" if elapsed > 0 else "-"
+        print(f"  Week {t.get('week'):>2}  {t['name'][:32]:<32} {outcome:<8} "
+              f"{picks:>4} scored {written:>4} written  {elapsed:6.2f}s  {rate}")
+    total_picks = sum(r[2] for r in report)
+    total_time = time.perf_counter() - started
+    print(f"  {len(report)} week(s), {total_picks} pick(s) in {total_time:.2f}s"
+          + (f" ({total_picks / total_time:,.0f} picks/s)" if total_time > 0 else ""))
+    if dry_run:
+        print("\n[DRY RUN] No changes made to database. Re-run with --apply to write.")
+    return ok
+
+
 if __name__ == "__main__":
     dry_run = "--apply" not in sys.argv
     mark_complete = "--complete" in sys.argv
     force = "--force" in sys.argv
+    season = sys.argv[sys.argv.index("--season") + 1] if "--season" in sys.argv else None
+    weeks = parse_week_range(sys.argv[sys.argv.index("--range") + 1]) if "--range" in sys.argv else None
+    backfill = season is not None or weeks is not None
+    if "--no-cache" in sys.argv:
+        slashgolf.disable_cache()
+    # A backfill is never urgent: it runs at low priority so it can't eat the
+    # quota the Monday scorer and live board rely on.
+    slashgolf.set_budget(api_budget.Budget(
+        "update_results_backfill" if backfill else "update_results", "low" if backfill else "scoring",
+    ))
 
     if dry_run:
         print("Running in DRY RUN mode (no database changes)")
         print("Use --apply to update the database")
         print("Use --apply --complete to also mark tournament as completed")
-        print("Use --force to override the safety gates\n")
-
-    ok = update_results(dry_run=dry_run, mark_complete=mark_complete, force=force)
+        print("Use --force to override the safety gates")
+        print("Use --no-cache to refetch from Slash Golf instead of the response cache")
+        print("Use --orgs 1,2 to score tournaments on other tours (default: ORG_IDS)")
+        print("Use --server to score in Postgres (needs create-score-tournament.sql)")
+        print("Use --season 2026 [--range 5-12] to backfill/rescore every ended week\n")
+
+    if backfill:
+        ok = backfill_results(
+            season or str(datetime.now(timezone.utc).year), weeks,
+            dry_run=dry_run, mark_complete=mark_complete, force=force,
+            org_ids=slashgolf.org_ids_from_args(sys.argv), server="--server" in sys.argv,
+        )
+    else:
+        ok = update_results(
+            dry_run=dry_run, mark_complete=mark_complete, force=force,
+            org_ids=slashgolf.org_ids_from_args(sys.argv), server="--server" in sys.argv,
+        )
     if not ok:
         # An ended tournament was due to be scored but the run couldn't apply
         # it. Exit non-zero so the scheduled GitHub Actions run goes red and
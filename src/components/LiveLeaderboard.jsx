@@ -1,6 +1,6 @@
 import React from 'react';
 import { Activity, ChevronDown, ChevronRight, Clock, Trophy } from 'lucide-react';
-import { lookupLive, positionRank, formatUpdatedLabel, isOutStatus, isThruFinished, outLabel, normalizeName } from '../utils/liveLeaderboard';
+import { lookupLive, playerRank, formatUpdatedLabel, isOutStatus, isThruFinished, outLabel, normalizeName } from '../utils/liveLeaderboard';
 import PlayerAvatar from './PlayerAvatar';
 
 // Color a to-par score: under par green, over par slate, even neutral.
@@ -64,7 +64,7 @@ const LiveLeaderboard = React.memo(function LiveLeaderboard({
   const pickedRows = members
     .filter((m) => m.golferName)
     .map((m) => ({ ...m, live: lookupLive(index, { golferId: m.golferId, golferName: m.golferName }) }))
-    .sort((a, b) => (a.live ? positionRank(a.live.position) : Infinity) - (b.live ? positionRank(b.live.position) : Infinity));
+    .sort((a, b) => playerRank(a.live) - playerRank(b.live));
 
   // Members who never submitted a pick — shown last so it's clear who's missing.
   const noPickRows = members.filter((m) => !m.golferName);
@@ -73,7 +73,7 @@ const LiveLeaderboard = React.memo(function LiveLeaderboard({
   // Normalized names of league picks, to highlight them in the full field.
   const pickedNorms = new Set(pickedRows.map((m) => normalizeName(m.golferName)));
 
-  const fieldSorted = [...index.players].sort((a, b) => positionRank(a.position) - positionRank(b.position));
+  const fieldSorted = [...index.players].sort((a, b) => playerRank(a) - playerRank(b));
 
   return (
     <div className="card p-4 sm:p-5">
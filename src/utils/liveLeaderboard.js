@@ -20,7 +20,9 @@ export function normalizeName(name) {
 }
 
 // Sortable rank from a Slash Golf position string. 'T4' -> 4, '1' -> 1;
-// non-finishers sort to the bottom in a sensible order.
+// non-finishers sort to the bottom in a sensible order. Mirrors
+// scripts/slashgolf.py decode_position; only needed for snapshots written
+// before the ingest started storing `rank` (see playerRank).
 export function positionRank(position) {
   const pos = String(position || '').trim().toUpperCase();
   if (pos === 'CUT' || pos === 'MDF') return 9000;
@@ -31,6 +33,13 @@ export function positionRank(position) {
   return 8000; // unknown / no position yet
 }
 
+// Sort rank for a live row: the `rank` the ingest decoded and stored with the
+// snapshot, falling back to parsing the position string for older snapshots.
+export function playerRank(row) {
+  if (!row) return Infinity;
+  return Number.isFinite(row.rank) ? row.rank : positionRank(row.position);
+}
+
 // True when a thru value means the round is done. Slash Golf reports 'F' for
 // a finished round and 'F*' when the player finished after a back-nine start.
 export function isThruFinished(thru) {